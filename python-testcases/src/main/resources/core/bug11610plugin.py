@@ -17,8 +17,54 @@ log = LitpLogger()
 import time
 import socket
 import subprocess
+import select
 import os
 
+PING_PATH = '/bin/ping'
+PING_INTERVAL = 0.2
+# node1 is taken as down once it has not answered a ping for this long
+DOWN_AFTER = 1.0
+
+
+def wait_for_host_down(host, timeout):
+    """
+    Run a single ping of the host and watch its replies, rather than a
+    new ping every few seconds. Return True once the host has not
+    answered for DOWN_AFTER seconds, False if it still answers after
+    timeout seconds
+    """
+    ping = subprocess.Popen(
+        [PING_PATH, '-n', '-i', str(PING_INTERVAL),
+         socket.gethostbyname(host)],
+        stdout=subprocess.PIPE, stderr=open(os.devnull, 'w'))
+    try:
+        deadline = time.time() + timeout
+        last_reply = time.time()
+        pending = ''
+        while True:
+            now = time.time()
+            if now - last_reply >= DOWN_AFTER:
+                return True
+            if now >= deadline:
+                return False
+            wait = min(last_reply + DOWN_AFTER, deadline) - now
+            readable, _, _ = select.select([ping.stdout], [], [], wait)
+            if not readable:
+                continue
+            data = os.read(ping.stdout.fileno(), 4096)
+            if not data:
+                # ping has exited, no more replies can come
+                time.sleep(wait)
+                continue
+            lines = (pending + data).split('\n')
+            pending = lines.pop()
+            if any(' bytes from ' in line for line in lines):
+                last_reply = time.time()
+    finally:
+        if ping.poll() is None:
+            ping.kill()
+        ping.wait()
+
 
 class Bug11610Plugin(Plugin):
     """
@@ -50,20 +96,8 @@ class Bug11610Plugin(Plugin):
         return tasks
 
     def cb_wait_callback(self, plugin_api_context):
-        node1_ip = socket.gethostbyname('node1')
-
         timeout = 30
-        elapsed_time = 0
-        start_time = int(time.time())
-        iteration_interval = 2
 
-        while True:
-            ret = subprocess.call('ping -c 2 ' + str(node1_ip), shell=True)
-            if ret != 0:
-                break
-            elapsed_time = int(time.time()) - start_time
-            if elapsed_time > timeout:
-                print 'Callback task timeout while waiting for node1 ' \
-                    'to shutdown'
-                break
-            time.sleep(iteration_interval)
+        if not wait_for_host_down('node1', timeout):
+            log.trace.info('Callback task timeout while waiting for node1 '
+                           'to shutdown')
@@ -0,0 +1,245 @@
+"""
+COPYRIGHT Ericsson 2026
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     October 2026
+@author:    LITP Core Testware
+@summary:   Bulk model population.
+            Items to create or inherit are collected and then applied with
+            one generated XML "litp load --merge" per target collection,
+            instead of one "litp create" or "litp inherit" per item. The
+            created items are removed in batches on cleanup.
+"""
+from collections import OrderedDict
+from xml.sax.saxutils import escape, quoteattr
+import shlex
+import uuid
+from model_snapshot import parse_show_output, LITP_PATH
+
+XML_HEADER = "<?xml version='1.0' encoding='utf-8'?>"
+XML_NAMESPACES = ('xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance" '
+                  'xmlns:litp="http://www.ericsson.com/litp" '
+                  'xsi:schemaLocation="http://www.ericsson.com/litp '
+                  'litp-xml-schema/litp.xsd"')
+XML_DIR = '/tmp'
+# Commands run per round trip, to keep each command line well below the
+# argument size limit of the shell
+BATCH_SIZE = 50
+# Prints the path of an item that could not be removed and still exists
+REMOVE_CMD = ('{0} remove -p {1} > /dev/null 2>&1 || '
+              '! {0} show -p {1} > /dev/null 2>&1 || /bin/echo {1}')
+
+
+def parse_props(props):
+    """
+    Description:
+        Convert properties given as for execute_cli_create_cmd(), e.g.
+        'name="771 story124437" action=accept', to a dict
+    Args:
+        props (str|dict): The properties
+    Return:
+        OrderedDict, The property values keyed by name
+    """
+    if not props:
+        return OrderedDict()
+    if isinstance(props, dict):
+        return OrderedDict(props)
+    return OrderedDict(token.split('=', 1) for token in shlex.split(props))
+
+
+def split_url(url):
+    """ Return the parent path and the id of an item path """
+    parent, _, item_id = url.rstrip('/').rpartition('/')
+    return parent, item_id
+
+
+def batches(values, size=BATCH_SIZE):
+    """ Return the values in lists of at most size values """
+    return [values[index:index + size]
+            for index in range(0, len(values), size)]
+
+
+class BulkModelBuilder(object):
+    """
+    Collects item creations and inheritances and applies them with one
+    "litp load --merge" per collection.
+
+    Items are given as for the execute_cli_create_cmd() and
+    execute_cli_inherit_cmd() helpers. The collections the items go into
+    must already exist.
+    """
+
+    def __init__(self, test, node):
+        """
+        Args:
+            test (GenericTest): The test used to run the commands
+            node (str): The MS filename
+        """
+        self.test = test
+        self.node = node
+        self._pending = OrderedDict()
+        self._cleanup = []
+        self.load_count = 0
+
+    def add_create(self, url, item_type, props=None, add_to_cleanup=True):
+        """
+        Description:
+            Queue the creation of an item
+        Args:
+            url (str): The path of the item
+            item_type (str): The item type
+            props (str|dict): The properties of the item
+            add_to_cleanup (bool): Remove the item on cleanup()
+        """
+        self._queue(url, {'type': item_type,
+                          'props': parse_props(props),
+                          'source_path': None,
+                          'cleanup': add_to_cleanup})
+
+    def add_inherit(self, url, source_path, source_type, props=None,
+                    add_to_cleanup=True):
+        """
+        Description:
+            Queue the inheritance of an item
+        Args:
+            url (str): The path of the inherited item
+            source_path (str): The path of the source item
+            source_type (str): The item type of the source item
+            props (str|dict): Properties overwritten in the inherited item
+            add_to_cleanup (bool): Remove the item on cleanup()
+        """
+        self._queue(url, {'type': '{0}-inherit'.format(source_type),
+                          'props': parse_props(props),
+                          'source_path': source_path,
+                          'cleanup': add_to_cleanup})
+
+    def add_items(self, items):
+        """
+        Description:
+            Queue the creation of items given as dicts with the 'url',
+            'type' and optional 'props' and 'cleanup' keys
+        Args:
+            items (list): The item dicts
+        """
+        for item in items:
+            self.add_create(item['url'], item['type'], item.get('props'),
+                            item.get('cleanup', True))
+
+    def _queue(self, url, item):
+        """ Queue an item under the collection it goes into """
+        collection, item_id = split_url(url)
+        item['id'] = item_id
+        item['url'] = url
+        self._pending.setdefault(collection, []).append(item)
+
+    def _get_item_types(self, paths):
+        """ Return the item type of each path, one round trip per batch """
+        types = {}
+        for batch in batches(list(paths)):
+            cmd = ' && '.join('{0} show -p {1}'.format(LITP_PATH, path)
+                              for path in batch)
+            stdout, stderr, rcode = self.test.run_command(self.node, cmd,
+                                                          logging=False)
+            self.test.assertEqual(0, rcode, '\n'.join(stderr))
+            items = parse_show_output(stdout)
+            types.update((path, items[path].type) for path in batch)
+        return types
+
+    @staticmethod
+    def _item_xml(item):
+        """ Return the XML lines of one item """
+        attributes = 'id={0}'.format(quoteattr(item['id']))
+        if item['source_path']:
+            attributes = 'source_path={0} {1}'.format(
+                quoteattr(item['source_path']), attributes)
+        if not item['props']:
+            return ['  <litp:{0} {1}/>'.format(item['type'], attributes)]
+        lines = ['  <litp:{0} {1}>'.format(item['type'], attributes)]
+        for name, value in item['props'].items():
+            lines.append('    <{0}>{1}</{0}>'.format(name, escape(value)))
+        lines.append('  </litp:{0}>'.format(item['type']))
+        return lines
+
+    def generate_xml(self, collection, parent_type, items):
+        """
+        Description:
+            Generate the XML of a collection holding the given items
+        Args:
+            collection (str): The path of the collection
+            parent_type (str): The item type of the collection parent
+            items (list): The queued items of the collection
+        Return:
+            list, The XML lines
+        """
+        _, collection_id = split_url(collection)
+        tag = 'litp:{0}-{1}-collection'.format(parent_type, collection_id)
+        lines = [XML_HEADER,
+                 '<{0} {1} id={2}>'.format(tag, XML_NAMESPACES,
+                                           quoteattr(collection_id))]
+        for item in items:
+            lines.extend(self._item_xml(item))
+        lines.append('</{0}>'.format(tag))
+        return lines
+
+    def apply(self, expect_positive=True):
+        """
+        Description:
+            Load the queued items, one "litp load --merge" per collection
+        Args:
+            expect_positive (bool): Assert that the loads succeed
+        Return:
+            list, The (stdout, stderr, rc) of each load
+        """
+        if not self._pending:
+            return []
+        parents = OrderedDict((split_url(collection)[0], None)
+                              for collection in self._pending)
+        parent_types = self._get_item_types(parents.keys())
+
+        results = []
+        for collection, items in self._pending.items():
+            parent = split_url(collection)[0]
+            xml_file = '{0}/bulk_model_{1}.xml'.format(XML_DIR,
+                                                       uuid.uuid4().hex)
+            self.test.create_file_on_node(
+                self.node, xml_file,
+                self.generate_xml(collection, parent_types[parent], items),
+                add_to_cleanup=False)
+            results.append(self.test.execute_cli_load_cmd(
+                self.node, parent, xml_file, '--merge',
+                expect_positive=expect_positive))
+            self.test.run_command(self.node,
+                                  '/bin/rm -f {0}'.format(xml_file))
+            self.load_count += 1
+            self._cleanup.extend(item['url'] for item in items
+                                 if item['cleanup'])
+        self._pending = OrderedDict()
+        return results
+
+    def cleanup(self):
+        """
+        Description:
+            Remove the items applied with add_to_cleanup set, one round trip
+            per batch of items. Items that no longer exist are ignored.
+            The items that could not be removed are logged as errors, and
+            not asserted on so that the rest of a tearDown still runs
+        Return:
+            list, The items, or the errors of the batches, not removed
+        """
+        failed = []
+        for batch in batches(list(reversed(self._cleanup))):
+            cmd = '; '.join(REMOVE_CMD.format(LITP_PATH, url)
+                            for url in batch)
+            stdout, stderr, rcode = self.test.run_command(self.node, cmd,
+                                                          logging=False)
+            if rcode != 0:
+                failed.extend(stderr or batch)
+            failed.extend(line for line in stdout if line)
+        self._cleanup = []
+        for item in failed:
+            self.test.log('error', 'Item not removed: {0}'.format(item))
+        return failed
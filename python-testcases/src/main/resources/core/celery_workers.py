@@ -0,0 +1,87 @@
+"""
+COPYRIGHT Ericsson 2026
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     October 2026
+@author:    LITP Core Testware
+@summary:   Celery worker settings of the MS.
+            Sets the concurrency and the scheduling of the litpTask worker,
+            which caps how many plan tasks run at the same time, in the
+            CELERYD_OPTS of the Celery configuration, and puts the original
+            configuration back.
+"""
+import re
+
+CELERY_SERVICE = 'celery.service'
+CELERY_CONF_FILE = '/etc/sysconfig/celery'
+CELERY_CONF_BACKUP = '/tmp/celery.sysconfig.orig'
+CELERYD_OPTS_REGEX = re.compile(r'^CELERYD_OPTS="(.*)"$')
+# The worker options set here, removed before a new setting
+WORKER_OPTS_REGEX = re.compile(r'\s*(-c:litpTask\s+\d+|-Ofair)')
+
+
+class CeleryWorkers(object):
+    """
+    litpTask worker settings of the MS, restored on cleanup
+    """
+
+    def __init__(self, test, node):
+        """
+        Args:
+            test (GenericTest): The test used to run commands
+            node (str): The MS filename
+        """
+        self.test = test
+        self.node = node
+        self._saved = False
+
+    def restart(self):
+        """ Restart the Celery workers so that their settings take effect """
+        self.test.stop_service(self.node, CELERY_SERVICE)
+        self.test.start_service(self.node, CELERY_SERVICE)
+
+    def set_options(self, concurrency, fair=False):
+        """
+        Description:
+            Set the concurrency and the scheduling of the litpTask worker in
+            the CELERYD_OPTS of the Celery configuration and restart Celery.
+            The configuration is saved first, to be put back by cleanup()
+        Args:
+            concurrency (int): The number of litpTask worker processes
+            fair (bool): Send tasks only to idle worker processes
+        """
+        if not self._saved:
+            self.test.run_command(self.node, '/bin/cp -p {0} {1}'.format(
+                CELERY_CONF_FILE, CELERY_CONF_BACKUP), su_root=True,
+                default_asserts=True)
+            self._saved = True
+        lines = self.test.get_file_contents(self.node, CELERY_CONF_FILE,
+                                            su_root=True)
+        opts_lines = [line for line in lines
+                      if CELERYD_OPTS_REGEX.match(line)]
+        self.test.assertEqual(1, len(opts_lines),
+                              'Expected one CELERYD_OPTS in {0}'
+                              .format(CELERY_CONF_FILE))
+        opts = WORKER_OPTS_REGEX.sub(
+            '', CELERYD_OPTS_REGEX.match(opts_lines[0]).group(1))
+        opts += ' -c:litpTask {0}'.format(concurrency)
+        if fair:
+            opts += ' -Ofair'
+        # The options hold paths, so "|" delimits the sed expression
+        cmd = "/bin/sed -i 's|^CELERYD_OPTS=.*|CELERYD_OPTS=\"{0}\"|' {1}" \
+              .format(opts.strip(), CELERY_CONF_FILE)
+        self.test.run_command(self.node, cmd, su_root=True,
+                              default_asserts=True)
+        self.restart()
+
+    def cleanup(self):
+        """ Put the original Celery configuration back and restart Celery """
+        if self._saved:
+            self.test.run_command(self.node, '/bin/mv -f {0} {1}'.format(
+                CELERY_CONF_BACKUP, CELERY_CONF_FILE), su_root=True)
+            self.restart()
+            self._saved = False
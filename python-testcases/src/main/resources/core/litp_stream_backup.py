@@ -0,0 +1,959 @@
+##############################################################################
+# COPYRIGHT Ericsson AB 2026
+#
+# The copyright to the computer program(s) herein is the property of
+# Ericsson AB. The programs may be used and/or copied only with written
+# permission from Ericsson AB. or in accordance with the terms and
+# conditions stipulated in the agreement/contract under which the
+# program(s) have been supplied.
+##############################################################################
+'''Streaming LITP state backup with a per-member checksum manifest
+
+The LITP DB dump and the puppet manifests are written to a single gzipped
+tar stream. The SHA-256 of every member is computed while the member is
+written and stored in a META-INF/SHA256SUMS member at the end of the
+archive, and the SHA-256 of the compressed archive is stored next to it in
+a <archive>.sha256 file, both in sha256sum format. The archive only gets
+its final name once it is complete.
+
+Incremental backups form a chain of a base archive and deltas. The DB is
+dumped in the pg_dump directory format, one data file per table, with the
+rows of each table sorted. A delta holds the manifests and table files
+that changed since its parent, a table file as the rows removed and added
+when the previous version is in the state cache of the backup directory.
+Every link records the digest of its parent and, in META-INF/STATE, the
+digests of the whole state it restores, so a restore replays the chain
+and checks the state after each link. With --apply the DB of a full
+backup is loaded while the rest of the archive is extracted, and the
+manifests are put in place while the DB loads.
+
+Usage:
+    litp_stream_backup.py backup <dir> [--threads N] [--incremental]
+    litp_stream_backup.py verify <archive> [--quick]
+    litp_stream_backup.py latest <dir> [--valid]
+    litp_stream_backup.py restore <archive> <dir> [--apply [--jobs N]]
+
+Each command prints its result as a JSON object. verify and restore exit
+with 1 if an archive is corrupt.
+'''
+from collections import Counter
+import hashlib
+import json
+import optparse
+import os
+import pwd
+import re
+import shutil
+import subprocess
+import sys
+import tarfile
+import tempfile
+import threading
+import time
+import zlib
+
+ARCHIVE_NAME = 'litp_backup_{0}.tar.gz'
+DELTA_NAME = 'litp_backup_{0}_delta.tar.gz'
+ARCHIVE_REGEX = re.compile(r'^litp_backup_(\d{14})(_delta)?\.tar\.gz$')
+DIGEST_SUFFIX = '.sha256'
+STATE_SUFFIX = '.state'
+MANIFEST_MEMBER = 'META-INF/SHA256SUMS'
+CHAIN_MEMBER = 'META-INF/CHAIN'
+STATE_MEMBER = 'META-INF/STATE'
+DB_MEMBER = 'litp_db.dump'
+DB_DIR_MEMBER = 'litp_db'
+TABLE_SUFFIX = '.dat'
+ROWDIFF_SUFFIX = '.rowdiff'
+CACHE_DIR = '.litp_state_cache'
+WORK_DIR_PREFIX = '.litp_backup.'
+PUPPET_MANIFESTS_DIR = '/opt/ericsson/nms/litp/etc/puppet/manifests/plugins'
+POSTGRES_USER = 'postgres'
+SU_PATH = '/bin/su'
+PG_DUMP_CMD = 'pg_dump -Fc -c -h {0} litp'
+PG_DUMP_DIR_CMD = 'pg_dump -Fd -Z0 -h {0} -f {1} litp'
+PG_RESTORE_CMD = 'pg_restore -c -j {1} -h {0} -d litp {2}'
+PIGZ_PATH = '/usr/bin/pigz'
+CHUNK_SIZE = 1024 * 1024
+MAX_CHAIN = 24
+# The line that ends the COPY data of a table
+END_OF_DATA = '\\.'
+
+
+class BackupError(Exception):
+    '''Raised when a backup cannot be written or does not verify'''
+    pass
+
+
+class HashingWriter(object):
+    '''File object that hashes and counts the bytes written through it'''
+
+    def __init__(self, fileobj):
+        self.fileobj = fileobj
+        self.sha256 = hashlib.sha256()
+        self.count = 0
+
+    def write(self, data):
+        self.sha256.update(data)
+        self.count += len(data)
+        self.fileobj.write(data)
+
+    def close(self):
+        pass
+
+    def abort(self):
+        pass
+
+
+class HashingReader(object):
+    '''File object that hashes and counts the bytes read through it'''
+
+    def __init__(self, fileobj):
+        self.fileobj = fileobj
+        self.sha256 = hashlib.sha256()
+        self.count = 0
+
+    def read(self, size=-1):
+        data = self.fileobj.read(size)
+        self.sha256.update(data)
+        self.count += len(data)
+        return data
+
+
+class PigzSink(object):
+    '''
+    Compress the tar stream with pigz threads and hash the compressed
+    output while it is written to the archive file
+    '''
+
+    def __init__(self, archive, threads):
+        self.output = HashingWriter(archive)
+        self.process = subprocess.Popen(
+            [PIGZ_PATH, '-c', '-p', str(threads)],
+            stdin=subprocess.PIPE, stdout=subprocess.PIPE)
+        self.stdin = self.process.stdin
+        self._copier = threading.Thread(target=self._copy)
+        # A copier left behind must not keep the tool from exiting
+        self._copier.daemon = True
+        self._copier.start()
+
+    def _copy(self):
+        for data in iter(lambda: self.process.stdout.read(CHUNK_SIZE), ''):
+            self.output.write(data)
+
+    def close(self):
+        self.stdin.close()
+        self._copier.join()
+        if self.process.wait() != 0:
+            raise BackupError('pigz exited with {0}'
+                              .format(self.process.returncode))
+
+    def abort(self):
+        '''Stop pigz and the copier after a failed write'''
+        try:
+            self.stdin.close()
+        except IOError:
+            pass
+        if self.process.poll() is None:
+            self.process.kill()
+        self.process.wait()
+        self._copier.join()
+
+
+class _StringReader(object):
+    '''Minimal read() interface over a string'''
+
+    def __init__(self, data):
+        self.data = data
+        self.offset = 0
+
+    def read(self, size=-1):
+        end = len(self.data) if size < 0 else self.offset + size
+        data = self.data[self.offset:end]
+        self.offset += len(data)
+        return data
+
+
+def archive_timestamp(path):
+    '''Return the timestamp in the name of an archive, None if not one'''
+    match = ARCHIVE_REGEX.match(os.path.basename(path))
+    return match.group(1) if match else None
+
+
+def newest_first(paths):
+    '''Return the archives of paths, newest first by name timestamp'''
+    return sorted((path for path in paths if archive_timestamp(path)),
+                  key=archive_timestamp, reverse=True)
+
+
+def _new_archive_path(backup_dir, name_format):
+    '''Return the path of a new archive, named by the current second'''
+    while True:
+        timestamp = time.strftime('%Y%m%d%H%M%S')
+        if not any(os.path.exists(os.path.join(backup_dir, name.format(
+                timestamp))) for name in (ARCHIVE_NAME, DELTA_NAME)):
+            return os.path.join(backup_dir, name_format.format(timestamp))
+        # Archives are named by the second they are started in
+        time.sleep(1)
+
+
+def _format_sums(digests):
+    '''Return digests keyed by name in sha256sum format'''
+    return ''.join('{0}  {1}\n'.format(digests[name], name)
+                   for name in sorted(digests))
+
+
+def _parse_sums(data):
+    '''Return the digests keyed by name of sha256sum format data'''
+    return dict((name, digest) for digest, name in
+                (line.split(None, 1) for line in data.splitlines()))
+
+
+def _read_sums_file(path):
+    '''Return the digests of a sha256sum format file, None if none'''
+    try:
+        with open(path) as sums_file:
+            return _parse_sums(sums_file.read())
+    except (IOError, ValueError):
+        return None
+
+
+def _read_digest_file(archive_path):
+    '''Return the archive digest recorded at backup time, None if none'''
+    digests = _read_sums_file(archive_path + DIGEST_SUFFIX)
+    return digests.get(os.path.basename(archive_path)) if digests else None
+
+
+def _file_digest(path):
+    '''Return the SHA-256 of a file'''
+    sha256 = hashlib.sha256()
+    with open(path, 'rb') as data_file:
+        for data in iter(lambda: data_file.read(CHUNK_SIZE), ''):
+            sha256.update(data)
+    return sha256.hexdigest()
+
+
+def _add_member(tar, name, path, expected_digest=None):
+    '''
+    Add a file to the tar stream, hashing it as it is read.
+    Return its digest and size.
+    '''
+    info = tar.gettarinfo(path, name)
+    with open(path, 'rb') as member_file:
+        reader = HashingReader(member_file)
+        tar.addfile(info, reader)
+    if reader.count != info.size:
+        raise BackupError('{0} changed while it was archived'.format(name))
+    digest = reader.sha256.hexdigest()
+    if expected_digest is not None and digest != expected_digest:
+        raise BackupError('{0} does not match the data dumped'.format(name))
+    return digest, reader.count
+
+
+def _add_data(tar, name, data):
+    '''Add a string to the tar stream and return its digest'''
+    info = tarfile.TarInfo(name)
+    info.size = len(data)
+    info.mtime = int(time.time())
+    tar.addfile(info, _StringReader(data))
+    return hashlib.sha256(data).hexdigest()
+
+
+def _open_stream(archive, threads):
+    '''
+    Open the compressed tar stream of an archive file.
+    Return the tar, the object to close after it, or to abort if the
+    write fails, the hashing writer of the compressed bytes and the name
+    of the compressor.
+    '''
+    if threads > 1 and os.access(PIGZ_PATH, os.X_OK):
+        sink = PigzSink(archive, threads)
+        return (tarfile.open(fileobj=sink.stdin, mode='w|'), sink,
+                sink.output, 'pigz -p {0}'.format(threads))
+    output = HashingWriter(archive)
+    return tarfile.open(fileobj=output, mode='w|gz'), output, output, 'zlib'
+
+
+def _write_archive(archive_path, files, threads, chain=None, state=None):
+    '''
+    Write an archive of the CHAIN member, the files, given as (member
+    name, path, expected digest or None), the STATE member and the
+    SHA256SUMS of all these members, then its digest and state files.
+    Return its statistics.
+    '''
+    partial_path = archive_path + '.part'
+    digests = {}
+    bytes_read = 0
+    try:
+        with open(partial_path, 'wb') as archive:
+            tar, sink, output, compressor = _open_stream(archive, threads)
+            try:
+                if chain is not None:
+                    digests[CHAIN_MEMBER] = _add_data(
+                        tar, CHAIN_MEMBER, json.dumps(chain, sort_keys=True))
+                for name, path, expected_digest in files:
+                    digests[name], size = _add_member(tar, name, path,
+                                                      expected_digest)
+                    bytes_read += size
+                if state is not None:
+                    digests[STATE_MEMBER] = _add_data(tar, STATE_MEMBER,
+                                                      _format_sums(state))
+                _add_data(tar, MANIFEST_MEMBER, _format_sums(digests))
+                tar.close()
+                sink.close()
+            except BaseException:
+                # The tar stream is given up rather than finished, so that
+                # it does not write its end blocks when it is collected
+                tar.fileobj.closed = True
+                sink.abort()
+                raise
+            archive.flush()
+            os.fsync(archive.fileno())
+        os.rename(partial_path, archive_path)
+    finally:
+        if os.path.exists(partial_path):
+            os.remove(partial_path)
+    with open(archive_path + DIGEST_SUFFIX, 'w') as digest_file:
+        digest_file.write(_format_sums(
+            {os.path.basename(archive_path): output.sha256.hexdigest()}))
+    if state is not None:
+        with open(archive_path + STATE_SUFFIX, 'w') as state_file:
+            state_file.write(_format_sums(state))
+    return {'archive': archive_path,
+            'compressor': compressor,
+            'members': len(digests) + 1,
+            'bytes_read': bytes_read,
+            'bytes_written': output.count}
+
+
+def _manifest_files(manifests_dir):
+    '''Return the member names and paths of the puppet manifests'''
+    files = []
+    for name in sorted(os.listdir(manifests_dir)):
+        path = os.path.join(manifests_dir, name)
+        if os.path.isfile(path):
+            files.append((path.lstrip('/'), path))
+    return files
+
+
+def _dump_db(db_host, path):
+    '''Dump the LITP DB to path, hashing it as it is written'''
+    process = subprocess.Popen(
+        [SU_PATH, '-', POSTGRES_USER, '-c', PG_DUMP_CMD.format(db_host)],
+        stdout=subprocess.PIPE)
+    with open(path, 'wb') as dump_file:
+        writer = HashingWriter(dump_file)
+        for data in iter(lambda: process.stdout.read(CHUNK_SIZE), ''):
+            writer.write(data)
+    if process.wait() != 0:
+        raise BackupError('pg_dump exited with {0}'
+                          .format(process.returncode))
+    return writer.sha256.hexdigest()
+
+
+def _split_rows(data):
+    '''
+    Split the COPY data of a table into its rows and the rest, from the
+    end of data line on. Return None, None if there is no such line
+    '''
+    lines = data.split('\n')
+    if END_OF_DATA not in lines:
+        return None, None
+    index = lines.index(END_OF_DATA)
+    return lines[:index], '\n'.join(lines[index:])
+
+
+def _join_rows(rows, trailer):
+    '''Return the COPY data of the rows, sorted'''
+    return ''.join(row + '\n' for row in sorted(rows)) + trailer
+
+
+def _sort_table_file(path):
+    '''Sort the rows of a table data file, so equal tables dump equal'''
+    with open(path, 'rb') as table_file:
+        rows, trailer = _split_rows(table_file.read())
+    if rows is not None:
+        with open(path, 'wb') as table_file:
+            table_file.write(_join_rows(rows, trailer))
+
+
+def _dump_db_dir(db_host, db_dir):
+    '''Dump the LITP DB in the directory format, table rows sorted'''
+    postgres = pwd.getpwnam(POSTGRES_USER)
+    os.chown(os.path.dirname(db_dir), postgres.pw_uid, postgres.pw_gid)
+    if subprocess.call([SU_PATH, '-', POSTGRES_USER, '-c',
+                        PG_DUMP_DIR_CMD.format(db_host, db_dir)]) != 0:
+        raise BackupError('pg_dump of {0} failed'.format(db_dir))
+    for name in os.listdir(db_dir):
+        if name.endswith(TABLE_SUFFIX):
+            _sort_table_file(os.path.join(db_dir, name))
+
+
+def _write_rowdiff(old_path, old_digest, new_path, diff_path):
+    '''
+    Write the rows removed from and added to a table as lines starting
+    with "-" and "+". Return False if the old file is not the expected
+    version or if the diff is no smaller than the new file
+    '''
+    if not os.path.isfile(old_path):
+        return False
+    with open(old_path, 'rb') as old_file:
+        old_data = old_file.read()
+    if hashlib.sha256(old_data).hexdigest() != old_digest:
+        return False
+    with open(new_path, 'rb') as new_file:
+        new_data = new_file.read()
+    old_rows, old_trailer = _split_rows(old_data)
+    new_rows, new_trailer = _split_rows(new_data)
+    if old_rows is None or new_rows is None or old_trailer != new_trailer:
+        return False
+    old_rows = Counter(old_rows)
+    new_rows = Counter(new_rows)
+    diff = ''.join(['-' + row + '\n' for row in
+                    sorted((old_rows - new_rows).elements())] +
+                   ['+' + row + '\n' for row in
+                    sorted((new_rows - old_rows).elements())])
+    if len(diff) >= len(new_data):
+        return False
+    with open(diff_path, 'wb') as diff_file:
+        diff_file.write(diff)
+    return True
+
+
+def _apply_rowdiff(path, diff):
+    '''Apply a row diff to a table file and return its new digest'''
+    if not os.path.isfile(path):
+        raise BackupError('no {0} to apply the rows to'.format(path))
+    with open(path, 'rb') as table_file:
+        rows, trailer = _split_rows(table_file.read())
+    if rows is None:
+        raise BackupError('{0} is not table data'.format(path))
+    rows = Counter(rows)
+    lines = diff.splitlines()
+    removed = Counter(line[1:] for line in lines if line.startswith('-'))
+    added = Counter(line[1:] for line in lines if line.startswith('+'))
+    if removed - rows:
+        raise BackupError('rows removed from {0} are missing'.format(path))
+    data = _join_rows((rows - removed + added).elements(), trailer)
+    with open(path, 'wb') as table_file:
+        table_file.write(data)
+    return hashlib.sha256(data).hexdigest()
+
+
+def _read_chain(archive_path):
+    '''
+    Return the CHAIN member of an archive, the first one of its stream,
+    None if it has none
+    '''
+    try:
+        with open(archive_path, 'rb') as archive:
+            tar = tarfile.open(fileobj=archive, mode='r|gz')
+            for info in tar:
+                if info.name != CHAIN_MEMBER:
+                    return None
+                return json.loads(tar.extractfile(info).read())
+    except (tarfile.TarError, zlib.error, IOError, EOFError,
+            ValueError) as err:
+        raise BackupError('{0}: unreadable archive: {1}'.format(
+            os.path.basename(archive_path), err))
+    return None
+
+
+def _chain_links(archive_path, check_digests=False):
+    '''
+    Return the archives of the chain of an archive, base first, after
+    checking that each parent is the archive its child was based on and,
+    if check_digests, that it matches its digest file
+    '''
+    links = [archive_path]
+    chain = _read_chain(archive_path)
+    while chain is not None and chain['type'] == 'delta':
+        child = os.path.basename(links[0])
+        parent = os.path.join(os.path.dirname(archive_path),
+                              chain['parent'])
+        if not os.path.isfile(parent):
+            raise BackupError('missing parent {0} of {1}'.format(
+                chain['parent'], child))
+        if _read_digest_file(parent) != chain['parent_sha256']:
+            raise BackupError('{0} is not the parent {1} was based on'
+                              .format(chain['parent'], child))
+        if check_digests and not verify(parent, quick=True)['valid']:
+            raise BackupError('{0}: archive checksum mismatch'
+                              .format(chain['parent']))
+        links.insert(0, parent)
+        chain = _read_chain(parent)
+    return links
+
+
+def _chain_parent(backup_dir, max_chain):
+    '''
+    Find the archive the next delta is based on: the newest archive that
+    matches its digest file, if it is part of a sound chain shorter than
+    max_chain.
+    Return the archive and its chain length, or None and the reason.
+    '''
+    for path in newest_first(os.path.join(backup_dir, name)
+                             for name in os.listdir(backup_dir)):
+        if not verify(path, quick=True)['valid']:
+            continue
+        try:
+            links = _chain_links(path, check_digests=True)
+        except BackupError as err:
+            return None, 'broken chain: {0}'.format(err)
+        if _read_chain(links[0]) is None:
+            return None, 'newest backup is not incremental'
+        if len(links) >= max_chain:
+            return None, 'chain of {0} archives'.format(len(links))
+        return path, len(links)
+    return None, 'no backup'
+
+
+def _update_cache(cache_dir, files, work_dir, state):
+    '''Keep the state just archived as the base of the next row diffs'''
+    if os.path.exists(cache_dir):
+        shutil.rmtree(cache_dir)
+    for name, path in files + [(STATE_MEMBER, None)]:
+        cached = os.path.join(cache_dir, name)
+        if not os.path.isdir(os.path.dirname(cached)):
+            os.makedirs(os.path.dirname(cached))
+        if path is None:
+            # Written last, so that an interrupted update is not used
+            with open(cached, 'w') as state_file:
+                state_file.write(_format_sums(state))
+        elif path.startswith(work_dir):
+            os.rename(path, cached)
+        else:
+            shutil.copy2(path, cached)
+
+
+def backup(backup_dir, threads=1, db_host='ms1',
+           manifests_dir=PUPPET_MANIFESTS_DIR):
+    '''Write a new full archive to backup_dir and return its statistics'''
+    start = time.time()
+    archive_path = _new_archive_path(backup_dir, ARCHIVE_NAME)
+    work_dir = tempfile.mkdtemp(prefix=WORK_DIR_PREFIX, dir=backup_dir)
+    try:
+        dump_path = os.path.join(work_dir, DB_MEMBER)
+        files = [(DB_MEMBER, dump_path, _dump_db(db_host, dump_path))]
+        files.extend((name, path, None)
+                     for name, path in _manifest_files(manifests_dir))
+        result = _write_archive(archive_path, files, threads)
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+    result['seconds'] = time.time() - start
+    return result
+
+
+def incremental_backup(backup_dir, threads=1, db_host='ms1',
+                       manifests_dir=PUPPET_MANIFESTS_DIR,
+                       max_chain=MAX_CHAIN):
+    '''
+    Write a delta of the newest chain in backup_dir, or a new base if
+    there is no sound chain to extend, and return its statistics
+    '''
+    start = time.time()
+    cache_dir = os.path.join(backup_dir, CACHE_DIR)
+    work_dir = tempfile.mkdtemp(prefix=WORK_DIR_PREFIX, dir=backup_dir)
+    try:
+        db_dir = os.path.join(work_dir, DB_DIR_MEMBER)
+        _dump_db_dir(db_host, db_dir)
+        files = [('{0}/{1}'.format(DB_DIR_MEMBER, name),
+                  os.path.join(db_dir, name))
+                 for name in sorted(os.listdir(db_dir))]
+        files.extend(_manifest_files(manifests_dir))
+        state = dict((name, _file_digest(path)) for name, path in files)
+
+        parent, length = _chain_parent(backup_dir, max_chain)
+        parent_state = _read_sums_file(parent + STATE_SUFFIX) \
+            if parent else None
+        if parent is not None and parent_state is None:
+            parent, length = None, 'no {0} file of {1}'.format(
+                STATE_SUFFIX, os.path.basename(parent))
+
+        if parent is None:
+            archive_path = _new_archive_path(backup_dir, ARCHIVE_NAME)
+            chain = {'type': 'base', 'length': 1}
+            reason = length
+            members = [(name, path, state[name]) for name, path in files]
+        else:
+            archive_path = _new_archive_path(backup_dir, DELTA_NAME)
+            chain = {'type': 'delta', 'length': length + 1,
+                     'parent': os.path.basename(parent),
+                     'parent_sha256': _read_digest_file(parent),
+                     'removed': sorted(set(parent_state) - set(state))}
+            reason = None
+            cache_matches = parent_state == _read_sums_file(
+                os.path.join(cache_dir, STATE_MEMBER))
+            members = []
+            for name, path in files:
+                if parent_state.get(name) == state[name]:
+                    continue
+                diff_path = os.path.join(
+                    work_dir, name.replace('/', '_') + ROWDIFF_SUFFIX)
+                if cache_matches and name.endswith(TABLE_SUFFIX) and \
+                        name in parent_state and _write_rowdiff(
+                            os.path.join(cache_dir, name),
+                            parent_state[name], path, diff_path):
+                    members.append((name + ROWDIFF_SUFFIX, diff_path, None))
+                else:
+                    members.append((name, path, state[name]))
+
+        result = _write_archive(archive_path, members, threads, chain,
+                                state)
+        _update_cache(cache_dir, files, work_dir, state)
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+    result.update({'type': chain['type'],
+                   'parent': chain.get('parent'),
+                   'length': chain['length'],
+                   'reason': reason,
+                   'seconds': time.time() - start})
+    return result
+
+
+def _compare_manifest(manifest, digests):
+    '''Return the differences between the manifest and the members'''
+    if manifest is None:
+        return ['no {0} member'.format(MANIFEST_MEMBER)]
+    errors = []
+    for name in sorted(set(manifest) | set(digests)):
+        if name not in digests:
+            errors.append('missing member {0}'.format(name))
+        elif name not in manifest:
+            errors.append('unexpected member {0}'.format(name))
+        elif manifest[name] != digests[name]:
+            errors.append('checksum mismatch of {0}'.format(name))
+    return errors
+
+
+def _read_members(archive_path, handle_member=None):
+    '''
+    Read an archive in one streaming pass, checking its members against
+    its manifest and its compressed bytes against its digest file.
+    handle_member(name, fileobj), if given, consumes each data member and
+    returns its digest.
+    Return the errors, the member count, the bytes read and the content
+    of the META-INF members keyed by name.
+    '''
+    errors = []
+    members = 0
+    meta = {}
+    digests = {}
+    with open(archive_path, 'rb') as archive:
+        reader = HashingReader(archive)
+        try:
+            tar = tarfile.open(fileobj=reader, mode='r|gz')
+            for info in tar:
+                if not info.isfile():
+                    continue
+                members += 1
+                member = tar.extractfile(info)
+                if info.name in (MANIFEST_MEMBER, CHAIN_MEMBER,
+                                 STATE_MEMBER):
+                    meta[info.name] = member.read()
+                    if info.name != MANIFEST_MEMBER:
+                        digests[info.name] = hashlib.sha256(
+                            meta[info.name]).hexdigest()
+                elif handle_member is not None:
+                    digests[info.name] = handle_member(info.name, member)
+                else:
+                    sha256 = hashlib.sha256()
+                    for data in iter(lambda: member.read(CHUNK_SIZE), ''):
+                        sha256.update(data)
+                    digests[info.name] = sha256.hexdigest()
+        except (tarfile.TarError, zlib.error, IOError, EOFError,
+                ValueError) as err:
+            errors.append('unreadable archive: {0}'.format(err))
+        try:
+            manifest = _parse_sums(meta[MANIFEST_MEMBER]) \
+                if MANIFEST_MEMBER in meta else None
+        except ValueError:
+            manifest = {}
+            errors.append('unreadable {0}'.format(MANIFEST_MEMBER))
+        errors.extend(_compare_manifest(manifest, digests))
+        # The archive digest covers the bytes the tar reader left unread
+        for _ in iter(lambda: reader.read(CHUNK_SIZE), ''):
+            pass
+    recorded = _read_digest_file(archive_path)
+    if recorded is None:
+        errors.append('no {0} file'.format(DIGEST_SUFFIX))
+    elif recorded != reader.sha256.hexdigest():
+        errors.append('archive checksum mismatch')
+    return errors, members, reader.count, meta
+
+
+def verify(archive_path, quick=False):
+    '''
+    Verify an archive against its digest file and, unless quick, every
+    member against the manifest in the same streaming pass
+    '''
+    start = time.time()
+    if quick:
+        with open(archive_path, 'rb') as archive:
+            reader = HashingReader(archive)
+            for _ in iter(lambda: reader.read(CHUNK_SIZE), ''):
+                pass
+        recorded = _read_digest_file(archive_path)
+        errors = []
+        if recorded is None:
+            errors.append('no {0} file'.format(DIGEST_SUFFIX))
+        elif recorded != reader.sha256.hexdigest():
+            errors.append('archive checksum mismatch')
+        members, bytes_read = 0, reader.count
+    else:
+        errors, members, bytes_read, _ = _read_members(archive_path)
+    return {'archive': archive_path,
+            'valid': not errors,
+            'errors': errors,
+            'members': members,
+            'bytes_read': bytes_read,
+            'seconds': time.time() - start}
+
+
+def latest(backup_dir, valid=False):
+    '''
+    Return the newest archive of backup_dir by the timestamp in its name,
+    and if valid the newest one that matches its digest file
+    '''
+    for path in newest_first(os.path.join(backup_dir, name)
+                             for name in os.listdir(backup_dir)):
+        if not valid or verify(path, quick=True)['valid']:
+            return {'archive': path}
+    return {'archive': None}
+
+
+def _target_path(target_dir, name):
+    '''Return the path of a member under the restore directory'''
+    if name.startswith('/') or '..' in name.split('/'):
+        raise BackupError('unsafe member name {0}'.format(name))
+    path = os.path.join(target_dir, name)
+    if not os.path.isdir(os.path.dirname(path)):
+        os.makedirs(os.path.dirname(path))
+    return path
+
+
+def _replay_link(archive_path, target_dir, state, on_restored=None):
+    '''
+    Extract one archive of a chain over the restore directory, update
+    the digests of the restored files in state and check them against
+    the state the archive records. on_restored(name, path), if given, is
+    called as soon as each file is restored. Return the bytes read.
+    '''
+    def restore_member(name, member):
+        ''' Restore a file, or apply the rows of a table diff '''
+        if name.endswith(ROWDIFF_SUFFIX):
+            table = name[:-len(ROWDIFF_SUFFIX)]
+            diff = member.read()
+            state[table] = _apply_rowdiff(_target_path(target_dir, table),
+                                          diff)
+            return hashlib.sha256(diff).hexdigest()
+        path = _target_path(target_dir, name)
+        with open(path, 'wb') as target:
+            writer = HashingWriter(target)
+            for data in iter(lambda: member.read(CHUNK_SIZE), ''):
+                writer.write(data)
+        state[name] = writer.sha256.hexdigest()
+        if on_restored is not None:
+            on_restored(name, path)
+        return state[name]
+
+    name = os.path.basename(archive_path)
+    try:
+        errors, _, bytes_read, meta = _read_members(archive_path,
+                                                    restore_member)
+    except BackupError as err:
+        raise BackupError('{0}: {1}'.format(name, err))
+    if errors:
+        raise BackupError('{0}: {1}'.format(name, ', '.join(errors)))
+    chain = json.loads(meta[CHAIN_MEMBER]) if CHAIN_MEMBER in meta else {}
+    for removed in chain.get('removed', []):
+        path = _target_path(target_dir, removed)
+        if os.path.exists(path):
+            os.remove(path)
+        state.pop(removed, None)
+    # A full backup restores exactly the members of its manifest
+    expected = _parse_sums(meta.get(STATE_MEMBER, meta[MANIFEST_MEMBER]))
+    if state != expected:
+        raise BackupError('{0}: restored state does not match, {1}'.format(
+            name, ', '.join(_compare_manifest(expected, state))))
+    return bytes_read
+
+
+class DbLoader(object):
+    '''pg_restore of the restored DB, run in the background'''
+
+    def __init__(self, db_host, jobs):
+        self.db_host = db_host
+        self.jobs = jobs
+        self.db_path = None
+        self.process = None
+        self.started = None
+
+    def start(self, db_path):
+        '''Start loading a DB dump file or directory'''
+        self.db_path = db_path
+        self.started = time.time()
+        self.process = subprocess.Popen(
+            [SU_PATH, '-', POSTGRES_USER, '-c',
+             PG_RESTORE_CMD.format(self.db_host, self.jobs, db_path)])
+
+    def wait(self):
+        '''Wait for the load and return the seconds it took'''
+        if self.process.wait() != 0:
+            raise BackupError('pg_restore of {0} failed'.format(
+                self.db_path))
+        return time.time() - self.started
+
+
+def _put_manifests(target_dir):
+    '''
+    Replace the manifests with the restored ones, removing those written
+    since the backup, and return the seconds taken
+    '''
+    start = time.time()
+    manifests_dir = os.path.join(target_dir,
+                                 PUPPET_MANIFESTS_DIR.lstrip('/'))
+    restored = set(os.listdir(manifests_dir)) \
+        if os.path.isdir(manifests_dir) else set()
+    for _, path in _manifest_files(PUPPET_MANIFESTS_DIR):
+        if os.path.basename(path) not in restored:
+            os.remove(path)
+    for name in restored:
+        shutil.copy2(os.path.join(manifests_dir, name),
+                     os.path.join(PUPPET_MANIFESTS_DIR, name))
+    return time.time() - start
+
+
+def _run_parallel(calls):
+    '''
+    Run (function, args) calls in threads and return their results, in
+    order. The first error raised by a call is raised once all are done
+    '''
+    results = [None] * len(calls)
+    errors = []
+
+    def run(index, function, args):
+        ''' Run one call and keep its result or error '''
+        try:
+            results[index] = function(*args)
+        except (BackupError, EnvironmentError) as err:
+            errors.append(err)
+
+    threads = [threading.Thread(target=run, args=(index, function, args))
+               for index, (function, args) in enumerate(calls)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    if errors:
+        raise errors[0]
+    return results
+
+
+def restore(archive_path, target_dir, apply_state=False, db_host='ms1',
+            jobs=1):
+    '''
+    Restore the state of an archive to target_dir by replaying its chain
+    from the base, checking the state after every link, and if
+    apply_state load the DB and put the manifests in place from it.
+
+    The stages overlap where they do not depend on each other: the links
+    are checked in parallel, the DB of a full backup is loaded with
+    "pg_restore -j jobs" as soon as its dump is extracted, and the
+    manifests are put in place while the DB loads.
+    '''
+    start = time.time()
+    stages = {}
+    errors = []
+    links = []
+    state = {}
+    bytes_read = 0
+    loader = DbLoader(db_host, jobs) if apply_state else None
+
+    def on_restored(name, path):
+        ''' Start loading the dump of a full backup once extracted '''
+        if name == DB_MEMBER and len(links) == 1:
+            loader.start(path)
+
+    try:
+        stage = time.time()
+        links = _chain_links(archive_path)
+        # Corrupted links are found before anything is restored from them
+        for link, result in zip(links, _run_parallel(
+                [(verify, (link, True)) for link in links])):
+            if not result['valid']:
+                raise BackupError('{0}: {1}'.format(
+                    os.path.basename(link), ', '.join(result['errors'])))
+        stages['verify'] = time.time() - stage
+
+        stage = time.time()
+        for link in links:
+            bytes_read += _replay_link(link, target_dir, state,
+                                       on_restored if loader else None)
+        stages['extract'] = time.time() - stage
+
+        if loader is not None:
+            if loader.process is None:
+                db_path = os.path.join(target_dir, DB_DIR_MEMBER)
+                if not os.path.isdir(db_path):
+                    db_path = os.path.join(target_dir, DB_MEMBER)
+                loader.start(db_path)
+            stages['db_load'], stages['manifests'] = _run_parallel(
+                [(loader.wait, ()), (_put_manifests, (target_dir,))])
+    except BackupError as err:
+        errors.append(str(err))
+        if loader is not None and loader.process is not None:
+            loader.process.wait()
+    stages['total'] = time.time() - start
+    return {'archive': archive_path,
+            'chain': [os.path.basename(link) for link in links],
+            'valid': not errors,
+            'errors': errors,
+            'members': len(state),
+            'bytes_read': bytes_read,
+            'stages': stages,
+            'seconds': stages['total']}
+
+
+def main(args):
+    '''Run a command and print its result as JSON'''
+    parser = optparse.OptionParser(
+        usage='%prog backup <dir> | verify <archive> | latest <dir> | '
+              'restore <archive> <dir>')
+    parser.add_option('--threads', type='int', default=1,
+                      help='compress with pigz threads if installed')
+    parser.add_option('--db-host', default='ms1')
+    parser.add_option('--incremental', action='store_true', default=False,
+                      help='write a delta of the newest backup chain')
+    parser.add_option('--max-chain', type='int', default=MAX_CHAIN,
+                      help='archives in a chain before a new base')
+    parser.add_option('--quick', action='store_true', default=False,
+                      help='only check the archive digest file')
+    parser.add_option('--valid', action='store_true', default=False,
+                      help='skip archives that fail the quick check')
+    parser.add_option('--apply', action='store_true', default=False,
+                      help='load the restored DB and manifests')
+    parser.add_option('--jobs', type='int', default=1,
+                      help='parallel pg_restore jobs of --apply')
+    options, args = parser.parse_args(args)
+    num_args = {'backup': 2, 'verify': 2, 'latest': 2, 'restore': 3}
+    if not args or num_args.get(args[0]) != len(args):
+        parser.error('expected a command and its paths')
+    if args[0] == 'backup' and options.incremental:
+        result = incremental_backup(args[1], options.threads,
+                                    options.db_host,
+                                    max_chain=options.max_chain)
+    elif args[0] == 'backup':
+        result = backup(args[1], options.threads, options.db_host)
+    elif args[0] == 'verify':
+        result = verify(args[1], options.quick)
+    elif args[0] == 'latest':
+        result = latest(args[1], options.valid)
+    else:
+        result = restore(args[1], args[2], options.apply, options.db_host,
+                         options.jobs)
+    print json.dumps(result, sort_keys=True)
+    return 0 if result.get('valid', True) else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,188 @@
+"""
+COPYRIGHT Ericsson 2026
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     October 2026
+@author:    LITP Core Testware
+@summary:   Incremental log follower.
+            Remembers a byte offset per (node, log file) and reads only the
+            bytes written since the last read, following the file across a
+            logrotate. Several regular expressions are matched against the
+            new lines in a single pass.
+"""
+import re
+import time
+import uuid
+import test_constants
+
+# Reads the bytes of the log file past the given offset. When the inode
+# changed, or the file shrank, the log was rotated: the rest of the rotated
+# file (found by inode in the same directory) is read first, then the new
+# file from the start. A trailing partial line is left for the next read.
+READ_NEW_BYTES_SCRIPT = r"""
+f={path}; ino={inode}; off={offset}
+set -- $(/usr/bin/stat -c '%i %s' $f)
+cur_ino=$1; size=$2
+chunk=$(/bin/mktemp)
+if [ "$cur_ino" = "$ino" ] && [ $size -ge $off ]; then
+    /usr/bin/tail -c +$((off + 1)) $f | /usr/bin/head -c $((size - off)) \
+        > $chunk
+    base=$off
+else
+    old=$(/bin/find $(/usr/bin/dirname $f) -maxdepth 1 -type f \
+          -inum "$ino" 2>/dev/null | /usr/bin/head -1)
+    if [ -n "$old" ] && [ "$old" != "$f" ]; then
+        /usr/bin/tail -c +$((off + 1)) "$old" > $chunk
+    fi
+    base=$((0 - $(/usr/bin/stat -c %s $chunk)))
+    /usr/bin/head -c $size $f >> $chunk
+fi
+len=$(/usr/bin/stat -c %s $chunk)
+partial=0
+if [ $len -gt 0 ] && [ $(/usr/bin/tail -c 1 $chunk | /usr/bin/wc -l) -eq 0 ]
+then
+    partial=$(/usr/bin/tail -n 1 $chunk | /usr/bin/wc -c)
+fi
+new_off=$((base + len - partial))
+[ $new_off -lt 0 ] && new_off=0
+/bin/echo "{marker} $cur_ino $new_off"
+/usr/bin/head -c $((len - partial)) $chunk
+/bin/rm -f $chunk
+"""
+
+
+class LogFollower(object):
+    """
+    Follows a log file on a node.
+
+    Call mark() to set the position from which new lines are of interest,
+    then read_new_lines(), search() or wait_for() to consume the lines
+    written since the previous read.
+    """
+
+    def __init__(self, pool, node, path=test_constants.GEN_SYSTEM_LOG_PATH,
+                 su_root=True):
+        """
+        Args:
+            pool (SSHSessionPool): The session pool used to reach the node
+            node (str): The node filename
+            path (str): The log file to follow
+            su_root (bool): Read the log as root
+        """
+        self.pool = pool
+        self.node = node
+        self.path = path
+        self.su_root = su_root
+        self.inode = None
+        self.offset = None
+        self.bytes_read = 0
+
+    def mark(self):
+        """
+        Description:
+            Set the position to the current end of the log file
+        Return:
+            int, The current byte offset
+        """
+        out, _, rc = self.pool.run_command(
+            self.node,
+            "/usr/bin/stat -c '%i %s' {0}".format(self.path),
+            su_root=self.su_root)
+        if rc != 0 or not out:
+            raise IOError('Cannot stat "{0}" on "{1}"'.format(self.path,
+                                                             self.node))
+        inode, size = out[0].split()
+        self.inode = inode
+        self.offset = int(size)
+        return self.offset
+
+    def read_new_lines(self):
+        """
+        Description:
+            Read the complete lines written since the last read or mark
+        Return:
+            list, The new lines
+        """
+        if self.offset is None:
+            self.mark()
+            return []
+        marker = uuid.uuid4().hex
+        script = READ_NEW_BYTES_SCRIPT.format(path=self.path,
+                                              inode=self.inode,
+                                              offset=self.offset,
+                                              marker=marker)
+        out, err, rc = self.pool.run_command(self.node,
+                                             script,
+                                             su_root=self.su_root)
+        if rc != 0 or not out or not out[0].startswith(marker):
+            raise IOError('Cannot read "{0}" on "{1}": {2}'
+                          .format(self.path, self.node, err))
+        _, inode, offset = out[0].split()
+        lines = out[1:]
+        self.bytes_read += sum(len(line) + 1 for line in lines)
+        self.inode = inode
+        self.offset = int(offset)
+        return lines
+
+    @staticmethod
+    def _compile(patterns):
+        """ Compile the patterns, given as a dict of name -> regex """
+        return dict((name, pattern if hasattr(pattern, 'search')
+                     else re.compile(pattern))
+                    for name, pattern in patterns.items())
+
+    def search(self, patterns, lines=None):
+        """
+        Description:
+            Match every pattern against the new lines in a single pass
+        Args:
+            patterns (dict): Regular expressions keyed by name
+            lines (list): Lines to search. Defaults to the new lines
+        Return:
+            dict, The first match object of each pattern that matched,
+                  keyed by name
+        """
+        compiled = self._compile(patterns)
+        if lines is None:
+            lines = self.read_new_lines()
+        matches = {}
+        for line in lines:
+            for name, regex in compiled.items():
+                if name in matches:
+                    continue
+                match = regex.search(line)
+                if match:
+                    matches[name] = match
+            if len(matches) == len(compiled):
+                break
+        return matches
+
+    def wait_for(self, patterns, timeout=180, poll_interval=2):
+        """
+        Description:
+            Wait until every pattern has matched a line written after the
+            mark. Each poll reads only the bytes written since the previous
+            one.
+        Args:
+            patterns (dict): Regular expressions keyed by name
+            timeout (int): Timeout in seconds
+            poll_interval (int): The interval between polls in seconds
+        Return:
+            dict, The first match object of each pattern that matched,
+                  keyed by name. Patterns that did not match before the
+                  timeout are missing.
+        """
+        compiled = self._compile(patterns)
+        matches = {}
+        end_time = time.time() + timeout
+        while True:
+            pending = dict((name, regex) for name, regex in compiled.items()
+                           if name not in matches)
+            matches.update(self.search(pending))
+            if len(matches) == len(compiled) or time.time() >= end_time:
+                return matches
+            time.sleep(poll_interval)
@@ -0,0 +1,204 @@
+##############################################################################
+# COPYRIGHT Ericsson AB 2026
+#
+# The copyright to the computer program(s) herein is the property of
+# Ericsson AB. The programs may be used and/or copied only with written
+# permission from Ericsson AB. or in accordance with the terms and
+# conditions stipulated in the agreement/contract under which the
+# program(s) have been supplied.
+##############################################################################
+'''Progress of the LVM snapshot merges of a snapshot restore
+
+"lvconvert --merge" merges a snapshot back into its origin, at the next
+activation of the origin when it is in use. While it runs the origin has
+the "O" attribute and the hidden snapshot the "S" attribute, and the data
+percent of the snapshot falls to zero.
+
+The monitor command samples the merging volumes and appends their
+progress to a log in the format of the LITP metrics.log, one entry per
+volume and sample:
+
+    <time>,[LITP][SNAPSHOT][Merge][<vg>/<lv>].PercentMerged=42.0
+    <time>,[LITP][SNAPSHOT][Merge][<vg>/<lv>].EtaSeconds=31
+    <time>,[LITP][SNAPSHOT][Merge][<vg>/<lv>].TimeTaken=12.345
+
+The percent merged is counted from the snapshot usage when the volume was
+first seen by the monitor, the estimated time remaining from the merge
+rate since then, and TimeTaken is logged once the merge of the volume is
+complete. When no volume is merging any more the monitor logs the number
+of volumes it saw and its own TimeTaken under [LITP][SNAPSHOT][Merge].
+
+Usage:
+    lvm_merge_progress.py status
+    lvm_merge_progress.py monitor <log> [--interval S] [--timeout S]
+
+Each command prints its result as a JSON object. monitor exits with 1 if
+the merges did not complete within the timeout.
+'''
+from collections import OrderedDict
+import datetime
+import json
+import optparse
+import subprocess
+import sys
+import time
+
+LVS_CMD = ['/sbin/lvs', '-a', '--noheadings', '--nosuffix',
+           '--separator', '|',
+           '-o', 'vg_name,lv_name,lv_attr,origin,data_percent']
+MERGE_OPERATION = '[LITP][SNAPSHOT][Merge]'
+TIMESTAMP_FORMAT = '%Y-%m-%d %H:%M:%S.%f'
+UNABLE_TO_GET_VALUE = 'UnableToGetMetricsValue'
+MERGING_ORIGIN = 'O'
+MERGING_SNAPSHOT = 'S'
+INTERVAL = 5
+TIMEOUT = 3600
+
+
+def _percent(value):
+    '''Return an lvs percent as a float, None if there is none'''
+    try:
+        return float(value)
+    except ValueError:
+        return None
+
+
+def merging_volumes():
+    '''
+    Return the snapshot usage percent of every merging origin keyed by
+    "<vg>/<lv>", None while the merge has not started
+    '''
+    process = subprocess.Popen(LVS_CMD, stdout=subprocess.PIPE)
+    output = process.communicate()[0]
+    if process.returncode != 0:
+        raise OSError('lvs exited with {0}'.format(process.returncode))
+    volumes = OrderedDict()
+    usage = {}
+    for line in output.splitlines():
+        fields = [field.strip() for field in line.split('|')]
+        if len(fields) != 5:
+            continue
+        vg_name, lv_name, lv_attr, origin, data_percent = fields
+        if lv_attr.startswith(MERGING_ORIGIN):
+            volumes['{0}/{1}'.format(vg_name, lv_name)] = \
+                _percent(data_percent)
+        elif lv_attr.startswith(MERGING_SNAPSHOT) and origin:
+            usage['{0}/{1}'.format(vg_name, origin)] = \
+                _percent(data_percent)
+    for volume in volumes:
+        if usage.get(volume) is not None:
+            volumes[volume] = usage[volume]
+    return volumes
+
+
+def format_metric(operation, name, value, now=None):
+    '''Return a metrics.log line'''
+    now = datetime.datetime.now() if now is None else now
+    return '{0},{1}.{2}={3}\n'.format(now.strftime(TIMESTAMP_FORMAT),
+                                      operation, name, value)
+
+
+class MergeTracker(object):
+    '''Merge progress of the volumes seen in successive samples'''
+
+    def __init__(self):
+        # First sample time and snapshot usage of each volume
+        self.first = {}
+        self.done = OrderedDict()
+
+    def update(self, volumes, now):
+        '''
+        Take a sample of merging_volumes() taken at time now and return
+        the metrics of the sample as (operation, name, value) tuples
+        '''
+        metrics = []
+        for volume, usage in volumes.items():
+            # The progress counts from the first sample with a usage
+            if self.first.get(volume, (None, None))[1] is None:
+                self.first[volume] = (now, usage)
+            first_time, first_usage = self.first[volume]
+            operation = '{0}[{1}]'.format(MERGE_OPERATION, volume)
+            if usage is None or first_usage is None:
+                metrics.append((operation, 'PercentMerged',
+                                UNABLE_TO_GET_VALUE))
+                metrics.append((operation, 'EtaSeconds',
+                                UNABLE_TO_GET_VALUE))
+                continue
+            merged = 100.0 if not first_usage else \
+                max(0.0, (first_usage - usage) * 100.0 / first_usage)
+            metrics.append((operation, 'PercentMerged',
+                            '{0:.1f}'.format(merged)))
+            rate = merged / (now - first_time) if now > first_time else 0
+            metrics.append((operation, 'EtaSeconds',
+                            '{0:.0f}'.format((100.0 - merged) / rate)
+                            if rate else UNABLE_TO_GET_VALUE))
+        for volume in self.first:
+            if volume not in volumes and volume not in self.done:
+                self.done[volume] = now - self.first[volume][0]
+                operation = '{0}[{1}]'.format(MERGE_OPERATION, volume)
+                metrics.append((operation, 'PercentMerged', '100.0'))
+                metrics.append((operation, 'EtaSeconds', '0'))
+                metrics.append((operation, 'TimeTaken',
+                                '{0:.3f}'.format(self.done[volume])))
+        return metrics
+
+
+def status():
+    '''Return the snapshot usage of the merging volumes'''
+    volumes = merging_volumes()
+    return {'volumes': volumes, 'merging': len(volumes)}
+
+
+def monitor(log_path, interval=INTERVAL, timeout=TIMEOUT):
+    '''
+    Log the progress of the merges to log_path until no volume is merging
+    or timeout seconds have passed, and return the seconds each volume
+    took to merge since it was first seen
+    '''
+    start = time.time()
+    tracker = MergeTracker()
+    while True:
+        now = time.time()
+        volumes = merging_volumes()
+        metrics = tracker.update(volumes, now)
+        complete = not volumes
+        if complete or now - start > timeout:
+            metrics.append((MERGE_OPERATION, 'NoOfVolumes',
+                            len(tracker.first)))
+            metrics.append((MERGE_OPERATION, 'TimeTaken',
+                            '{0:.3f}'.format(now - start)))
+        with open(log_path, 'a') as log:
+            for operation, name, value in metrics:
+                log.write(format_metric(operation, name, value))
+        if complete or now - start > timeout:
+            break
+        time.sleep(interval)
+    errors = ['{0}: merge not complete'.format(volume)
+              for volume in volumes]
+    return {'volumes': tracker.done,
+            'valid': not errors,
+            'errors': errors,
+            'seconds': now - start}
+
+
+def main(args):
+    '''Run a command and print its result as JSON'''
+    parser = optparse.OptionParser(usage='%prog status | monitor <log>')
+    parser.add_option('--interval', type='float', default=INTERVAL,
+                      help='seconds between samples')
+    parser.add_option('--timeout', type='float', default=TIMEOUT,
+                      help='seconds before the monitor gives up')
+    options, args = parser.parse_args(args)
+    num_args = {'status': 1, 'monitor': 2}
+    if not args or num_args.get(args[0]) != len(args):
+        parser.error('expected a command and its paths')
+    if args[0] == 'status':
+        result = status()
+    else:
+        result = monitor(args[1], options.interval, options.timeout)
+    print json.dumps(result, sort_keys=True)
+    return 0 if result.get('valid', True) else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,309 @@
+"""
+COPYRIGHT Ericsson 2026
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     October 2026
+@author:    LITP Core Testware
+@summary:   Structured reader of the LITP metrics.log file.
+            Every "<timestamp>,[LITP][PLAN][Create]....TimeTaken=1.234" line
+            is parsed once into a typed record, indexed by operation and by
+            plan. A plan summary can be compared against a stored baseline to
+            flag timing and size regressions.
+"""
+from collections import defaultdict, namedtuple
+import datetime
+import json
+import re
+
+TIMESTAMP_FORMAT = '%Y-%m-%d %H:%M:%S.%f'
+UNABLE_TO_GET_VALUE = 'UnableToGetMetricsValue'
+
+PLAN_CREATE = '[LITP][PLAN][Create]'
+PLAN_RUN = '[LITP][PLAN][Run]'
+PLAN_PREFIX = '[LITP][PLAN]'
+
+TIME_TAKEN_REGEX = re.compile(r'^[\d]+\.[\d]{3}$')
+SIZE_REGEX = re.compile(r'^[\d]+$')
+PHASE_REGEX = re.compile(r'^\[LITP\]\[PLAN\]\[Run\]\[Phase\d+\]$')
+
+MetricRecord = namedtuple('MetricRecord', ['timestamp', 'operation', 'name',
+                                           'value', 'raw', 'plan', 'valid'])
+
+
+def parse_metric_value(name, value):
+    """
+    Description:
+        Convert the value of a metric to its type. TimeTaken is a float
+        with three decimals, Size and the NoOf* counters are integers and
+        any other metric is kept as a string
+    Args:
+        name (str): The metric name, e.g. "TimeTaken"
+        value (str): The metric value as logged
+    Return:
+        tuple, The typed value and whether the value was valid. The value
+               is None when it is not valid
+    """
+    if not value or UNABLE_TO_GET_VALUE in value:
+        return None, False
+    if name == 'TimeTaken':
+        if not TIME_TAKEN_REGEX.match(value):
+            return None, False
+        return float(value), True
+    if name == 'Size' or name.startswith('NoOf') or name.startswith('Total'):
+        if not SIZE_REGEX.match(value):
+            return None, False
+        return int(value), True
+    return value, True
+
+
+def parse_metric_line(line, plan=None):
+    """
+    Description:
+        Parse one line of the metrics log
+    Args:
+        line (str): "<timestamp>,<operation>.<name>=<value>"
+        plan (int): The plan sequence number the line belongs to
+    Return:
+        MetricRecord, or None if the line is not a metric line
+    """
+    timestamp, sep, metric = line.strip().partition(',')
+    if not sep:
+        return None
+    operation, sep, name_value = metric.rpartition('].')
+    if not sep or '=' not in name_value:
+        return None
+    name, _, value = name_value.partition('=')
+    try:
+        timestamp = datetime.datetime.strptime(timestamp, TIMESTAMP_FORMAT)
+    except ValueError:
+        timestamp = None
+    value, valid = parse_metric_value(name, value)
+    return MetricRecord(timestamp, operation + ']', name, value, line.strip(),
+                        plan, valid)
+
+
+class MetricsLog(object):
+    """
+    The parsed content of a metrics log.
+
+    Records are indexed by operation, the bracketed prefix of the metric
+    such as "[LITP][PLAN][Run][Phase1]", and by plan. Plans are numbered
+    from 1 in the order they appear in the log: a plan starts with the
+    first "[LITP][PLAN][Create]" record that follows a run, or the start
+    of the log. Records logged before the first plan record have plan
+    None.
+    """
+
+    def __init__(self, lines):
+        """
+        Args:
+            lines (list): The lines of the metrics log
+        """
+        self.records = []
+        self.by_operation = defaultdict(list)
+        self.by_plan = defaultdict(list)
+        self.invalid = []
+
+        plan = None
+        in_create = False
+        for line in lines:
+            record = parse_metric_line(line)
+            if record is None:
+                continue
+            if record.operation.startswith(PLAN_CREATE):
+                if not in_create:
+                    plan = (plan or 0) + 1
+                in_create = True
+            elif record.operation.startswith(PLAN_PREFIX):
+                # The log may have been rotated between create and run
+                plan = plan or 1
+                in_create = False
+            record = record._replace(plan=plan)
+            self.records.append(record)
+            self.by_operation[record.operation].append(record)
+            self.by_plan[record.plan].append(record)
+            if not record.valid:
+                self.invalid.append(record)
+
+    @classmethod
+    def from_node(cls, test, node, path):
+        """
+        Description:
+            Read and parse the metrics log of a node in one call
+        Args:
+            test (GenericTest): The test used to read the file
+            node (str): The node filename
+            path (str): The path of the metrics log
+        Return:
+            MetricsLog, The parsed log
+        """
+        return cls(test.get_file_contents(node, path, su_root=True))
+
+    def plans(self):
+        """
+        Return:
+            list, The sequence numbers of the plans found in the log
+        """
+        return sorted(plan for plan in self.by_plan if plan is not None)
+
+    def select(self, operation=None, name=None, plan=None, prefix=False):
+        """
+        Description:
+            Return the records that match all the given criteria
+        Args:
+            operation (str): The operation, e.g. "[LITP][PLAN][Create]"
+            name (str): The metric name, e.g. "TimeTaken"
+            plan (int): The plan sequence number
+            prefix (bool): Match every operation that starts with the
+                           given one rather than the operation itself
+        Return:
+            list, The matching records in log order
+        """
+        if operation is not None and not prefix:
+            records = self.by_operation.get(operation, [])
+        elif plan is not None:
+            records = self.by_plan.get(plan, [])
+        else:
+            records = self.records
+        return [record for record in records
+                if (operation is None or
+                    record.operation.startswith(operation)) and
+                (name is None or record.name == name) and
+                (plan is None or record.plan == plan)]
+
+    def values(self, operation, name, plan=None):
+        """
+        Description:
+            Return the values of a metric for an operation
+        Args:
+            operation (str): The operation, e.g. "[LITP][PLAN][Run]"
+            name (str): The metric name
+            plan (int): The plan sequence number
+        Return:
+            list, The typed values in log order
+        """
+        return [record.value for record in
+                self.select(operation, name, plan)]
+
+    def phases(self, plan=None):
+        """
+        Description:
+            Return the phase operations logged when a plan ran
+        Args:
+            plan (int): The plan sequence number
+        Return:
+            list, The phase operations ordered by phase number
+        """
+        phases = set(record.operation for record in
+                     self.select(PLAN_RUN, plan=plan, prefix=True)
+                     if PHASE_REGEX.match(record.operation))
+        return sorted(phases,
+                      key=lambda phase: int(re.findall(r'\d+', phase)[0]))
+
+    def summarise(self, plan):
+        """
+        Description:
+            Summarise the benchmark metrics of a plan: the TimeTaken of the
+            plan create and run operations and of every phase, the task
+            counts of every phase and the StorageSave Size and TimeTaken.
+            StorageSave is logged once per save so its TimeTaken values are
+            added up and its largest Size is kept
+        Args:
+            plan (int): The plan sequence number
+        Return:
+            dict, Metric values keyed by "<operation>.<name>"
+        """
+        summary = {}
+        for record in self.by_plan.get(plan, []):
+            if not record.valid:
+                continue
+            key = '{0}.{1}'.format(record.operation, record.name)
+            if record.operation.endswith('[StorageSave]'):
+                if record.name == 'TimeTaken':
+                    summary[key] = round(summary.get(key, 0) +
+                                         record.value, 3)
+                elif record.name == 'Size':
+                    summary[key] = max(summary.get(key, 0), record.value)
+            elif record.operation in (PLAN_CREATE, PLAN_RUN,
+                                      PLAN_CREATE + '[Build]',
+                                      PLAN_RUN + '[Clear]') and \
+                    record.name == 'TimeTaken':
+                summary[key] = record.value
+            elif PHASE_REGEX.match(record.operation) and \
+                    isinstance(record.value, (int, float)):
+                summary[key] = record.value
+        return summary
+
+
+def load_baseline(path):
+    """
+    Description:
+        Load a metrics baseline saved with save_baseline()
+    Args:
+        path (str): The baseline file
+    Return:
+        dict, The baseline metrics keyed by "<operation>.<name>"
+    """
+    with open(path) as baseline_file:
+        return json.load(baseline_file)
+
+
+def save_baseline(path, summary):
+    """
+    Description:
+        Save a plan summary as the metrics baseline
+    Args:
+        path (str): The baseline file
+        summary (dict): The plan summary returned by MetricsLog.summarise()
+    """
+    with open(path, 'w') as baseline_file:
+        json.dump(summary, baseline_file, indent=4, sort_keys=True)
+
+
+def compare_to_baseline(summary, baseline, time_tolerance=0.5,
+                        time_slack=1.0, size_tolerance=0.2):
+    """
+    Description:
+        Compare a plan summary with the baseline. A TimeTaken is a
+        regression when it exceeds the baseline by more than time_tolerance
+        of it plus time_slack seconds, a Size when it exceeds the baseline
+        by more than size_tolerance of it. Task counts must be equal.
+        Metrics missing from either side are reported too
+    Args:
+        summary (dict): The plan summary returned by MetricsLog.summarise()
+        baseline (dict): The baseline metrics
+        time_tolerance (float): Allowed relative TimeTaken increase
+        time_slack (float): Allowed absolute TimeTaken increase in seconds
+        size_tolerance (float): Allowed relative Size increase
+    Return:
+        list, A description of every regression found
+    """
+    regressions = []
+    for key in sorted(set(summary) | set(baseline)):
+        if key not in summary:
+            regressions.append('{0}: missing, baseline {1}'
+                               .format(key, baseline[key]))
+            continue
+        if key not in baseline:
+            regressions.append('{0}: {1}, not in baseline'
+                               .format(key, summary[key]))
+            continue
+        current = summary[key]
+        expected = baseline[key]
+        if key.endswith('.TimeTaken'):
+            limit = expected * (1 + time_tolerance) + time_slack
+        elif key.endswith('.Size'):
+            limit = expected * (1 + size_tolerance)
+        else:
+            if current != expected:
+                regressions.append('{0}: {1}, baseline {2}'
+                                   .format(key, current, expected))
+            continue
+        if current > limit:
+            regressions.append('{0}: {1}, baseline {2}, limit {3:.3f}'
+                               .format(key, current, expected, limit))
+    return regressions
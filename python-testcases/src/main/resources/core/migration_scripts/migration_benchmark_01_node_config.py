@@ -0,0 +1,16 @@
+from litp.migration import BaseMigration
+from litp.migration.operations import AddProperty
+from litp.migration.operations import RenameProperty
+from litp.migration.operations import UpdateCollectionType
+
+
+class Migration(BaseMigration):
+    version = '1.2.2'
+    operations = [
+        AddProperty('migrations-node-config', 'bench_added', 'bench'),
+        RenameProperty('migrations-node-config', 'name', 'bench_name'),
+        UpdateCollectionType(
+            'migrations-node-config', 'migration_items_collection',
+            'migration-config', 'node-config'
+        )
+    ]
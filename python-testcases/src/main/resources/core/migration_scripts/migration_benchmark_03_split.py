@@ -0,0 +1,51 @@
+from litp.migration import BaseMigration
+from litp.migration.operations import BaseOperation
+
+# Only the packages created by the migration benchmark are migrated
+BENCHMARK_PATH = '/software/items/mig_split_'
+
+
+class SplitPropertyOperation(BaseOperation):
+
+    def __init__(self, item_type_id, old_property, new_property1,
+                 new_property2):
+        self.item_type_id = item_type_id
+        self.old_property = old_property
+        self.new_property1 = new_property1
+        self.new_property2 = new_property2
+
+    def _benchmark_items(self, model_manager):
+        return [item for item in
+                model_manager.find_modelitems(self.item_type_id)
+                if item.vpath.startswith(BENCHMARK_PATH)]
+
+    def mutate_forward(self, model_manager):
+        for item in self._benchmark_items(model_manager):
+            if getattr(item, self.old_property) is not None:
+                merged_value = getattr(item, self.old_property)
+                # Values are split on their last "-", the others are
+                # left as they are
+                if '-' not in merged_value:
+                    continue
+                prop_value1, prop_value2 = merged_value.rsplit('-', 1)
+                item.delete_property(self.old_property)
+                item.set_property(self.new_property1, prop_value1)
+                item.set_property(self.new_property2, prop_value2)
+
+    def mutate_backward(self, model_manager):
+        for item in self._benchmark_items(model_manager):
+            if (getattr(item, self.new_property1) is not None and
+                    getattr(item, self.new_property2) is not None):
+                prop_value1 = getattr(item, self.new_property1, '')
+                prop_value2 = getattr(item, self.new_property2, '')
+                merged_value = "%s-%s" % (prop_value1, prop_value2)
+                item.delete_property(self.new_property1)
+                item.delete_property(self.new_property2)
+                item.set_property(self.old_property, merged_value)
+
+
+class Migration(BaseMigration):
+    version = '1.2.2'
+    operations = [
+        SplitPropertyOperation('package', 'name', 'name', 'version')
+    ]
@@ -0,0 +1,22 @@
+# testset_story1126 test_06 replaces the single_pass_migration import with
+# the module itself when it copies this script, as litpd loads each
+# migration script on its own
+from litp.migration import BaseMigration
+from single_pass_migration import SinglePassOperation, AddPropertyStep, \
+    RemovePropertyStep
+
+
+class Migration(BaseMigration):
+    version = '1.1.2'
+    operations = [
+        # The operations of story1126_test_01_script2 and script3, with one
+        # model scan per item type
+        SinglePassOperation([
+            AddPropertyStep('storage-profile', 'prop1', 'storage1'),
+            RemovePropertyStep(
+                'storage-profile', 'storage_profile_name', 'sp1'),
+            AddPropertyStep('os-profile', 'prop1', 'os-profile-1'),
+            RemovePropertyStep('os-profile', 'arch', 'x86_64'),
+            RemovePropertyStep('os-profile', 'path', '/profiles/node-iso/'),
+        ])
+    ]
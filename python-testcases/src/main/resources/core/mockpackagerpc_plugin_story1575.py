@@ -2,6 +2,8 @@ from litp.core.plugin import Plugin
 from litp.core.task import OrderedTaskList
 from litp.core.task import CallbackTask
 from litp.core.task import RemoteExecutionTask
+from rpc_task_grouping import RemoteCall, remote_call_task, \
+    group_remote_calls
 
 #
 # THIS FILE IS PROVIDED AS A REFERENCE/EXAMPLE TO SHOW WHAT AN RPCTask() PLUGIN
@@ -154,6 +156,29 @@ class mockpackagerpcPlugin(Plugin):
 
         return tasks
 
+    def execute_valid_remote_procedure_call_per_node(self, api, version,
+                                                     grouped=False):
+
+        calls = list()
+
+        nodes = api.query('ms')
+        nodes.extend(api.query('node'))
+
+        for node in nodes:
+            for package in node.query('mock-package'):
+                if package.is_initial() and package.version == version:
+                    calls.append(RemoteCall(node, package,
+                        'RPCTask for {0}:{1}'.format(package.name,
+                                                     node.hostname),
+                        'service', 'status', {'service': 'network'}))
+
+        if grouped:
+            return group_remote_calls(calls, lambda group:
+                'RPCTask for {0}:{1}'.format(group[0].model_item.name,
+                    ','.join(call.node.hostname for call in group)))
+
+        return [remote_call_task(call) for call in calls]
+
     def ordered_remote_procedure_task(self, api):
 
         tasks = list()
@@ -235,4 +260,17 @@ class mockpackagerpcPlugin(Plugin):
                 self.execute_valid_remote_procedure_call_on_nodes(
                                                         plugin_api_context))
 
+        # the same remote call on every node with a package, one task per
+        # node (11.0) or one task for all the nodes (12.0)
+        versions = set(package.version for package in packages)
+
+        if '11.0' in versions:
+            tasks.extend(self.execute_valid_remote_procedure_call_per_node(
+                                            plugin_api_context, '11.0'))
+
+        if '12.0' in versions:
+            tasks.extend(self.execute_valid_remote_procedure_call_per_node(
+                                            plugin_api_context, '12.0',
+                                            grouped=True))
+
         return tasks
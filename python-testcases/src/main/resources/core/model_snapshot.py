@@ -0,0 +1,218 @@
+"""
+COPYRIGHT Ericsson 2026
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     October 2026
+@author:    LITP Core Testware
+@summary:   Read-through cache of the LITP model tree.
+            The whole tree is fetched with a single "litp show -r" and
+            find() / get_props_from_url() are answered from that snapshot
+            until a command that changes the model is issued.
+"""
+from collections import namedtuple, OrderedDict
+import re
+
+LITP_PATH = '/usr/bin/litp'
+INHERITED_MARKER = ' [*]'
+
+# litp commands, and the litpd restart, after which the snapshot is stale
+MODEL_CHANGE_REGEX = re.compile(
+    r'(\blitp\s+(create|update|remove|inherit|load|run_plan|'
+    r'restore_model|prepare_restore|import|import_iso|upgrade|'
+    r'create_snapshot|remove_snapshot|restore_snapshot)\b)|\blitpd\b')
+
+ModelItem = namedtuple('ModelItem', ['path', 'type', 'state', 'properties'])
+
+
+def parse_show_output(lines):
+    """
+    Description:
+        Parse the output of "litp show -r" into model items. Property
+        values inherited from the source item are stripped of the " [*]"
+        marker
+    Args:
+        lines (list): The output lines
+    Return:
+        OrderedDict, ModelItem keyed by item path, in output order
+    """
+    items = OrderedDict()
+    path = None
+    attributes = {}
+    properties = OrderedDict()
+    section = None
+
+    def add_item():
+        """ Record the item parsed so far """
+        if path is not None:
+            items[path] = ModelItem(path, attributes.get('type'),
+                                    attributes.get('state'), properties)
+
+    for line in lines:
+        if line.startswith('/'):
+            add_item()
+            path = line.strip()
+            attributes = {}
+            properties = OrderedDict()
+            section = None
+            continue
+        if path is None or not line.strip():
+            continue
+        indent = len(line) - len(line.lstrip())
+        key, sep, value = line.strip().partition(':')
+        if not sep:
+            continue
+        value = value.strip()
+        if indent <= 4:
+            section = None if value else key
+            if value:
+                attributes[key] = value
+        elif section == 'properties':
+            if value.endswith(INHERITED_MARKER):
+                value = value[:-len(INHERITED_MARKER)]
+            properties[key] = value
+    add_item()
+    return items
+
+
+class ModelSnapshot(object):
+    """
+    The model tree as fetched at one point in time.
+    """
+
+    def __init__(self, lines):
+        """
+        Args:
+            lines (list): The output of "litp show -r"
+        """
+        self.items = parse_show_output(lines)
+        self.by_type = {}
+        for item in self.items.values():
+            self.by_type.setdefault(item.type, []).append(item.path)
+
+    def find(self, path, resource, rtn_type_children=True):
+        """
+        Description:
+            Find the items of a type under a path, in model order
+        Args:
+            path (str): The path to search from
+            resource (str): The item type
+            rtn_type_children (bool): Return the items of the type if True,
+                                      else the collections of that type
+        Return:
+            list, The paths found
+        """
+        if rtn_type_children:
+            types = [resource]
+        else:
+            types = ['collection-of-{0}'.format(resource),
+                     'ref-collection-of-{0}'.format(resource)]
+        prefix = path.rstrip('/') + '/'
+        found = set()
+        for item_type in types:
+            found.update(item for item in self.by_type.get(item_type, [])
+                         if item == path or item.startswith(prefix))
+        return [item for item in self.items if item in found]
+
+    def get_props(self, path):
+        """
+        Description:
+            Return the properties of an item
+        Args:
+            path (str): The item path
+        Return:
+            dict, The properties, or None if the item is not in the snapshot
+        """
+        item = self.items.get(path.rstrip('/') or '/')
+        if item is None:
+            return None
+        return dict(item.properties)
+
+
+class ModelCacheMixin(object):
+    """
+    Mixed into a GenericTest testset, before GenericTest, to answer
+    find() and get_props_from_url() calls with their default options from a
+    snapshot of the model.
+
+    The snapshot of a node is fetched on the first query and dropped when a
+    command that changes the model is run through run_command(), which the
+    execute_cli_*_cmd() helpers use, and when a plan is waited on.
+    Calls with options the snapshot does not support go to GenericTest.
+    """
+
+    def _model_snapshots(self):
+        """ Return the snapshots, keyed by node """
+        if not hasattr(self, '_model_snapshot_cache'):
+            self._model_snapshot_cache = {}
+            self.model_fetch_count = 0
+        return self._model_snapshot_cache
+
+    def get_model_snapshot(self, node):
+        """
+        Description:
+            Return the model snapshot of the node, fetching it if required
+        Args:
+            node (str): The MS filename
+        Return:
+            ModelSnapshot, The snapshot
+        """
+        snapshots = self._model_snapshots()
+        if node not in snapshots:
+            stdout, _, rcode = super(ModelCacheMixin, self).run_command(
+                node, '{0} show -p / -r'.format(LITP_PATH), logging=False)
+            self.assertEqual(0, rcode, 'Cannot read the model')
+            snapshots[node] = ModelSnapshot(stdout)
+            self.model_fetch_count += 1
+        return snapshots[node]
+
+    def invalidate_model_cache(self):
+        """ Drop the model snapshots so that the next query fetches again """
+        self._model_snapshots().clear()
+
+    def run_command(self, node, cmd, *args, **kwargs):
+        """ Run the command, dropping the snapshots if it changes the model """
+        if MODEL_CHANGE_REGEX.search(cmd):
+            self.invalidate_model_cache()
+        return super(ModelCacheMixin, self).run_command(node, cmd, *args,
+                                                        **kwargs)
+
+    def wait_for_plan_state(self, *args, **kwargs):
+        """ Wait on the plan; a running plan changes the model """
+        self.invalidate_model_cache()
+        try:
+            return super(ModelCacheMixin, self).wait_for_plan_state(*args,
+                                                                    **kwargs)
+        finally:
+            self.invalidate_model_cache()
+
+    def find(self, node, path, resource, rtn_type_children=True,
+             assert_not_empty=True, *args, **kwargs):
+        """ find() answered from the model snapshot """
+        if args or kwargs:
+            return super(ModelCacheMixin, self).find(
+                node, path, resource, rtn_type_children, assert_not_empty,
+                *args, **kwargs)
+        found = self.get_model_snapshot(node).find(path, resource,
+                                                   rtn_type_children)
+        if assert_not_empty:
+            self.assertNotEqual([], found,
+                'No items of type "{0}" found under "{1}"'
+                .format(resource, path))
+        return found
+
+    def get_props_from_url(self, node, url, filter_prop=None, *args,
+                           **kwargs):
+        """ get_props_from_url() answered from the model snapshot """
+        props = None
+        if not args and not kwargs:
+            props = self.get_model_snapshot(node).get_props(url)
+        if props is None:
+            return super(ModelCacheMixin, self).get_props_from_url(
+                node, url, filter_prop, *args, **kwargs)
+        if filter_prop:
+            return props.get(filter_prop)
+        return props
@@ -0,0 +1,140 @@
+"""
+COPYRIGHT Ericsson 2026
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     October 2026
+@author:    LITP Core Testware
+@summary:   Parallel per-node fan-out.
+            Runs a callable against every node at the same time and returns
+            the results keyed by node, with a timeout per node and all the
+            per-node failures reported together.
+"""
+import sys
+import threading
+import time
+import traceback
+
+
+class NodeFanOutError(AssertionError):
+    """
+    Raised when the callable failed or timed out on one or more nodes.
+    It is an AssertionError so that assertion failures raised on the nodes
+    are reported as test failures.
+    """
+
+    def __init__(self, errors, results):
+        """
+        Args:
+            errors (dict): Error description keyed by node
+            results (dict): Results of the nodes that succeeded
+        """
+        self.errors = errors
+        self.results = results
+        message = ['Failed on {0} node(s):'.format(len(errors))]
+        for node in sorted(errors):
+            message.append('--- {0} ---'.format(node))
+            message.append(errors[node])
+        super(NodeFanOutError, self).__init__('\n'.join(message))
+
+
+class NodeFanOut(object):
+    """
+    Thread based fan-out of a callable over a list of nodes.
+
+    The callable is invoked as func(node, *args, **kwargs). At most
+    max_workers nodes are processed at the same time. A node that does not
+    complete within timeout seconds is reported as failed and its thread is
+    abandoned, as Python threads cannot be interrupted.
+    """
+
+    def __init__(self, max_workers=16, timeout=300, poll_interval=0.05):
+        """
+        Args:
+            max_workers (int): Maximum number of nodes processed at once
+            timeout (int): Per node timeout in seconds
+            poll_interval (float): How often completion is checked, seconds
+        """
+        self.max_workers = max_workers
+        self.timeout = timeout
+        self.poll_interval = poll_interval
+        self.durations = {}
+
+    @staticmethod
+    def _call(outcome, node, func, args, kwargs):
+        """ Run the callable on one node and record its outcome """
+        try:
+            outcome[node] = (True, func(node, *args, **kwargs))
+        except Exception:  # pylint: disable=W0703
+            outcome[node] = (False, ''.join(
+                traceback.format_exception(*sys.exc_info())))
+
+    def run(self, func, nodes, *args, **kwargs):
+        """
+        Description:
+            Run the callable on every node in parallel
+        Args:
+            func (func): Callable that takes the node as first argument
+            nodes (list): The nodes to run the callable on
+            args, kwargs: Extra arguments passed to the callable
+        Return:
+            dict, The value returned by the callable keyed by node
+        Raises:
+            NodeFanOutError if the callable failed or timed out on any node
+        """
+        pending = list(nodes)
+        running = {}
+        outcome = {}
+        results = {}
+        errors = {}
+        self.durations = {}
+
+        while pending or running:
+            while pending and len(running) < self.max_workers:
+                node = pending.pop(0)
+                thread = threading.Thread(
+                    target=self._call,
+                    args=(outcome, node, func, args, kwargs),
+                    name='fanout-{0}'.format(node))
+                thread.daemon = True
+                running[node] = (thread, time.time())
+                thread.start()
+
+            time.sleep(self.poll_interval)
+            now = time.time()
+            for node, (thread, start_time) in running.items():
+                if not thread.is_alive():
+                    succeeded, value = outcome.get(
+                                        node, (False, 'No result returned'))
+                    if succeeded:
+                        results[node] = value
+                    else:
+                        errors[node] = value
+                elif now - start_time > self.timeout:
+                    errors[node] = 'Timeout after {0}s'.format(self.timeout)
+                else:
+                    continue
+                self.durations[node] = now - start_time
+                del running[node]
+
+        if errors:
+            raise NodeFanOutError(errors, results)
+        return results
+
+
+def run_on_nodes(func, nodes, *args, **kwargs):
+    """
+    Description:
+        Shortcut to run a callable on every node with the default fan-out
+        settings
+    Args:
+        func (func): Callable that takes the node as first argument
+        nodes (list): The nodes to run the callable on
+        args, kwargs: Extra arguments passed to the callable
+    Return:
+        dict, The value returned by the callable keyed by node
+    """
+    return NodeFanOut().run(func, nodes, *args, **kwargs)
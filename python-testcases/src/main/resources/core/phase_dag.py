@@ -0,0 +1,185 @@
+"""
+COPYRIGHT Ericsson 2026
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     October 2026
+@author:    LITP Core Testware
+@summary:   Phase dependency graph of a created plan.
+            The phases of the plan are linked by the clusters their tasks
+            belong to and by the cluster dependency_list properties, as the
+            phase order tree of the Execution Manager links them. The graph
+            gives the critical path of the plan and the maximum number of
+            phases that can run in parallel, to check the parallelism Celery
+            achieves against.
+"""
+from collections import OrderedDict
+import re
+
+CLUSTER_PATH_REGEX = re.compile(r'^(/deployments/[^/]+/clusters/[^/]+)')
+
+
+def cluster_id(cluster_path):
+    """ Return the id of a cluster path, e.g. c1 """
+    return cluster_path.rstrip('/').split('/')[-1]
+
+
+def parse_dependency_list(value):
+    """ Return the cluster ids of a dependency_list property value """
+    return set(dep.strip() for dep in (value or '').split(',') if dep.strip())
+
+
+class PhaseDag(object):
+    """
+    Directed acyclic graph of the phases of a plan.
+
+    A phase with the tasks of a single cluster runs after the earlier
+    phases of that cluster and of the clusters it depends on, directly or
+    through their own dependency_list. A phase with tasks of no cluster,
+    e.g. of the MS, or of several clusters runs after every earlier phase
+    and before every later one.
+    """
+
+    def __init__(self, phase_clusters, dependencies):
+        """
+        Args:
+            phase_clusters (dict): The cluster ids of the tasks of each
+                                   phase, keyed by phase number
+            dependencies (dict): The cluster ids each cluster depends on
+        """
+        self.phases = sorted(phase_clusters)
+        self.phase_clusters = dict((phase, set(clusters)) for phase, clusters
+                                   in phase_clusters.items())
+        self.dependencies = self._close(dependencies)
+        self.requires = OrderedDict((phase, set()) for phase in self.phases)
+        self.ancestors = OrderedDict()
+        for index, later in enumerate(self.phases):
+            ancestors = set()
+            for earlier in self.phases[:index]:
+                if self._depends(earlier, later):
+                    self.requires[later].add(earlier)
+                    ancestors.add(earlier)
+                    ancestors |= self.ancestors[earlier]
+            self.ancestors[later] = ancestors
+
+    @classmethod
+    def from_plan_model(cls, plan_model, dependencies):
+        """
+        Description:
+            Build the graph of a plan from the item paths of its tasks
+        Args:
+            plan_model (PlanModel): The created plan
+            dependencies (dict): The cluster ids each cluster depends on
+        Return:
+            PhaseDag, The phase graph
+        """
+        phase_clusters = {}
+        for phase, keys in plan_model.by_phase.items():
+            clusters = phase_clusters.setdefault(int(phase), set())
+            for key in keys:
+                for line in plan_model.task(*key).get('DESC', []):
+                    match = CLUSTER_PATH_REGEX.match(line)
+                    if match:
+                        clusters.add(cluster_id(match.group(1)))
+        return cls(phase_clusters, dependencies)
+
+    @staticmethod
+    def _close(dependencies):
+        """ Return the transitive closure of the cluster dependencies """
+        closed = dict((cluster, set(deps))
+                      for cluster, deps in dependencies.items())
+        changed = True
+        while changed:
+            changed = False
+            for deps in closed.values():
+                indirect = set()
+                for dep in deps:
+                    indirect |= closed.get(dep, set())
+                if not indirect <= deps:
+                    deps |= indirect
+                    changed = True
+        return closed
+
+    def _depends(self, earlier, later):
+        """ Return True if the later phase must wait for the earlier one """
+        earlier_clusters = self.phase_clusters[earlier]
+        later_clusters = self.phase_clusters[later]
+        if len(earlier_clusters) != 1 or len(later_clusters) != 1:
+            return True
+        earlier_cluster, = earlier_clusters
+        later_cluster, = later_clusters
+        return earlier_cluster == later_cluster or \
+            earlier_cluster in self.dependencies.get(later_cluster, ()) or \
+            later_cluster in self.dependencies.get(earlier_cluster, ())
+
+    def critical_path(self, durations=None):
+        """
+        Description:
+            Return the longest chain of dependent phases
+        Args:
+            durations (dict): The duration of each phase. Every phase
+                              counts for 1 if not given
+        Return:
+            tuple, The length of the path and its phases in order
+        """
+        finish = {}
+        previous = {}
+        for phase in self.phases:
+            start = 0
+            for required in self.requires[phase]:
+                if finish[required] > start:
+                    start = finish[required]
+                    previous[phase] = required
+            duration = durations.get(phase, 0) if durations else 1
+            finish[phase] = start + duration
+        if not finish:
+            return 0, []
+        phase = max(self.phases, key=lambda phase: finish[phase])
+        length = finish[phase]
+        path = [phase]
+        while phase in previous:
+            phase = previous[phase]
+            path.insert(0, phase)
+        return length, path
+
+    def max_parallelism_per_phase(self):
+        """
+        Description:
+            Return, for each phase, the number of phases that can run
+            alongside it, itself included
+        Return:
+            dict, The counts keyed by phase number
+        """
+        return dict((phase, 1 + sum(
+            1 for other in self.phases
+            if other != phase and other not in self.ancestors[phase] and
+            phase not in self.ancestors[other])) for phase in self.phases)
+
+    def max_parallelism(self):
+        """
+        Description:
+            Return the largest number of phases that can run at the same
+            time, the width of the graph. By Dilworth's theorem it is the
+            number of phases less the size of a maximum matching between
+            each phase and the phases that follow it
+        Return:
+            int, The maximum number of phases running in parallel
+        """
+        matched = {}
+
+        def augment(phase, seen):
+            """ Find an augmenting path from phase """
+            for later in self.phases:
+                if phase in self.ancestors[later] and later not in seen:
+                    seen.add(later)
+                    if later not in matched or \
+                            augment(matched[later], seen):
+                        matched[later] = phase
+                        return True
+            return False
+
+        matches = sum(1 for phase in self.phases if augment(phase, set()))
+        return len(self.phases) - matches
@@ -0,0 +1,239 @@
+"""
+COPYRIGHT Ericsson 2026
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     October 2026
+@author:    LITP Core Testware
+@summary:   Indexed plan object model.
+            The show_plan output is parsed once into a model indexed by task
+            state, item path, description line, description token and phase.
+            Models are cached by show_plan output so that every query on the
+            same plan reuses the same model.
+"""
+from collections import defaultdict
+import hashlib
+
+
+class PlanModel(object):
+    """
+    Indexed view of the plan dictionary returned by
+    CLIUtils.parse_plan_output().
+
+    Tasks are the task dictionaries of that plan, with the 'DESC' and
+    'STATUS' keys, so that results can be used like the parsed plan.
+    Queries return tasks in plan order, phase by phase.
+    """
+
+    def __init__(self, plan_d):
+        """
+        Args:
+            plan_d (dict): The plan as returned by parse_plan_output()
+        """
+        self.plan_d = plan_d
+        self.order = []
+        self.by_phase = defaultdict(list)
+        self.by_state = defaultdict(list)
+        self.by_path = defaultdict(list)
+        self.by_line = defaultdict(list)
+        self.by_token = defaultdict(set)
+
+        for phase in sorted(plan_d):
+            for task in sorted(plan_d[phase]):
+                key = (phase, task)
+                self.order.append(key)
+                self.by_phase[phase].append(key)
+                self.by_state[plan_d[phase][task].get('STATUS')].append(key)
+                for line in plan_d[phase][task].get('DESC', []):
+                    self.by_line[line].append(key)
+                    for token in line.split():
+                        self.by_token[token].add(key)
+                    if line.startswith('/'):
+                        self._index_path(line, key)
+        self._position = dict((key, pos) for pos, key in enumerate(self.order))
+
+    def _index_path(self, path, key):
+        """ Index the task under the item path and each of its ancestors """
+        parts = path.rstrip('/').split('/')
+        for depth in range(2, len(parts) + 1):
+            keys = self.by_path['/'.join(parts[:depth])]
+            if not keys or keys[-1] != key:
+                keys.append(key)
+
+    def _tasks(self, keys):
+        """ Return the task dictionaries of the keys, in plan order """
+        return [self.plan_d[phase][task] for phase, task in
+                sorted(keys, key=self._position.get)]
+
+    def task(self, phase, task):
+        """
+        Return:
+            dict, The task at the given phase and task number
+        """
+        return self.plan_d[phase][task]
+
+    def num_phases(self):
+        """
+        Return:
+            int, The number of phases in the plan
+        """
+        return len(self.by_phase)
+
+    def first_task(self):
+        """
+        Return:
+            dict, The task at the top of the plan
+        """
+        return self.task(*self.order[0])
+
+    def last_task(self):
+        """
+        Return:
+            dict, The task at the bottom of the plan
+        """
+        return self.task(*self.order[-1])
+
+    def _keys_with_text(self, text):
+        """
+        Return the keys of the tasks with a description line that contains
+        the text. Only the interior words of the text are certain to be
+        whole tokens, so they narrow the candidates down before the
+        substring check
+        """
+        candidates = set(self.order)
+        for word in text.split()[1:-1]:
+            candidates &= self.by_token.get(word, set())
+        return set(key for key in candidates
+                   if any(text in line for line in
+                          self.plan_d[key[0]][key[1]].get('DESC', [])))
+
+    def find_task_keys(self, state=None, node_path=None, description=None,
+                       phase=None):
+        """
+        Description:
+            Return the (phase, task) numbers of the tasks that match all the
+            given criteria
+        Args:
+            state (str): The task state, e.g. "Initial" or "Success"
+            node_path (str): Item path the task is for, or an ancestor of it
+            description (str): Text contained in a description line
+            phase (int): The phase number
+        Return:
+            list, The (phase, task) tuples in plan order
+        """
+        selections = []
+        if state:
+            selections.append(self.by_state.get(state, []))
+        if node_path:
+            selections.append(self.by_path.get(node_path.rstrip('/'), []))
+        if phase:
+            selections.append(self.by_phase.get(phase, []))
+        if description:
+            selections.append(self._keys_with_text(description))
+        keys = set(self.order)
+        for selected in selections:
+            keys &= set(selected)
+        return sorted(keys, key=self._position.get)
+
+    def find_tasks(self, state=None, node_path=None, description=None,
+                   phase=None):
+        """
+        Description:
+            Return the tasks that match all the given criteria
+        Args:
+            state (str): The task state, e.g. "Initial" or "Success"
+            node_path (str): Item path the task is for, or an ancestor of it
+            description (str): Text contained in a description line
+            phase (int): The phase number
+        Return:
+            list, The matching task dictionaries in plan order
+        """
+        return self._tasks(self.find_task_keys(state, node_path, description,
+                                               phase))
+
+    def find_tasks_with_lines(self, *lines):
+        """
+        Description:
+            Return the tasks that have every given line in their
+            description, e.g. the item path and the description text
+        Args:
+            lines (str): Complete description lines
+        Return:
+            list, The matching task dictionaries in plan order
+        """
+        keys = None
+        for line in lines:
+            selected = set(self.by_line.get(line, []))
+            keys = selected if keys is None else keys & selected
+        return self._tasks(keys or [])
+
+    def get_tasks_by_state(self, state):
+        """
+        Description:
+            Return the tasks in the given state
+        Args:
+            state (str): The task state
+        Return:
+            list, The task dictionaries in plan order
+        """
+        return self._tasks(self.by_state.get(state, []))
+
+
+class PlanModelCache(object):
+    """
+    Builds plan models from show_plan output. The model of the last output
+    is kept and returned as long as the output, and therefore the plan and
+    its task states, did not change.
+    """
+
+    def __init__(self, cli):
+        """
+        Args:
+            cli (CLIUtils): Used to parse the show_plan output
+        """
+        self.cli = cli
+        self._digest = None
+        self._model = None
+        self.build_count = 0
+
+    @staticmethod
+    def _output_digest(stdout):
+        """ Return a digest that identifies the show_plan output """
+        return hashlib.md5('\n'.join(stdout)).hexdigest()
+
+    def from_output(self, stdout):
+        """
+        Description:
+            Return the model of the given show_plan output
+        Args:
+            stdout (list): The show_plan output
+        Return:
+            PlanModel, The plan model
+        """
+        digest = self._output_digest(stdout)
+        if digest != self._digest:
+            self._model = PlanModel(self.cli.parse_plan_output(stdout))
+            self._digest = digest
+            self.build_count += 1
+        return self._model
+
+    def from_node(self, test, node):
+        """
+        Description:
+            Run show_plan on the MS and return the model of the plan
+        Args:
+            test (GenericTest): The test used to run show_plan
+            node (str): The MS filename
+        Return:
+            PlanModel, The plan model
+        """
+        stdout, _, _ = test.execute_cli_showplan_cmd(node)
+        return self.from_output(stdout)
+
+    def invalidate(self):
+        """ Drop the cached model """
+        self._digest = None
+        self._model = None
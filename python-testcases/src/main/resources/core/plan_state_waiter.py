@@ -0,0 +1,309 @@
+"""
+COPYRIGHT Ericsson 2026
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     October 2026
+@author:    LITP Core Testware
+@summary:   Shared plan state waiter.
+            Fetches the plan once per poll and hands the same plan data to
+            every condition that is waiting on it, so that several
+            conditions cost a single round trip per poll. With a REST
+            source the plan is read in one REST request.
+"""
+import re
+import time
+from collections import OrderedDict
+import test_constants as const
+
+REST_ROOT = '/litp/rest/v1'
+PLAN_REST_PATH = '/plans/plan'
+RECURSE_QUERY = '?recurse=true'
+CLUSTER_REGEX = re.compile(r'/clusters/([^/]+)')
+
+# Plan states as reported by REST mapped to the test_constants codes
+# returned by GenericTest.get_current_plan_state()
+REST_PLAN_STATES = {'successful': const.PLAN_COMPLETE,
+                    'running': const.PLAN_IN_PROGRESS,
+                    'initial': const.PLAN_NOT_RUNNING,
+                    'failed': const.PLAN_FAILED,
+                    'stopped': const.PLAN_STOPPED,
+                    'stopping': const.PLAN_STOPPING,
+                    'invalid': const.PLAN_INVALID}
+
+
+def wait_for_condition(test, condition, timeout, poll_interval):
+    """
+    Description:
+        Wait for specified condition to be met
+    Args:
+        test (GenericTest): The test used for logging and assertions
+        condition (func): The logic to apply to verify the condition
+        timeout (int): Timeout in seconds
+        poll_interval (int): The interval between polls in seconds
+    Return:
+        Data that describe how the condition has been met as returned by
+        the call to condition() function
+    """
+    start_time = time.time()
+    while True:
+        iteration_start_time = time.time()
+        elapsed_time = int(iteration_start_time - start_time)
+        test.assertTrue(elapsed_time < timeout,
+            'Timeout reached while waiting for "{0}"'
+            .format(condition.__name__))
+
+        test.log('info',
+        'Waiting for condition "{0}" to be met. Remaining time: {1}s'
+        .format(condition.__name__, int(timeout - elapsed_time)))
+
+        result = condition()
+        if result:
+            return result
+
+        sleep_time = poll_interval - (time.time() - iteration_start_time)
+        if sleep_time > 0:
+            time.sleep(sleep_time)
+
+
+class RestPlanSource(object):
+    """
+    Reads the plan resource from the LITP REST interface with RestUtils.
+    The whole plan, its phases and their tasks, is read in one request and
+    converted to the structure returned by GenericTest.get_plan_data()
+    """
+
+    def __init__(self, rest):
+        """
+        Args:
+            rest (RestUtils): The REST client of the MS
+        """
+        self.rest = rest
+        self.request_count = 0
+
+    def get(self, path):
+        """
+        Description:
+            Issue a GET request on the LITP REST interface
+        Args:
+            path (str): The REST path to read
+        Return:
+            tuple, HTTP status and the decoded JSON body (None if the body
+                   is not valid JSON)
+        """
+        stdout, _, status = self.rest.get(path)
+        self.request_count += 1
+        body, errors = self.rest.get_json_response(stdout)
+        return status, None if errors else body
+
+    def get_plan_state(self):
+        """
+        Description:
+            Read the state of the current plan
+        Return:
+            int, The plan state as one of the test_constants PLAN_* codes
+                 or None if no plan exists
+        """
+        status, body = self.get(PLAN_REST_PATH)
+        if status != 200 or not body:
+            return None
+        state = body.get('properties', {}).get('state', '')
+        return REST_PLAN_STATES.get(state.lower())
+
+    @staticmethod
+    def _task_group(item_path):
+        """ Return the cluster id of an item, else its top level path """
+        match = CLUSTER_REGEX.search(item_path)
+        if match:
+            return match.group(1)
+        return item_path.strip('/').split('/')[0]
+
+    def get_plan(self):
+        """
+        Description:
+            Read the whole plan in one request
+        Return:
+            dict, The plan 'state' and the tasks of every phase grouped by
+                  cluster, with their 'desc', 'url' and 'state', as
+                  returned by get_plan_data(). Empty if no plan exists
+        """
+        status, body = self.get(PLAN_REST_PATH + RECURSE_QUERY)
+        if status != 200 or not body:
+            return {}
+        plan = {'state': body.get('properties', {}).get('state', ''),
+                'phases': {}}
+        for phases in body.get('_embedded', {}).get('item', []):
+            for phase in phases.get('_embedded', {}).get('item', []):
+                clusters = plan['phases'].setdefault(str(phase['id']), {})
+                for tasks in phase.get('_embedded', {}).get('item', []):
+                    for task in tasks.get('_embedded', {}).get('item', []):
+                        href = task.get('_links', {}).get(
+                            'item', {}).get('href', '')
+                        item_path = href.partition(REST_ROOT)[2] or href
+                        clusters.setdefault(
+                            self._task_group(item_path), []).append(
+                                {'desc': task.get('description'),
+                                 'url': item_path,
+                                 'state': task.get('state')})
+        return plan
+
+
+class PlanStateWaiter(object):
+    """
+    Waits on several plan conditions with one plan fetch per poll.
+
+    Conditions are callables that take the plan data as their only argument
+    and return a truthy value describing how the condition was met, or a
+    falsy value if it is not met yet. Every subscribed condition is evaluated
+    against the same fetched plan and the first truthy result of each
+    condition is kept until it is collected with wait_for().
+    """
+
+    def __init__(self, test, node, fetch_plan=None, plan_source=None):
+        """
+        Args:
+            test (GenericTest): The test used for logging and assertions
+            node (str): The MS filename
+            fetch_plan (func): Returns the plan data. Defaults to the
+                               get_plan() of the REST source if given,
+                               else to test.get_plan_data(node)
+            plan_source (RestPlanSource): Optional REST source the plan
+                                          and its state are read from
+        """
+        self.test = test
+        self.node = node
+        if fetch_plan is None and plan_source is not None:
+            fetch_plan = plan_source.get_plan
+        self.fetch_plan = fetch_plan or (lambda: test.get_plan_data(node))
+        self.plan_source = plan_source
+        self._conditions = OrderedDict()
+        self._results = {}
+        self.last_plan = None
+        self.fetch_count = 0
+
+    def subscribe(self, condition, name=None):
+        """
+        Description:
+            Register a condition to be evaluated at every poll
+        Args:
+            condition (func): Callable that takes the plan data
+            name (str): Name of the condition. Defaults to the function name
+        Return:
+            str, The name under which the condition has been registered
+        """
+        name = name or condition.__name__
+        self._conditions[name] = condition
+        self._results.pop(name, None)
+        return name
+
+    def unsubscribe(self, name):
+        """
+        Description:
+            Stop evaluating a condition and discard any pending result
+        Args:
+            name (str): Name of the condition
+        """
+        self._conditions.pop(name, None)
+        self._results.pop(name, None)
+
+    def poll(self):
+        """
+        Description:
+            Fetch the plan once and evaluate every pending condition
+        Return:
+            dict, The fetched plan data
+        """
+        plan = self.fetch_plan()
+        self.fetch_count += 1
+        self.last_plan = plan
+        for name, condition in self._conditions.items():
+            if name in self._results:
+                continue
+            result = condition(plan)
+            if result:
+                self._results[name] = result
+        return plan
+
+    def _pending(self, names):
+        """ Return the names in the list that have not been met yet """
+        return [name for name in names if name not in self._results]
+
+    def wait_for(self, names, timeout, poll_interval=1):
+        """
+        Description:
+            Wait until all the given conditions have been met
+        Args:
+            names (str|list): Name, or list of names, of subscribed
+                              conditions
+            timeout (int): Timeout in seconds
+            poll_interval (int): The interval between polls in seconds
+        Return:
+            The result of the condition if a single name is given, else a
+            dict of results keyed by condition name. Collected results are
+            removed from the waiter along with their conditions.
+        """
+        single = isinstance(names, basestring)
+        if single:
+            names = [names]
+
+        def conditions_met():
+            """ Poll the plan unless all conditions are already met """
+            if self._pending(names):
+                self.poll()
+            return not self._pending(names)
+        conditions_met.__name__ = ', '.join(names)
+
+        wait_for_condition(self.test, conditions_met, timeout, poll_interval)
+
+        results = dict((name, self._results[name]) for name in names)
+        for name in names:
+            self.unsubscribe(name)
+        if single:
+            return results[names[0]]
+        return results
+
+    def wait_for_condition(self, condition, timeout, poll_interval=1):
+        """
+        Description:
+            Subscribe a single condition and wait for it to be met
+        Args:
+            condition (func): Callable that takes the plan data
+            timeout (int): Timeout in seconds
+            poll_interval (int): The interval between polls in seconds
+        Return:
+            The result of the condition
+        """
+        name = self.subscribe(condition)
+        return self.wait_for(name, timeout, poll_interval)
+
+    def wait_for_plan_state(self, expected_state, timeout, poll_interval=1):
+        """
+        Description:
+            Wait for the plan to reach the given state. The state is read
+            over the REST source when one is available so that no plan data
+            is fetched, otherwise with get_current_plan_state()
+        Args:
+            expected_state (int): The expected plan state, one of the
+                                  test_constants PLAN_* codes
+            timeout (int): Timeout in seconds
+            poll_interval (int): The interval between polls in seconds
+        Return:
+            bool, True once the state is reached
+        """
+        if self.plan_source is not None:
+            read_state = self.plan_source.get_plan_state
+        else:
+            read_state = lambda: self.test.get_current_plan_state(self.node)
+
+        def plan_state_reached():
+            """ Compare the current plan state with the expected one """
+            return read_state() == expected_state
+        plan_state_reached.__name__ = 'plan state "{0}"'.format(
+                                                            expected_state)
+        return wait_for_condition(self.test,
+                                  plan_state_reached,
+                                  timeout,
+                                  poll_interval)
@@ -0,0 +1,209 @@
+"""
+COPYRIGHT Ericsson 2026
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     October 2026
+@author:    LITP Core Testware
+@summary:   Plan execution timeline.
+            The start and end times of the phases of a plan are taken from
+            the [LITP][PLAN][Run][PhaseN] TimeTaken metrics, and those of
+            the tasks from the state changes seen by a PlanStateWaiter.
+            The timeline gives the parallelism and idle time of the plan and
+            is exported in the Chrome trace event format, which
+            chrome://tracing and Perfetto display.
+"""
+from collections import namedtuple, OrderedDict
+import calendar
+import json
+import re
+import time
+from metrics_log import PHASE_REGEX, PLAN_RUN
+
+Span = namedtuple('Span', ['name', 'category', 'lane', 'start', 'end'])
+
+TASK_RUNNING = 'Running'
+TASK_DONE_STATES = ('Success', 'Failed', 'Stopped')
+PLAN_RUNNING_STATES = ('running', 'stopping')
+
+
+def phase_number(phase):
+    """ Return the number of a phase, e.g. 3 for "[Phase3]" or "3" """
+    return int(re.findall(r'\d+', str(phase))[-1])
+
+
+class PlanTimeline(object):
+    """
+    Spans of time of the phases and tasks of one plan run.
+
+    Phase spans come from the metrics log, where the phase TimeTaken is
+    logged when the phase ends. Task spans come from the plan data polls of
+    a PlanStateWaiter: a task starts at the poll that first sees it running
+    and ends at the poll that first sees it done, so they are only as
+    precise as the poll interval. The two sources use the clocks of the MS
+    and of the test host, so each timeline is built from one of them.
+    """
+
+    def __init__(self):
+        self.spans = []
+        self._task_starts = {}
+        self._done_tasks = set()
+        self._last_poll = None
+        self.poll_count = 0
+
+    @classmethod
+    def from_metrics(cls, metrics_log, plan=None):
+        """
+        Description:
+            Build the phase spans of a plan run from the metrics log
+        Args:
+            metrics_log (MetricsLog): The parsed metrics log
+            plan (int): The plan sequence number. Defaults to the last one
+        Return:
+            PlanTimeline, The timeline of the phases
+        """
+        timeline = cls()
+        if plan is None and metrics_log.plans():
+            plan = metrics_log.plans()[-1]
+        for record in metrics_log.select(PLAN_RUN, 'TimeTaken', plan,
+                                         prefix=True):
+            if not record.valid or record.timestamp is None or \
+                    not PHASE_REGEX.match(record.operation):
+                continue
+            end = calendar.timegm(record.timestamp.timetuple()) + \
+                record.timestamp.microsecond / 1e6
+            number = phase_number(record.operation)
+            timeline.spans.append(Span('Phase {0}'.format(number), 'phase',
+                                       number, end - record.value, end))
+        return timeline
+
+    def observe(self, plan):
+        """
+        Description:
+            Record the task state changes of a plan poll. Subscribe this
+            method to a PlanStateWaiter to build the timeline from the polls
+            the test already makes
+        Args:
+            plan (dict): Plan data as returned by get_plan_data()
+        Return:
+            PlanTimeline, The timeline once the plan is no longer running,
+                          else None
+        """
+        now = time.time()
+        previous = self._last_poll if self._last_poll is not None else now
+        self._last_poll = now
+        self.poll_count += 1
+
+        for phase, clusters in plan.get('phases', {}).iteritems():
+            for cluster, tasks in clusters.iteritems():
+                for task in tasks:
+                    key = (phase, cluster, task.get('url'), task.get('desc'))
+                    if key in self._done_tasks:
+                        continue
+                    state = task.get('state')
+                    if state == TASK_RUNNING:
+                        self._task_starts.setdefault(key, now)
+                    elif state in TASK_DONE_STATES:
+                        # A task that started and ended between two polls
+                        # is given the whole interval
+                        start = self._task_starts.pop(key, previous)
+                        self._done_tasks.add(key)
+                        self.spans.append(Span(task.get('desc'), cluster,
+                                               phase_number(phase), start,
+                                               now))
+
+        if plan.get('state') in PLAN_RUNNING_STATES:
+            return None
+        return self
+
+    def select(self, category=None):
+        """
+        Description:
+            Return the spans of a category
+        Args:
+            category (str): 'phase', or the cluster of the tasks. All the
+                            spans if None
+        Return:
+            list, The spans ordered by start time
+        """
+        return sorted((span for span in self.spans
+                       if category is None or span.category == category),
+                      key=lambda span: (span.start, span.end))
+
+    @staticmethod
+    def parallelism(spans):
+        """
+        Description:
+            Measure how much the spans overlap
+        Args:
+            spans (list): The spans to measure
+        Return:
+            dict, 'wall_time' from the first start to the last end,
+                  'busy_time' while at least one span runs, 'idle_time'
+                  while none runs, 'max_concurrency' and the average
+                  concurrency while busy, 'avg_concurrency'
+        """
+        if not spans:
+            return {'wall_time': 0.0, 'busy_time': 0.0, 'idle_time': 0.0,
+                    'max_concurrency': 0, 'avg_concurrency': 0.0}
+        events = sorted([(span.start, 1) for span in spans] +
+                        [(span.end, -1) for span in spans])
+        running = max_running = 0
+        busy_time = 0.0
+        previous = events[0][0]
+        for moment, change in events:
+            if running:
+                busy_time += moment - previous
+            running += change
+            max_running = max(max_running, running)
+            previous = moment
+        wall_time = events[-1][0] - events[0][0]
+        span_time = sum(span.end - span.start for span in spans)
+        return {'wall_time': wall_time,
+                'busy_time': busy_time,
+                'idle_time': wall_time - busy_time,
+                'max_concurrency': max_running,
+                'avg_concurrency': span_time / busy_time if busy_time
+                                   else 0.0}
+
+    def to_chrome_trace(self):
+        """
+        Description:
+            Convert the spans to Chrome trace "complete" events. Phases are
+            one row each in the "phases" process, tasks get a process per
+            cluster and a row per phase
+        Return:
+            dict, The trace, ready to be written as JSON
+        """
+        if not self.spans:
+            return {'traceEvents': [], 'displayTimeUnit': 'ms'}
+        origin = min(span.start for span in self.spans)
+        pids = OrderedDict()
+        events = []
+        for span in self.select():
+            process = 'phases' if span.category == 'phase' \
+                else span.category
+            if process not in pids:
+                pids[process] = len(pids) + 1
+                events.append(OrderedDict([
+                    ('name', 'process_name'), ('ph', 'M'),
+                    ('pid', pids[process]), ('args', {'name': process})]))
+            events.append(OrderedDict([
+                ('name', span.name), ('cat', span.category), ('ph', 'X'),
+                ('ts', int((span.start - origin) * 1e6)),
+                ('dur', int((span.end - span.start) * 1e6)),
+                ('pid', pids[process]), ('tid', span.lane)]))
+        return {'traceEvents': events, 'displayTimeUnit': 'ms'}
+
+    def dump(self, path):
+        """
+        Description:
+            Write the timeline to a Chrome trace JSON file
+        Args:
+            path (str): The file to write
+        """
+        with open(path, 'w') as trace_file:
+            json.dump(self.to_chrome_trace(), trace_file, indent=1)
@@ -0,0 +1,52 @@
+##############################################################################
+# COPYRIGHT Ericsson AB 2026
+#
+# The copyright to the computer program(s) herein is the property of
+# Ericsson AB. The programs may be used and/or copied only with written
+# permission from Ericsson AB. or in accordance with the terms and
+# conditions stipulated in the agreement/contract under which the
+# program(s) have been supplied.
+##############################################################################
+'''Plan scale Extension'''
+from litp.core.model_type import ItemType, Property, PropertyType
+from litp.core.extension import ModelExtension
+
+
+class PlanScaleExtension(ModelExtension):
+    """
+    Plan scale Model Extension
+    """
+
+    def define_property_types(self):
+        property_types = []
+        property_types.append(
+            PropertyType("plan_scale_task_kinds",
+                         regex=r"^(config|callback|remote)"
+                               r"(,(config|callback|remote))*$"))
+        property_types.append(PropertyType("plan_scale_count",
+                                           regex=r"^[0-9]{1,4}$"))
+        return property_types
+
+    def define_item_types(self):
+        return [
+            ItemType("plan-scale-item",
+                     extend_item="software-item",
+                     item_description="Item generating a configurable "
+                                      "number of tasks per node",
+                     task_kinds=Property(
+                         "plan_scale_task_kinds",
+                         prop_description="Kinds of task generated per "
+                                          "node",
+                         default="config,callback,remote"),
+                     ordered_depth=Property(
+                         "plan_scale_count",
+                         prop_description="Number of ConfigTasks chained "
+                                          "in an OrderedTaskList",
+                         default="1"),
+                     fan_in=Property(
+                         "plan_scale_count",
+                         prop_description="Number of previous items on the "
+                                          "node whose tasks are required",
+                         default="0"),
+            ),
+        ]
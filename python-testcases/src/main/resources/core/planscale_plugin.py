@@ -0,0 +1,116 @@
+##############################################################################
+# COPYRIGHT Ericsson AB 2026
+#
+# The copyright to the computer program(s) herein is the property of
+# Ericsson AB. The programs may be used and/or copied only with written
+# permission from Ericsson AB. or in accordance with the terms and
+# conditions stipulated in the agreement/contract under which the
+# program(s) have been supplied.
+##############################################################################
+
+from litp.core.plugin import Plugin
+from litp.core.task import ConfigTask, CallbackTask, RemoteExecutionTask
+from litp.core.task import OrderedTaskList
+
+from litp.core.litp_logging import LitpLogger
+log = LitpLogger()
+
+
+class PlanScalePlugin(Plugin):
+    """
+    LITP plan scale plugin
+
+    Generates a synthetic load for create_plan benchmarks. For every
+    plan-scale-item inherited on a node it emits, per task kind:
+      - config: ordered_depth ConfigTasks, chained in an OrderedTaskList
+        when there is more than one
+      - callback: one CallbackTask
+      - remote: one RemoteExecutionTask
+    The first task of an item requires the first task of each of the
+    fan_in items before it on the same node.
+    """
+
+    def validate_model(self, plugin_api_context):
+        """
+        No validation, the property types of the extension are enough
+        """
+        return []
+
+    def cb_do_nothing(self, cb_api, *args, **kwargs):
+        pass
+
+    def _item_tasks(self, node, item):
+        """
+        Return the tasks of one item on a node, and the entry task that the
+        tasks of the following items require
+        """
+        kinds = item.task_kinds.split(',')
+        tasks = []
+        if 'config' in kinds:
+            config_tasks = [
+                ConfigTask(
+                    node,
+                    item,
+                    "Nilpotent ConfigTask {0} of {1}".format(
+                        index, item.item_id),
+                    "notify", "{0}_{1}".format(item.item_id, index),
+                )
+                for index in range(max(1, int(item.ordered_depth)))
+            ]
+            if len(config_tasks) > 1:
+                tasks.append(OrderedTaskList(item, config_tasks))
+            else:
+                tasks.extend(config_tasks)
+            entry_task = config_tasks[0]
+        if 'callback' in kinds:
+            tasks.append(CallbackTask(
+                item,
+                "Nilpotent CallbackTask of {0}".format(item.item_id),
+                self.cb_do_nothing,
+                node.hostname,
+            ))
+        if 'remote' in kinds:
+            tasks.append(RemoteExecutionTask(
+                [node],
+                item,
+                "Nilpotent RemoteExecutionTask of {0}".format(item.item_id),
+                "rpcutil",
+                "ping",
+            ))
+        if 'config' not in kinds:
+            entry_task = tasks[0]
+        return tasks, entry_task
+
+    def create_configuration(self, plugin_api_context):
+        """
+        Plugin can provide tasks based on the model ...
+
+        *Example CLI for this plugin:*
+
+        .. code-block:: bash
+
+            litp create -t plan-scale-item -p /software/items/scale1 \
+-o task_kinds=config,remote ordered_depth=3 fan_in=2
+            litp inherit -p /ms/items/scale1 -s /software/items/scale1
+        """
+        tasks = []
+
+        nodes = plugin_api_context.query("node") + \
+                [plugin_api_context.query_by_vpath("/ms")]
+        for node in nodes:
+            items = sorted(node.query("plan-scale-item"),
+                           key=lambda item: item.item_id)
+            entry_tasks = []
+            for item in items:
+                if item.is_for_removal():
+                    continue
+                item_tasks, entry_task = self._item_tasks(node, item)
+                fan_in = int(item.fan_in)
+                if fan_in:
+                    for required in entry_tasks[-fan_in:]:
+                        entry_task.requires.add(required)
+                entry_tasks.append(entry_task)
+                tasks.extend(item_tasks)
+
+        log.trace.debug("PLAN SCALE TASKS: {0}".format(len(tasks)))
+        return tasks
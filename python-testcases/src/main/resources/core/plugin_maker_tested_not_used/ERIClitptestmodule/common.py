@@ -9,6 +9,9 @@
 ##############################################################################
 
 from litp.core.task import RemoteExecutionTask
+from plugin_query_index import QueryIndex
+
+_INDEX_ATTRIBUTE = '_test_module_query_index'
 
 
 def get_name(model_item):
@@ -52,14 +55,25 @@ def get_rpc_task(nodes, model_item, agent, action, description, **kwargs):
     )
 
 
+def get_query_index(plugin_api_context, refresh=False):
+    """
+    return the index of the nodes and test-module items of the model, built
+    once per create_configuration call with refresh set
+    """
+
+    index = getattr(plugin_api_context, _INDEX_ATTRIBUTE, None)
+    if index is None or refresh:
+        index = QueryIndex(plugin_api_context, ['test-module'])
+        setattr(plugin_api_context, _INDEX_ATTRIBUTE, index)
+
+    return index
+
+
 def get_nodes(plugin_api_context, return_only=None, include_ms=False,
             hostnames=None):
     """get nodes from the model"""
 
-    nodes = list()
-    nodes.extend(plugin_api_context.query('node'))
-    if include_ms:
-        nodes.extend(plugin_api_context.query('ms'))
+    nodes = get_query_index(plugin_api_context).get_nodes(include_ms)
     if return_only:
         if return_only == len(nodes):
             return nodes
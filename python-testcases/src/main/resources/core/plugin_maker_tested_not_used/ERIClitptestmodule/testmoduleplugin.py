@@ -11,6 +11,7 @@
 import os
 import imp
 from litp.core.plugin import Plugin
+import src.testmodule_plugin.common as common
 #from litp.core.validators import ValidationError
 
 from litp.core.litp_logging import LitpLogger
@@ -54,11 +55,13 @@ class TestModulePlugin(Plugin):
 
         return cls
 
-    def _query(self, plugin_api_context):
+    def _query(self, plugin_api_context, refresh=False):
         """queries the model for any test-module item in the tree"""
 
-        # query for all items of item type test-module
-        modelitems = plugin_api_context.query('test-module')
+        # query for all items of item type test-module, the model is only
+        # traversed again when refresh is set
+        modelitems = common.get_query_index(
+            plugin_api_context, refresh).items('test-module')
         if not modelitems:
             return []
         # get a set of unique story IDs that are in the model for test
@@ -86,7 +89,7 @@ class TestModulePlugin(Plugin):
         """
 
         tasks = list()
-        self._query(plugin_api_context)
+        self._query(plugin_api_context, refresh=True)
         # for each story create a new plugin (if one doesn't already exist)
         for story_id in TestModulePlugin._stories.keys():
             cls = self._make_class(story_id)
@@ -0,0 +1,114 @@
+##############################################################################
+# COPYRIGHT Ericsson AB 2026
+#
+# The copyright to the computer program(s) herein is the property of
+# Ericsson AB. The programs may be used and/or copied only with written
+# permission from Ericsson AB. or in accordance with the terms and
+# conditions stipulated in the agreement/contract under which the
+# program(s) have been supplied.
+##############################################################################
+'''Index of the query items a test plugin works on'''
+
+
+class QueryIndex(object):
+    """
+    Query items of the given item types, queried once from the plugin API
+    context and indexed by item type, name and owning node.
+
+    Build one index per create_configuration() call and use it instead of
+    calling node.query() for every node and item: the items of a node are
+    the items whose path is under the path of the node, so each item type
+    is queried once whatever the number of nodes.
+    """
+
+    def __init__(self, plugin_api_context, item_types):
+        """
+        Args:
+            plugin_api_context (PluginApiContext): The plugin API context
+            item_types (list): The item types to index
+        """
+        self.nodes = list(plugin_api_context.query('node'))
+        self.ms = list(plugin_api_context.query('ms'))
+        self._node_paths = dict((node.get_vpath(), node)
+                                for node in self.nodes + self.ms)
+        self._by_type = {}
+        self._by_name = {}
+        self._by_node = {}
+        self._by_source = {}
+        for item_type in item_types:
+            items = list(plugin_api_context.query(item_type))
+            self._by_type[item_type] = items
+            for item in items:
+                self._index_item(item_type, item)
+
+    def _owner(self, vpath):
+        """ Return the path of the node or ms the path is under, if any """
+        parts = vpath.split('/')
+        for depth in range(2, len(parts)):
+            path = '/'.join(parts[:depth])
+            if path in self._node_paths:
+                return path
+        return None
+
+    def _index_item(self, item_type, item):
+        """ Index one item by name, owning node and source """
+        self._by_name.setdefault((item_type, getattr(item, 'name', None)),
+                                 []).append(item)
+        owner = self._owner(item.get_vpath())
+        if owner is None:
+            return
+        self._by_node.setdefault((item_type, owner), []).append(item)
+        source = item.get_source()
+        if source is not None:
+            self._by_source.setdefault(
+                (item_type, owner, source.get_vpath()), []).append(item)
+
+    def get_nodes(self, include_ms=False):
+        """
+        Return:
+            list, The nodes, followed by the ms if include_ms is set
+        """
+        if include_ms:
+            return self.nodes + self.ms
+        return list(self.nodes)
+
+    def items(self, item_type, name=None):
+        """
+        Description:
+            Return the items of a type, as plugin_api_context.query() does
+        Args:
+            item_type (str): The item type
+            name (str): Only the items with this name property
+        Return:
+            list, The items
+        """
+        if name is None:
+            return self._by_type.get(item_type, [])
+        return self._by_name.get((item_type, name), [])
+
+    def node_items(self, node, item_type):
+        """
+        Description:
+            Return the items of a type under a node, as node.query() does
+        Args:
+            node (QueryItem): The node or ms
+            item_type (str): The item type
+        Return:
+            list, The items
+        """
+        return self._by_node.get((item_type, node.get_vpath()), [])
+
+    def references(self, node, item_type, source):
+        """
+        Description:
+            Return the items of a type under a node inherited from a source
+            item
+        Args:
+            node (QueryItem): The node or ms
+            item_type (str): The item type
+            source (QueryItem): The source item
+        Return:
+            list, The inherited items
+        """
+        return self._by_source.get(
+            (item_type, node.get_vpath(), source.get_vpath()), [])
@@ -0,0 +1,37 @@
+#!/bin/bash
+#set -x
+
+## Builds the plugins and extensions whose modules are kept in the testware
+## directory rather than only in their rpms. Each module listed is copied
+## from the testware directory into the package, under the name after "=",
+## so modules shared by several plugins have a single source. Each rpm is
+## written over the one at its path in the testware directory.
+
+base=~/rpmbuild
+testware=$(cd $(dirname $0)/../.. && pwd)
+
+## rpm|package name|conf section|package dir|conf name|conf class|modules
+while IFS='|' read rpm packagename section storypluginname confname confclass modules;
+do
+    [ -z "${rpm}" ] && continue
+
+    rm -rf ${base}/SOURCES/${storypluginname}
+    mkdir -p ${base}/SOURCES/${storypluginname}
+    for module in ${modules};
+    do
+        cp ${testware}/${module%=*} ${base}/SOURCES/${storypluginname}/${module#*=}
+    done
+
+    rpmbuild -bb --target noarch --define "_package_name ${packagename}" --define "_conf_section ${section}" --define "_story_plugin_name ${storypluginname}" --define "_conf_name ${confname}" --define "_conf_class ${confclass}" ${base}/SPECS/testwaremodules.spec
+
+    cp $(ls -t ${base}/RPMS/noarch/ERIClitp${packagename}_CXP1234567-*.noarch.rpm | head -1) ${testware}/${rpm}
+done <<MODULES
+plugins/ERIClitpplanscale.rpm|planscale|plugin|planscale_plugin|planscale|planscale_plugin.planscale_plugin.PlanScalePlugin|planscale_plugin.py=planscale_plugin.py
+plugins/ERIClitpplanscaleapi.rpm|planscaleapi|extension|planscale_extension|planscale_extension|planscale_extension.planscale_extension.PlanScaleExtension|planscale_extension.py=planscale_extension.py
+plugins/ERIClitpstory1838.rpm|story1838|plugin|story1838_plugin|story1838|story1838_plugin.story1838_plugin.Story1838Plugin|story1838_plugin.py=story1838_plugin.py plugin_query_index.py=plugin_query_index.py rpc_task_grouping.py=rpc_task_grouping.py
+plugins/ERIClitpstory4429.rpm|story4429|plugin|story4429_plugin|story4429|story4429_plugin.story4429_plugin.Story4429Plugin|story4429_plugin.py=story4429_plugin.py plugin_query_index.py=plugin_query_index.py
+plugins/ERIClitpstory10575.rpm|story10575|plugin|story10575_plugin|story10575|story10575_plugin.story10575plugin.Story10575Plugin|story10575plugin.py=story10575plugin.py plugin_query_index.py=plugin_query_index.py
+plugins/ERIClitpmockpackagerpc.rpm|mockpackagerpc|plugin|mockpackagerpc_plugin|mockpackagerpc|mockpackagerpc_plugin.mockpackagerpc_plugin.mockpackagerpcPlugin|mockpackagerpc_plugin_story1575.py=mockpackagerpc_plugin.py rpc_task_grouping.py=rpc_task_grouping.py
+plugins/ERIClitpstory2783_CXP1234567.rpm|story2783|plugin|story2783_plugin|story2783|story2783_plugin.story2783_plugin.Story2783Plugin|story2783_plugin.py=story2783_plugin.py unique_values.py=unique_values.py
+plugin_maker_tested_not_used/ERIClitptestmodule_CXP1234567.noarch.rpm|testmodule|plugin|testmodule_plugin|testmodule|testmodule_plugin.testmoduleplugin.TestModulePlugin|plugin_maker_tested_not_used/ERIClitptestmodule/common.py=common.py plugin_maker_tested_not_used/ERIClitptestmodule/story1838.py=story1838.py plugin_maker_tested_not_used/ERIClitptestmodule/testmoduleplugin.py=testmoduleplugin.py plugin_query_index.py=plugin_query_index.py
+MODULES
@@ -0,0 +1,35 @@
+%define build_timestamp %(date +"%Y%m%d%H%M")
+
+Name:           ERIClitp%{_package_name}_CXP1234567
+Release:        SNAPSHOT%{build_timestamp}
+Version:        1.0.1
+Summary:        LITP %{name} test package
+
+License:        2012 Ericsson AB All rights reserved
+URL:            www.ericsson.com
+
+%define _unpackaged_files_terminate_build 0
+%define _litp_dir opt/ericsson/nms/litp
+%define _litp_etc_conf_dir %{_litp_dir}/etc/%{_conf_section}s
+%define _litp_lib_plugin_dir %{_litp_dir}/lib/%{_story_plugin_name}
+
+%description
+%{summary}
+
+%install
+mkdir -p %{buildroot}/%{_litp_etc_conf_dir}
+mkdir -p %{buildroot}/%{_litp_lib_plugin_dir}
+printf '[%s]\nname=%s\nclass=%s\nversion=1.0.1-SNAPSHOT\n' %{_conf_section} %{_conf_name} %{_conf_class} > %{buildroot}/%{_litp_etc_conf_dir}/%{_story_plugin_name}.conf
+touch %{buildroot}/%{_litp_lib_plugin_dir}/__init__.py
+cp %{_sourcedir}/%{_story_plugin_name}/*.py %{buildroot}/%{_litp_lib_plugin_dir}
+
+
+%clean
+rm -rf $RPM_BUILD_ROOT
+
+
+%files
+%defattr(755,root,root,-)
+/%{_litp_etc_conf_dir}/%{_story_plugin_name}.conf
+%dir /%{_litp_lib_plugin_dir}
+/%{_litp_lib_plugin_dir}/*.py
@@ -0,0 +1,315 @@
+"""
+COPYRIGHT Ericsson 2026
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     October 2026
+@author:    LITP Core Testware
+@summary:   Streaming parser of the LITP generated puppet manifests.
+            A <node>.pp file is fetched once and tokenized line by line into
+            an index of class id -> class definition and resources, and of
+            class id -> required classes, so that any number of manifest
+            assertions cost one fetch per node.
+"""
+from collections import namedtuple, OrderedDict
+import os
+import re
+import test_constants as const
+
+CAT_PATH = '/bin/cat'
+
+CLASS_DEF_REGEX = re.compile(r'^class\s+([\w:]+)\s*\(')
+NODE_DEF_REGEX = re.compile(r'^node\s+["\']([^"\']+)["\']')
+CLASS_DECL_REGEX = re.compile(r'^\s*class\s*\{\s*["\']([^"\']+)["\']\s*:')
+RESOURCE_REGEX = re.compile(r'^\s*([\w:]+)\s*\{\s*["\']([^"\']*)["\']\s*:')
+ATTRIBUTE_REGEX = re.compile(r'^\s*(\w+)\s*=>\s*(.*?),?\s*$')
+CLASS_REF_REGEX = re.compile(r'Class\[\s*["\']([^"\']+)["\']\s*\]')
+
+ManifestClass = namedtuple('ManifestClass', ['name', 'start', 'end',
+                                             'resources'])
+ManifestResource = namedtuple('ManifestResource', ['type', 'title',
+                                                   'attributes'])
+
+
+def _brace_delta(line):
+    """ Return the change in brace depth, ignoring quoted braces """
+    delta = 0
+    quote = None
+    escaped = False
+    for char in line:
+        if escaped:
+            escaped = False
+        elif char == '\\':
+            escaped = True
+        elif quote:
+            if char == quote:
+                quote = None
+        elif char in '"\'':
+            quote = char
+        elif char == '{':
+            delta += 1
+        elif char == '}':
+            delta -= 1
+    return delta
+
+
+class PuppetManifest(object):
+    """
+    Index of a puppet manifest generated by LITP.
+
+    classes holds the "class task_...(){ }" definitions keyed by class id,
+    with the line range of the definition and the resources it declares.
+    requires holds the class ids each class requires, taken from the
+    require attribute of the class declarations in the node block and of
+    the resources in the class definition.
+    """
+
+    def __init__(self, lines):
+        """
+        Args:
+            lines (list): The lines of the manifest, blank lines included,
+                          as grep() counts its context in lines
+        """
+        self.lines = lines
+        self.classes = OrderedDict()
+        self.requires = OrderedDict()
+        self.node = None
+        self.declared = []
+        self._tokenize()
+
+    def _tokenize(self):
+        """ Build the indexes in a single pass over the lines """
+        depth = 0
+        current_class = None
+        start = None
+        resources = []
+        resource = None
+        owner = None
+        require_depth = 0
+
+        for index, line in enumerate(self.lines):
+            if depth == 0:
+                match = CLASS_DEF_REGEX.match(line)
+                if match:
+                    current_class = match.group(1)
+                    start = index
+                    resources = []
+                    owner = current_class
+                else:
+                    match = NODE_DEF_REGEX.match(line)
+                    if match:
+                        self.node = match.group(1)
+            elif require_depth > 0:
+                self._add_requires(owner, line)
+                require_depth += line.count('[') - line.count(']')
+            else:
+                decl = CLASS_DECL_REGEX.match(line)
+                header = None if decl else RESOURCE_REGEX.match(line)
+                attribute = None if decl or header else \
+                    ATTRIBUTE_REGEX.match(line)
+                if decl:
+                    owner = decl.group(1)
+                    self.declared.append(owner)
+                elif header:
+                    resource = ManifestResource(header.group(1),
+                                                header.group(2),
+                                                OrderedDict())
+                    resources.append(resource)
+                elif attribute:
+                    name, value = attribute.groups()
+                    if resource is not None and current_class:
+                        resource.attributes[name] = value
+                    if name == 'require' and owner:
+                        self._add_requires(owner, line)
+                        require_depth = line.count('[') - line.count(']')
+
+            depth += _brace_delta(line)
+            if depth <= 0:
+                depth = 0
+                if current_class is not None:
+                    self.classes.setdefault(
+                        current_class,
+                        ManifestClass(current_class, start, index + 1,
+                                      resources))
+                    current_class = None
+                owner = None
+                resource = None
+                require_depth = 0
+
+    def _add_requires(self, owner, line):
+        """ Record the classes referenced on the line as required """
+        required = self.requires.setdefault(owner, [])
+        for ref in CLASS_REF_REGEX.findall(line):
+            if ref not in required:
+                required.append(ref)
+
+    @classmethod
+    def from_node(cls, test, node, manifest_file,
+                  manifest_dir=const.PUPPET_MANIFESTS_DIR):
+        """
+        Description:
+            Fetch and parse a manifest with GenericTest.run_command()
+        Args:
+            test (GenericTest): The test used to read the file
+            node (str): The node the manifests are on, usually the MS
+            manifest_file (str): The manifest file name, e.g. "node1.pp"
+            manifest_dir (str): The directory of the manifests
+        Return:
+            PuppetManifest, or None if the manifest cannot be read
+        """
+        stdout, _, rcode = test.run_command(
+            node,
+            '{0} {1}'.format(CAT_PATH,
+                             os.path.join(manifest_dir, manifest_file)),
+            su_root=True, logging=False)
+        if rcode != 0:
+            return None
+        return cls(stdout)
+
+    def find_class(self, class_id):
+        """
+        Description:
+            Return the definition of the class with the given id, or of
+            the first class whose id contains it
+        Args:
+            class_id (str): The class id
+        Return:
+            ManifestClass, or None if no class matches
+        """
+        if class_id in self.classes:
+            return self.classes[class_id]
+        for name, definition in self.classes.items():
+            if class_id in name:
+                return definition
+        return None
+
+    def class_body(self, class_id):
+        """
+        Description:
+            Return the lines of the definition of a class
+        Args:
+            class_id (str): The class id, or part of it
+        Return:
+            list, The lines of the definition, empty if not found
+        """
+        definition = self.find_class(class_id)
+        if definition is None:
+            return []
+        return self.lines[definition.start:definition.end]
+
+    def get_requires(self, class_id):
+        """
+        Description:
+            Return the class ids a class requires
+        Args:
+            class_id (str): The class id
+        Return:
+            list, The required class ids
+        """
+        return self.requires.get(class_id, [])
+
+    def grep(self, pattern, before=0, after=0):
+        """
+        Description:
+            Search the manifest like "grep -B before -A after pattern".
+            Groups of lines that are not adjacent are separated by "--"
+        Args:
+            pattern (str): The regular expression to search for
+            before (int): Lines of leading context
+            after (int): Lines of trailing context
+        Return:
+            list, The matching lines with their context
+        """
+        regex = re.compile(pattern)
+        ranges = []
+        for index, line in enumerate(self.lines):
+            if not regex.search(line):
+                continue
+            first = max(0, index - before)
+            last = min(len(self.lines), index + after + 1)
+            if ranges and first <= ranges[-1][1]:
+                ranges[-1][1] = max(ranges[-1][1], last)
+            else:
+                ranges.append([first, last])
+
+        output = []
+        for first, last in ranges:
+            if output:
+                output.append('--')
+            output.extend(self.lines[first:last])
+        return output
+
+
+class ManifestReader(object):
+    """
+    Fetches several manifests from the MS in a single round trip over an
+    SSHSessionPool and keeps the parsed manifests until refresh().
+    """
+
+    def __init__(self, pool, node, manifest_dir=const.PUPPET_MANIFESTS_DIR):
+        """
+        Args:
+            pool (SSHSessionPool): The session pool used to reach the node
+            node (str): The node the manifests are on, usually the MS
+            manifest_dir (str): The directory of the manifests
+        """
+        self.pool = pool
+        self.node = node
+        self.manifest_dir = manifest_dir
+        self._manifests = {}
+        self.fetch_count = 0
+
+    def load(self, manifest_files):
+        """
+        Description:
+            Fetch the given manifests that are not loaded yet
+        Args:
+            manifest_files (list): Manifest file names, e.g. ["ms1.pp"]
+        Return:
+            dict, PuppetManifest keyed by file name, None for a manifest
+                  that cannot be read
+        """
+        missing = [name for name in manifest_files
+                   if name not in self._manifests]
+        if missing:
+            results = self.pool.run_commands(
+                self.node,
+                ['{0} {1}'.format(CAT_PATH,
+                                  os.path.join(self.manifest_dir, name))
+                 for name in missing],
+                su_root=True)
+            self.fetch_count += 1
+            # The pool keeps blank lines, so the line numbers and the grep
+            # context are the same as those of the file on the node
+            for name, (stdout, _, rcode) in zip(missing, results):
+                self._manifests[name] = \
+                    PuppetManifest(stdout) if rcode == 0 else None
+        return dict((name, self._manifests[name])
+                    for name in manifest_files)
+
+    def get(self, manifest_file):
+        """
+        Description:
+            Return a manifest, fetching it if it is not loaded yet
+        Args:
+            manifest_file (str): The manifest file name
+        Return:
+            PuppetManifest, or None if the manifest cannot be read
+        """
+        return self.load([manifest_file])[manifest_file]
+
+    def refresh(self, manifest_file=None):
+        """
+        Description:
+            Drop a loaded manifest, or all of them, so that it is fetched
+            again, e.g. after a plan has run
+        Args:
+            manifest_file (str): The manifest file name. All if None
+        """
+        if manifest_file is None:
+            self._manifests = {}
+        else:
+            self._manifests.pop(manifest_file, None)
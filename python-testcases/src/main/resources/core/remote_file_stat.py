@@ -0,0 +1,110 @@
+"""
+COPYRIGHT Ericsson 2026
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     October 2026
+@author:    LITP Core Testware
+@summary:   Bulk remote file stat and checksum.
+            Size, modification time, access rights and digest of many files
+            are collected with a single remote call instead of one call per
+            file.
+"""
+from collections import namedtuple
+import pipes
+
+FIND_PATH = '/bin/find'
+STAT_PATH = '/usr/bin/stat'
+SHA256SUM_PATH = '/usr/bin/sha256sum'
+
+FileStat = namedtuple('FileStat', ['size', 'mtime', 'access', 'digest'])
+
+
+def _parse_stats(stat_out, digest_out):
+    """
+    Description:
+        Merge the output of the stat and digest commands
+    Args:
+        stat_out (list): Lines of "<size> <mtime> <access> <path>"
+        digest_out (list): Lines of "<digest>  <path>"
+    Return:
+        dict, FileStat keyed by file path
+    """
+    digests = {}
+    for line in digest_out:
+        digest, path = line.split(None, 1)
+        digests[path.lstrip('*')] = digest
+
+    stats = {}
+    for line in stat_out:
+        size, mtime, access, path = line.split(None, 3)
+        stats[path] = FileStat(int(size), int(float(mtime)), access,
+                               digests.get(path))
+    return stats
+
+
+def get_dir_file_stats(pool, node, dirs, maxdepth=1, name=None,
+                       digest=True, digest_path=SHA256SUM_PATH,
+                       su_root=True):
+    """
+    Description:
+        Collect stat and digest of the regular files found under the given
+        directories with one round trip to the node
+    Args:
+        pool (SSHSessionPool): The session pool used to reach the node
+        node (str): The node filename
+        dirs (str|list): The directory, or list of directories, to scan
+        maxdepth (int): How deep to descend into the directories
+        name (str): Optional "find -name" pattern to filter the files
+        digest (bool): Compute the digest of each file
+        digest_path (str): The digest command, sha256sum by default
+        su_root (bool): Run the commands as root
+    Return:
+        dict, FileStat keyed by file path. Files in a directory that does
+              not exist are simply not reported.
+    """
+    if isinstance(dirs, basestring):
+        dirs = [dirs]
+    find_cmd = '{0} {1} -maxdepth {2} -type f'.format(
+        FIND_PATH, ' '.join(pipes.quote(path) for path in dirs), maxdepth)
+    if name:
+        find_cmd += ' -name {0}'.format(pipes.quote(name))
+
+    cmds = [r"{0} -printf '%s %T@ %M %p\n' 2>/dev/null".format(find_cmd)]
+    if digest:
+        cmds.append('{0} -exec {1} {{}} + 2>/dev/null'.format(find_cmd,
+                                                            digest_path))
+    results = pool.run_commands(node, cmds, su_root=su_root)
+    return _parse_stats(results[0][0],
+                        results[1][0] if digest else [])
+
+
+def get_file_stats(pool, node, paths, digest=True,
+                   digest_path=SHA256SUM_PATH, su_root=True):
+    """
+    Description:
+        Collect stat and digest of the given files with one round trip to
+        the node
+    Args:
+        pool (SSHSessionPool): The session pool used to reach the node
+        node (str): The node filename
+        paths (list): Fully qualified paths of the files
+        digest (bool): Compute the digest of each file
+        digest_path (str): The digest command, sha256sum by default
+        su_root (bool): Run the commands as root
+    Return:
+        dict, FileStat keyed by file path. Paths that do not exist are not
+              in the dict.
+    """
+    if not paths:
+        return {}
+    quoted = ' '.join(pipes.quote(path) for path in paths)
+    cmds = ["{0} -c '%s %Y %A %n' {1} 2>/dev/null".format(STAT_PATH, quoted)]
+    if digest:
+        cmds.append('{0} {1} 2>/dev/null'.format(digest_path, quoted))
+    results = pool.run_commands(node, cmds, su_root=su_root)
+    return _parse_stats(results[0][0],
+                        results[1][0] if digest else [])
@@ -0,0 +1,47 @@
+##############################################################################
+# COPYRIGHT Ericsson AB 2026
+#
+# The copyright to the computer program(s) herein is the property of
+# Ericsson AB. The programs may be used and/or copied only with written
+# permission from Ericsson AB. or in accordance with the terms and
+# conditions stipulated in the agreement/contract under which the
+# program(s) have been supplied.
+##############################################################################
+'''Grouping of identical remote procedure calls across nodes'''
+from collections import namedtuple, OrderedDict
+from litp.core.task import RemoteExecutionTask
+
+RemoteCall = namedtuple('RemoteCall', ['node', 'model_item', 'description',
+                                       'agent', 'action', 'kwargs'])
+
+
+def remote_call_task(call):
+    """return the single node RemoteExecutionTask of a call"""
+
+    return RemoteExecutionTask([call.node], call.model_item, call.description,
+                               call.agent, call.action, **call.kwargs)
+
+
+def group_remote_calls(calls, describe=None):
+    """
+    return one RemoteExecutionTask per distinct agent, action and kwargs,
+    run on every node of the calls that share them. The task hangs off the
+    model item of the first call of the group and gets its description,
+    unless describe, given the calls of the group, returns another one
+    """
+
+    groups = OrderedDict()
+    for call in calls:
+        key = (call.agent, call.action, tuple(sorted(call.kwargs.items())))
+        groups.setdefault(key, []).append(call)
+
+    tasks = list()
+    for (agent, action, kwargs), group in groups.items():
+        nodes = OrderedDict((call.node.get_vpath(), call.node)
+                            for call in group)
+        description = describe(group) if describe else group[0].description
+        tasks.append(RemoteExecutionTask(nodes.values(), group[0].model_item,
+                                         description, agent, action,
+                                         **dict(kwargs)))
+
+    return tasks
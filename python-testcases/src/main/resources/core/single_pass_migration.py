@@ -0,0 +1,160 @@
+##############################################################################
+# COPYRIGHT Ericsson AB 2026
+#
+# The copyright to the computer program(s) herein is the property of
+# Ericsson AB. The programs may be used and/or copied only with written
+# permission from Ericsson AB. or in accordance with the terms and
+# conditions stipulated in the agreement/contract under which the
+# program(s) have been supplied.
+##############################################################################
+'''Single pass migration of property operations grouped by item type'''
+try:
+    from litp.migration.operations import BaseOperation
+except ImportError:
+    # Outside of litpd, e.g. when the testware compares the passes
+    BaseOperation = object
+
+
+class PropertyStep(object):
+    """
+    A property operation applied to one model item at a time, with the
+    forward and backward semantics of the litp.migration.operations it is
+    named after
+    """
+
+    def __init__(self, item_type_id):
+        self.item_type_id = item_type_id
+
+    def properties(self):
+        """ Return the names of the properties the step reads or writes """
+        return set()
+
+    def forward(self, item):
+        """ Migrate an item forwards, leaving it as it is by default """
+        pass
+
+    def backward(self, item):
+        """ Migrate an item backwards, leaving it as it is by default """
+        pass
+
+
+class AddPropertyStep(PropertyStep):
+    """ Add a property with a default value """
+
+    def __init__(self, item_type_id, property_name, default_value):
+        super(AddPropertyStep, self).__init__(item_type_id)
+        self.property_name = property_name
+        self.default_value = default_value
+
+    def properties(self):
+        return set([self.property_name])
+
+    def forward(self, item):
+        if getattr(item, self.property_name) is None:
+            item.set_property(self.property_name, self.default_value)
+
+    def backward(self, item):
+        if getattr(item, self.property_name) is not None:
+            item.delete_property(self.property_name)
+
+
+class RemovePropertyStep(PropertyStep):
+    """ Remove a property, restored with its default value backwards """
+
+    def __init__(self, item_type_id, property_name, default_value=None):
+        super(RemovePropertyStep, self).__init__(item_type_id)
+        self.property_name = property_name
+        self.default_value = default_value
+
+    def properties(self):
+        return set([self.property_name])
+
+    def forward(self, item):
+        if getattr(item, self.property_name) is not None:
+            item.delete_property(self.property_name)
+
+    def backward(self, item):
+        if self.default_value is not None and \
+                getattr(item, self.property_name) is None:
+            item.set_property(self.property_name, self.default_value)
+
+
+class RenamePropertyStep(PropertyStep):
+    """ Rename a property, keeping its value """
+
+    def __init__(self, item_type_id, old_property_name, new_property_name):
+        super(RenamePropertyStep, self).__init__(item_type_id)
+        self.old_property_name = old_property_name
+        self.new_property_name = new_property_name
+
+    def properties(self):
+        return set([self.old_property_name, self.new_property_name])
+
+    @staticmethod
+    def _rename(item, old_name, new_name):
+        """ Move the value of a property to another property """
+        value = getattr(item, old_name)
+        if value is not None:
+            item.delete_property(old_name)
+            item.set_property(new_name, value)
+
+    def forward(self, item):
+        self._rename(item, self.old_property_name, self.new_property_name)
+
+    def backward(self, item):
+        self._rename(item, self.new_property_name, self.old_property_name)
+
+
+class SinglePassOperation(BaseOperation):
+    """
+    Applies a chain of property steps with one find_modelitems() per item
+    type, instead of one per step.
+
+    The steps are split into groups of one item type, applied in order to
+    each item while it is visited, and in reverse order backwards. A step
+    joins the earlier group of its item type only if it shares no property
+    with the steps of the groups after that one, as it is applied before
+    them. Otherwise it starts a new group, which costs another scan.
+
+    The result is then the same as running the steps one after the other.
+    A property step only reads and writes its own properties of the item
+    it is given, so steps with no property in common can be swapped, also
+    when find_modelitems() of a supertype returns the items of a subtype
+    with steps of its own. Operations that move items or change their
+    type, such as RenameItemType or UpdateCollectionType, are not steps
+    and keep their own operation.
+    """
+
+    def __init__(self, steps):
+        """
+        Args:
+            steps (list): The PropertySteps, in the order they apply
+        """
+        self.groups = []
+        for step in steps:
+            self._add_step(step)
+
+    def _add_step(self, step):
+        """ Add a step to the last group it can join, or to a new group """
+        later_properties = set()
+        for item_type_id, steps in reversed(self.groups):
+            if item_type_id == step.item_type_id:
+                if not later_properties & step.properties():
+                    steps.append(step)
+                    return
+                break
+            for later_step in steps:
+                later_properties.update(later_step.properties())
+        self.groups.append((step.item_type_id, [step]))
+
+    def mutate_forward(self, model_manager):
+        for item_type_id, steps in self.groups:
+            for item in model_manager.find_modelitems(item_type_id):
+                for step in steps:
+                    step.forward(item)
+
+    def mutate_backward(self, model_manager):
+        for item_type_id, steps in reversed(self.groups):
+            for item in model_manager.find_modelitems(item_type_id):
+                for step in reversed(steps):
+                    step.backward(item)
@@ -0,0 +1,139 @@
+"""
+COPYRIGHT Ericsson 2026
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     October 2026
+@author:    LITP Core Testware
+@summary:   Progress of the LVM snapshot merges of a snapshot restore.
+            Runs the lvm_merge_progress.py monitor on a node, which logs
+            the percent merged and the estimated time remaining of every
+            merging volume to a log of its own, in the metrics.log format,
+            and waits on those entries for the merges to complete.
+"""
+from metrics_log import MetricsLog
+import os
+import time
+
+PYTHON_PATH = '/usr/bin/python'
+TOOL_NAME = 'lvm_merge_progress.py'
+TOOL_DIR = '/tmp'
+# Not the LITP metrics.log, which other tests parse
+MERGE_LOG = '/tmp/lvm_merge_progress.log'
+MERGE_OPERATION = '[LITP][SNAPSHOT][Merge]'
+
+
+class SnapshotMergeProgress(object):
+    """
+    Snapshot merge progress of a node, read from the log of the monitor
+    """
+
+    def __init__(self, test, node, log_path=MERGE_LOG):
+        """
+        Args:
+            test (GenericTest): The test used to run commands
+            node (str): The node filename
+            log_path (str): The log the monitor appends to
+        """
+        self.test = test
+        self.node = node
+        self.log_path = log_path
+        self.tool_path = os.path.join(TOOL_DIR, TOOL_NAME)
+        self._started = False
+
+    def _merge_lines(self):
+        """ Return the merge entries of the monitor log """
+        cmd = "/bin/grep -F '{0}' {1}".format(MERGE_OPERATION,
+                                              self.log_path)
+        return self.test.run_command(self.node, cmd, su_root=True)[0]
+
+    def start(self, interval=5, timeout_secs=3600):
+        """
+        Description:
+            Copy the monitor to the node and start it in the background.
+            The monitor is copied on every start, as a snapshot restore
+            rolls back the file systems it was copied to
+        Args:
+            interval (int): Seconds between samples of the merges
+            timeout_secs (int): Seconds before the monitor gives up
+        """
+        self.test.assertTrue(self.test.copy_file_to(
+            self.node, os.path.join(os.path.dirname(__file__), TOOL_NAME),
+            self.tool_path, root_copy=True))
+        # Only the entries logged from now on are progress of this restore
+        self.test.run_command(self.node, '/bin/rm -f {0}'.format(
+            self.log_path), su_root=True, default_asserts=True)
+        cmd = '/usr/bin/nohup {0} {1} monitor {2} --interval {3} ' \
+              '--timeout {4} > /dev/null 2>&1 &'.format(
+                  PYTHON_PATH, self.tool_path, self.log_path, interval,
+                  timeout_secs)
+        self.test.run_command(self.node, cmd, su_root=True,
+                              default_asserts=True)
+        self._started = True
+
+    def progress(self):
+        """
+        Description:
+            Return the latest progress logged by the monitor
+        Return:
+            dict, 'volumes' with the 'percent' merged, the 'eta' seconds
+                  and, once merged, the 'seconds' taken of every volume,
+                  None where not known yet, and 'complete' once every
+                  volume is merged
+        """
+        metrics_log = MetricsLog(self._merge_lines())
+        volumes = {}
+        for operation in sorted(metrics_log.by_operation):
+            if operation == MERGE_OPERATION:
+                continue
+            volume = operation[len(MERGE_OPERATION) + 1:-1]
+            values = {}
+            for name, key in [('PercentMerged', 'percent'),
+                              ('EtaSeconds', 'eta'),
+                              ('TimeTaken', 'seconds')]:
+                records = metrics_log.select(operation, name)
+                values[key] = float(records[-1].value) \
+                    if records and records[-1].valid else None
+            volumes[volume] = values
+        finished = metrics_log.values(MERGE_OPERATION, 'TimeTaken')
+        return {'volumes': volumes,
+                'complete': bool(finished) and all(
+                    values['seconds'] is not None
+                    for values in volumes.values())}
+
+    def wait(self, timeout_mins=10, poll_interval=10):
+        """
+        Description:
+            Wait for the monitor to log that every merge is complete,
+            logging the progress of each volume as it changes
+        Args:
+            timeout_mins (int): Minutes to wait for
+            poll_interval (int): Seconds between reads of the log
+        Return:
+            bool, True if the merges completed in time
+        """
+        reported = {}
+        end = time.time() + timeout_mins * 60
+        while True:
+            progress = self.progress()
+            for volume, values in sorted(progress['volumes'].items()):
+                if reported.get(volume) != values:
+                    self.test.log('info', '{0}: {1} % merged, ETA {2} s'
+                                  .format(volume, values['percent'],
+                                          values['eta']))
+                    reported[volume] = values
+            if progress['complete'] or time.time() > end:
+                return progress['complete']
+            time.sleep(poll_interval)
+
+    def cleanup(self):
+        """ Stop the monitor and remove it and its log from the node """
+        if self._started:
+            self.test.run_command(self.node, '/usr/bin/pkill -f {0}'.format(
+                self.tool_path), su_root=True)
+            self.test.remove_item(self.node, self.tool_path, su_root=True)
+            self.test.remove_item(self.node, self.log_path, su_root=True)
+            self._started = False
@@ -0,0 +1,283 @@
+"""
+COPYRIGHT Ericsson 2026
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     October 2026
+@author:    LITP Core Testware
+@summary:   Pool of persistent SSH sessions to the MS and peer nodes.
+            One authenticated transport is kept open per node and each
+            command runs on a new channel of that transport. Several
+            commands can be sent to a node in a single round trip.
+"""
+import base64
+import threading
+import time
+import uuid
+import paramiko
+
+SSH_PORT = 22
+SU_PASSWORD_PROMPT = 'Password:'
+
+
+class SSHSessionPool(object):
+    """
+    Keeps one multiplexed SSH transport per node.
+
+    The results returned by run_command() and run_commands() have the same
+    (stdout, stderr, rc) shape as GenericTest.run_command() so that the
+    pool can be used in place of it.
+    """
+
+    def __init__(self, test, connect_timeout=10, keepalive=30):
+        """
+        Args:
+            test (GenericTest): The test used to read node connection data
+            connect_timeout (int): SSH connection timeout in seconds
+            keepalive (int): Interval of the transport keepalive packets
+        """
+        self.test = test
+        self.connect_timeout = connect_timeout
+        self.keepalive = keepalive
+        self._clients = {}
+        # Guards the dicts only. A connection is opened under the lock of
+        # its node, so the nodes of a fan-out connect in parallel
+        self._lock = threading.Lock()
+        self._node_locks = {}
+        self.connect_count = 0
+        self.round_trips = 0
+
+    def _connect(self, node):
+        """
+        Description:
+            Open an authenticated SSH connection to the given node
+        Args:
+            node (str): The node filename
+        Return:
+            SSHClient, The connected client
+        """
+        client = paramiko.SSHClient()
+        client.set_missing_host_key_policy(paramiko.AutoAddPolicy())
+        client.connect(self.test.get_node_att(node, 'ipv4'),
+                       port=SSH_PORT,
+                       username=self.test.get_node_att(node, 'username'),
+                       password=self.test.get_node_att(node, 'password'),
+                       timeout=self.connect_timeout,
+                       allow_agent=False,
+                       look_for_keys=False)
+        client.get_transport().set_keepalive(self.keepalive)
+        with self._lock:
+            self.connect_count += 1
+        return client
+
+    def _get_transport(self, node):
+        """
+        Description:
+            Return the open transport to the node, connecting if required
+        Args:
+            node (str): The node filename
+        Return:
+            Transport, The active SSH transport
+        """
+        with self._lock:
+            node_lock = self._node_locks.setdefault(node, threading.Lock())
+        with node_lock:
+            with self._lock:
+                client = self._clients.get(node)
+            if client is None or not client.get_transport() or \
+                    not client.get_transport().is_active():
+                if client is not None:
+                    client.close()
+                client = self._connect(node)
+                with self._lock:
+                    self._clients[node] = client
+            return client.get_transport()
+
+    def close(self, node=None):
+        """
+        Description:
+            Close the session to the given node or to all nodes
+        Args:
+            node (str): The node filename. All sessions are closed if None
+        """
+        with self._lock:
+            nodes = [node] if node else self._clients.keys()
+            for name in nodes:
+                client = self._clients.pop(name, None)
+                if client is not None:
+                    client.close()
+
+    def close_inactive(self):
+        """
+        Description:
+            Close the sessions whose transport is no longer active, such as
+            those to a node that rebooted, which the keepalive detects.
+            Active sessions are kept
+        Return:
+            list, The node filenames of the closed sessions
+        """
+        closed = []
+        with self._lock:
+            for name, client in self._clients.items():
+                transport = client.get_transport()
+                if not transport or not transport.is_active():
+                    client.close()
+                    del self._clients[name]
+                    closed.append(name)
+        return closed
+
+    def _exec(self, node, script, su_root, timeout):
+        """
+        Description:
+            Run a shell script on a new channel of the node transport
+        Args:
+            node (str): The node filename
+            script (str): The shell script to run
+            su_root (bool): Run the script as root via su
+            timeout (int): Timeout in seconds
+        Return:
+            tuple, stdout lines, stderr lines and return code
+        """
+        encoded = base64.b64encode(script)
+        cmd = '/bin/bash -c "$(/bin/echo {0} | /usr/bin/base64 -d)"' \
+              .format(encoded)
+        if su_root:
+            cmd = "/bin/su -c '{0}'".format(cmd)
+
+        channel = self._get_transport(node).open_session()
+        try:
+            channel.settimeout(timeout)
+            if su_root:
+                # su reads the password from a terminal only
+                channel.get_pty()
+            channel.exec_command(cmd)
+            if su_root:
+                self._send_root_password(node, channel, timeout)
+            else:
+                # Commands that read stdin get EOF rather than blocking
+                channel.shutdown_write()
+
+            stdout = []
+            stderr = []
+            # The channel timeout bounds each read only, so a command that
+            # keeps printing would never time out without a deadline
+            deadline = time.time() + timeout
+            while True:
+                if time.time() > deadline:
+                    raise paramiko.SSHException(
+                        'Timeout after {0}s running command on "{1}"'
+                        .format(timeout, node))
+                if channel.recv_ready():
+                    stdout.append(channel.recv(65536))
+                if channel.recv_stderr_ready():
+                    stderr.append(channel.recv_stderr(65536))
+                if channel.exit_status_ready() and \
+                        not channel.recv_ready() and \
+                        not channel.recv_stderr_ready():
+                    break
+                time.sleep(0.01)
+            rc = channel.recv_exit_status()
+        finally:
+            channel.close()
+        self.round_trips += 1
+        return (self._split_lines(''.join(stdout)),
+                self._split_lines(''.join(stderr)),
+                rc)
+
+    def _send_root_password(self, node, channel, timeout):
+        """ Wait for the su password prompt and answer it """
+        prompt = ''
+        deadline = time.time() + timeout
+        while SU_PASSWORD_PROMPT not in prompt:
+            if time.time() > deadline:
+                raise paramiko.SSHException(
+                    'Timeout waiting for su password prompt on "{0}"'
+                    .format(node))
+            if channel.recv_ready():
+                prompt += channel.recv(1024)
+            else:
+                time.sleep(0.01)
+        channel.send('{0}\n'.format(self.test.get_node_att(node, 'rootpw')))
+
+    @staticmethod
+    def _split_lines(data):
+        """ Split output in lines, keeping empty ones """
+        return [line.rstrip('\r') for line in data.splitlines()]
+
+    def run_command(self, node, cmd, su_root=False, timeout=120):
+        """
+        Description:
+            Run a single command on the node over the pooled session
+        Args:
+            node (str): The node filename
+            cmd (str): The command to run
+            su_root (bool): Run the command as root
+            timeout (int): Timeout in seconds
+        Return:
+            tuple, stdout lines, stderr lines and return code
+        """
+        if not su_root:
+            return self._exec(node, cmd, su_root, timeout)
+        # With a pty stderr is merged into stdout, so run it as a batch
+        # of one to keep the streams apart
+        return self.run_commands(node, [cmd], su_root, timeout)[0]
+
+    def run_commands(self, node, cmds, su_root=False, timeout=300):
+        """
+        Description:
+            Run several commands on the node in a single round trip.
+            Commands run in sequence in the same shell and each one gets its
+            own stdout, stderr and return code.
+        Args:
+            node (str): The node filename
+            cmds (list): The commands to run
+            su_root (bool): Run the commands as root
+            timeout (int): Timeout in seconds for the whole batch
+        Return:
+            list, (stdout, stderr, rc) tuple for each command, in the order
+                  the commands were given
+        """
+        if not cmds:
+            return []
+        marker = uuid.uuid4().hex
+        script = ['__err=$(/bin/mktemp)']
+        for index, cmd in enumerate(cmds):
+            script.append("/bin/echo '{0}:out:{1}'".format(marker, index))
+            script.append('( {0} ) </dev/null 2>$__err'.format(cmd))
+            # The leading newline ends output with no trailing newline, so
+            # the marker always starts a line of its own
+            script.append("/usr/bin/printf '\\n{0}:rc:{1}:%s\\n' $?"
+                          .format(marker, index))
+            script.append("/bin/sed -e 's/^/{0}:err:{1}:/' -e '$a\\' $__err"
+                          .format(marker, index))
+        script.append('/bin/rm -f $__err')
+
+        stdout, _, _ = self._exec(node, '\n'.join(script), su_root, timeout)
+
+        results = [([], [], None) for _ in cmds]
+        current = None
+        for line in stdout:
+            if not line.startswith(marker):
+                if current is not None:
+                    results[current][0].append(line)
+                continue
+            _, kind, rest = line.split(':', 2)
+            if kind == 'out':
+                current = int(rest)
+            elif kind == 'rc':
+                index, rc = rest.split(':', 1)
+                # Drop the empty line added by the newline before the marker
+                # when the output already ended with one
+                if results[int(index)][0] and not results[int(index)][0][-1]:
+                    results[int(index)][0].pop()
+                results[int(index)] = (results[int(index)][0],
+                                       results[int(index)][1],
+                                       int(rc))
+                current = None
+            elif kind == 'err':
+                index, err_line = rest.split(':', 1)
+                results[int(index)][1].append(err_line)
+        return results
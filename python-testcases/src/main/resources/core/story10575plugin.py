@@ -16,6 +16,7 @@ from litp.core.task import CallbackTask
 from litp.core.task import OrderedTaskList
 from litp.core.execution_manager import CallbackExecutionException
 from litp.core.litp_logging import LitpLogger
+from plugin_query_index import QueryIndex
 log = LitpLogger()
 
 
@@ -102,8 +103,8 @@ class Story10575Plugin(Plugin):
         return CallbackTask(model_item, description, self.cb_fail)
 
     @staticmethod
-    def _config_items(node_item, item_type):
-        return node_item.query(item_type)
+    def _config_items(index, node_item, item_type):
+        return index.node_items(node_item, item_type)
 
     def _generate_tasks(self, node_item, model_item):
         ordered_tasks = list()
@@ -230,14 +231,11 @@ class Story10575Plugin(Plugin):
 
         """
         tasks = []
-        nodes = plugin_api_context.query("node") +\
-            plugin_api_context.query("ms")
-
-        for node in nodes:
-            #for ms_ in plugin_api_context.query("ms"):
-            if self._config_items(node, "story-10575a"):
-                for config_10575a in self._config_items(node, "story-10575a"):
-                    if config_10575a:
-                        tasks.extend(self._generate_tasks(node, config_10575a))
+        index = QueryIndex(plugin_api_context, ["story-10575a"])
+
+        for node in index.get_nodes(include_ms=True):
+            for config_10575a in self._config_items(index, node,
+                                                    "story-10575a"):
+                tasks.extend(self._generate_tasks(node, config_10575a))
         log.trace.debug("RETURNED TASKS: {0}".format(tasks))
         return tasks
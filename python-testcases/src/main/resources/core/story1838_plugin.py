@@ -3,6 +3,9 @@ from litp.core.task import ConfigTask
 from litp.core.task import CallbackTask
 from litp.core.task import RemoteExecutionTask
 from litp.core.task import OrderedTaskList
+from plugin_query_index import QueryIndex
+from rpc_task_grouping import RemoteCall, remote_call_task, \
+    group_remote_calls
 
 
 class Story1838Plugin(Plugin):
@@ -34,15 +37,18 @@ class Story1838Plugin(Plugin):
                         )
                    ]
 
+    def get_remote_execution_call(self, node, item):
+        """return the remote call of the remote execution task"""
+
+        return RemoteCall(
+                    node, item,
+                    "RemoteExecutionTask() {0}".format(item.name), "service",
+                    "status", {"service": "network"})
+
     def get_remote_execution_task(self, node, item):
         """return a remote execution task"""
 
-        return [
-                RemoteExecutionTask(
-                    [node], item,
-                    "RemoteExecutionTask() {0}".format(item.name), "service",
-                    "status", service="network")
-                ]
+        return [remote_call_task(self.get_remote_execution_call(node, item))]
 
     def get_ordered_task_list(self, api, node, item):
         """return an ordered task list"""
@@ -83,13 +89,11 @@ class Story1838Plugin(Plugin):
         """create configuration"""
 
         tasks = []
-        nodes = []
 
-        # query test item type
-        items = [item for item in api.query("story1838")]
-
-        # query all nodes
-        nodes = [node for node in api.query("node")]
+        # query the test item type and all nodes once
+        index = QueryIndex(api, ["story1838"])
+        items = index.items("story1838")
+        nodes = index.get_nodes()
 
         # get tasks for each required test based on name property and item
         # state
@@ -100,13 +104,21 @@ class Story1838Plugin(Plugin):
                 if item.is_updated() or item.is_for_removal() or \
                         item.is_initial():
                     for node in nodes:
-                        for ref in node.query("story1838"):
+                        for ref in index.node_items(node, "story1838"):
                             tasks.extend(
                                 self.get_callback_config_tasks(node, ref)
                             )
+            elif item.name == "test_09":
+                # the same call on every node, as one multi-node task
+                if item.is_initial():
+                    tasks.extend(group_remote_calls([
+                        self.get_remote_execution_call(node, ref)
+                        for node in nodes
+                        for ref in index.node_items(node, "story1838")
+                    ]))
             else:
                 for node in nodes:
-                    for ref in node.query("story1838"):
+                    for ref in index.node_items(node, "story1838"):
                         if item.name == "test_01":
                             if item.is_initial() or item.is_for_removal():
                                 tasks.extend(
@@ -117,11 +129,6 @@ class Story1838Plugin(Plugin):
                                 tasks.append(
                                     self.get_ordered_task_list(api, node, ref)
                                 )
-                        elif item.name == "test_09":
-                            if item.is_initial():
-                                tasks.extend(
-                                    self.get_remote_execution_task(node, ref)
-                                )
                         elif item.name == "test_11":
                             if item.is_initial():
                                 tasks.extend(
@@ -1,19 +1,17 @@
+import time
 from litp.core.plugin import Plugin
 from litp.core.task import CallbackTask, OrderedTaskList
-import random
+from unique_values import UniqueValueSource
 
 from litp.core.litp_logging import LitpLogger
 log = LitpLogger()
 
+_VALUES = UniqueValueSource()
+
 
 class Story2783Plugin(Plugin):
-    def _get_random_value(self):
-        self.used_vals = self.used_vals or []
-        while True:
-            rand = repr(random.random())
-            if rand not in self.used_vals:
-                self.used_vals.append(rand)
-                return rand
+    def get_random_value(self):
+        return _VALUES.next_value()
 
     def callback(self, api, item_name):
         for item in api.query("story2783", name=item_name):
@@ -21,8 +19,11 @@ class Story2783Plugin(Plugin):
                 item.rest_only = self.get_random_value()
             if item_name in ['test_02', 'test_03', 'test_04', 'test_05',
                              'test_06', 'test_07', 'test_14', 'test_15']:
+                if item_name == 'test_14':
+                    time.sleep(60)
                 item.plugin_only = self.get_random_value()
                 if item_name == 'test_15':
+                    time.sleep(60)
                     item.plugin_only = self.get_random_value()
             if item_name in ['test_08', 'test_09', 'test_10', 'test_11',
                              'test_12', 'test_13']:
@@ -32,8 +33,12 @@ class Story2783Plugin(Plugin):
 
     def callback2(self, api, item_name):
         for item in api.query("story2783", name=item_name):
+            time.sleep(60)
             item.plugin_only = self.get_random_value()
 
+    def update_both(self, api, vpath):
+        api.query_by_vpath(vpath).both = self.get_random_value()
+
     def failure(self, api, item_name):
         for item in api.query('story2783', name=item_name):
             item.none = self.get_random_value()
@@ -56,6 +61,9 @@ class Story2783Plugin(Plugin):
                         )
                     if task1 and task2:
                         tasks.append(OrderedTaskList(item, [task1, task2]))
+                elif item.name.startswith('test_18_'):
+                    tasks.append(CallbackTask(item, '', self.update_both,
+                                              item.get_vpath()))
                 elif item.name == 'test_16':
                     tasks.extend([CallbackTask(item, '', self.failure,
                                                                 item.name)])
@@ -5,36 +5,29 @@ from litp.core.task import ConfigTask
 from litp.core.task import CallbackTask
 
 from litp.core.litp_logging import LitpLogger
+from plugin_query_index import QueryIndex
 log = LitpLogger()
 
 
 class Story4429Plugin(Plugin):
 
-    def _get_nodes(self, plugin_api_context):
+    def _get_nodes(self, index):
 
-        nodes = [node for node in plugin_api_context.query('node')]
-        nodes.extend(plugin_api_context.query('ms'))
+        return index.get_nodes(include_ms=True)
 
-        return nodes
-
-    def _get_model_items(self, plugin_api_context):
+    def _get_model_items(self, index):
 
         model_items = [
             model_item
-            for model_item in plugin_api_context.query('story4429')
+            for model_item in index.items('story4429')
             if model_item.is_initial()
         ]
 
         return model_items
 
-    def _get_reference_items(self, node, model_item):
-
-        reference_items = [ref_item
-            for ref_item in node.query('story4429')
-            if ref_item.get_source().get_vpath() == model_item.get_vpath()
-        ]
+    def _get_reference_items(self, index, node, model_item):
 
-        return reference_items
+        return index.references(node, 'story4429', model_item)
 
     def cb_do_nothing(self, item):
         log.trace.info(item)
@@ -72,8 +65,9 @@ class Story4429Plugin(Plugin):
 
         tasks = list()
         ordered_tasks = list()
-        nodes = self._get_nodes(plugin_api_context)
-        model_items = self._get_model_items(plugin_api_context)
+        index = QueryIndex(plugin_api_context, ['story4429', 'story4429-1'])
+        nodes = self._get_nodes(index)
+        model_items = self._get_model_items(index)
         for model_item in model_items:
             if model_item.name == 'test_01':
                 log.trace.info(
@@ -82,7 +76,7 @@ class Story4429Plugin(Plugin):
                 )
                 for node in nodes:
                     reference_items = self._get_reference_items(
-                        node, model_item
+                        index, node, model_item
                     )
                     for ref_item in reference_items:
                         ordered_tasks.append(
@@ -231,7 +225,7 @@ class Story4429Plugin(Plugin):
                     '_query_item_call_type_call_id'.format(model_item.name)
                 )
                 node = nodes[0]
-                model_itemB = plugin_api_context.query('story4429-1')[0]
+                model_itemB = index.items('story4429-1')[0]
                 _, taskA = self._get_config_task(
                     node, model_item,
                     'ConfigTask() TaskA:{0}:{1}'.format(
@@ -244,7 +238,7 @@ class Story4429Plugin(Plugin):
                         model_itemB.name, node.hostname
                     )
                 )
-                ref_itemB = node.query('story4429-1')[0]
+                ref_itemB = index.node_items(node, 'story4429-1')[0]
                 taskA.requires = set([ref_itemB, ('notify', unique_idB)])
                 tasks.append(taskA)
                 tasks.append(taskB)
@@ -254,7 +248,7 @@ class Story4429Plugin(Plugin):
                     '_query_item_only'.format(model_item.name)
                 )
                 node = nodes[0]
-                model_itemB = plugin_api_context.query('story4429-1')[0]
+                model_itemB = index.items('story4429-1')[0]
                 _, taskA = self._get_config_task(
                     node, model_item,
                     'ConfigTask() TaskA:{0}:{1}'.format(
@@ -268,7 +262,7 @@ class Story4429Plugin(Plugin):
                     ),
                     '1'
                 )
-                ref_itemB = node.query('story4429-1')[0]
+                ref_itemB = index.node_items(node, 'story4429-1')[0]
                 taskA.requires = set([ref_itemB])
                 tasks.append(taskA)
                 tasks.append(taskB)
@@ -284,14 +278,14 @@ class Story4429Plugin(Plugin):
                         model_item.name, node.hostname
                     )
                 )
-                model_itemB = plugin_api_context.query('story4429-1')[0]
+                model_itemB = index.items('story4429-1')[0]
                 unique_idB, taskB = self._get_config_task(
                     node, model_item,
                     'ConfigTask() TaskB:{0}:{1}'.format(
                         model_itemB.name, node.hostname
                     )
                 )
-                ref_itemB = node.query('story4429-1')[0]
+                ref_itemB = index.node_items(node, 'story4429-1')[0]
                 taskA.requires = set([ref_itemB, ('notify', )])
                 tasks.append(taskA)
                 tasks.append(taskB)
@@ -307,7 +301,7 @@ class Story4429Plugin(Plugin):
                         model_item.name, node.hostname
                     )
                 )
-                ref_itemA = node.query('story4429')[0]
+                ref_itemA = index.node_items(node, 'story4429')[0]
                 taskA.requires = set([ref_itemA, ('notify', unique_idA)])
                 tasks.append(taskA)
 
@@ -0,0 +1,229 @@
+"""
+COPYRIGHT Ericsson 2026
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     October 2026
+@author:    LITP Core Testware
+@summary:   Streaming LITP state backups on the MS.
+            Runs the litp_stream_backup.py tool, which writes the backup
+            as a gzipped tar stream with a per-member checksum manifest,
+            in full or as a delta of a backup chain, and restores backup
+            chains, loading the DB while the rest is restored. The wall
+            time and the bytes read of any backup, verification or restore
+            command are measured from the I/O accounting of the MS.
+"""
+import json
+import os
+import pipes
+
+BASH_PATH = '/bin/bash'
+PYTHON_PATH = '/usr/bin/python'
+TOOL_NAME = 'litp_stream_backup.py'
+TOOL_DIR = '/tmp'
+DIGEST_SUFFIX = '.sha256'
+MEASURE_PREFIX = 'MEASURE'
+# The I/O of the children a shell has reaped is added to its own, so the
+# counters of the shell at exit cover the whole command
+MEASURE_SCRIPT = (
+    '/bin/echo "{0} start $(/bin/date +%s.%N)"; {1}; rc=$?; '
+    '/bin/echo "{0} end $(/bin/date +%s.%N)"; '
+    '/bin/awk \'{{print "{0}", $1, $2}}\' /proc/$$/io; exit $rc')
+DROP_CACHES_CMD = '/bin/sync && /bin/echo 3 > /proc/sys/vm/drop_caches'
+
+
+def measured_cmd(cmd):
+    """
+    Description:
+        Wrap a command so that it also prints its wall time and I/O counters
+    Args:
+        cmd (str): The command to measure
+    Return:
+        str, The wrapped command, which exits with the rc of cmd
+    """
+    return '{0} -c {1}'.format(BASH_PATH, pipes.quote(
+        MEASURE_SCRIPT.format(MEASURE_PREFIX, cmd)))
+
+
+def parse_measurement(stdout):
+    """
+    Description:
+        Split the output of a measured_cmd() into the output of the command
+        and its measurements
+    Args:
+        stdout (list): The output lines of the wrapped command
+    Return:
+        tuple, The output lines of the command, and a dict with the
+               'seconds' taken, 'rchar' all the bytes read and
+               'read_bytes' the bytes read from storage
+    """
+    lines = []
+    values = {}
+    for line in stdout:
+        parts = line.split()
+        if len(parts) == 3 and parts[0] == MEASURE_PREFIX:
+            values[parts[1].rstrip(':')] = float(parts[2])
+        else:
+            lines.append(line)
+    measurement = {'seconds': values.get('end', 0.0) -
+                              values.get('start', 0.0),
+                   'rchar': int(values.get('rchar', 0)),
+                   'read_bytes': int(values.get('read_bytes', 0))}
+    return lines, measurement
+
+
+class StreamBackup(object):
+    """
+    Streaming backups and their verification on the MS
+    """
+
+    def __init__(self, test, node):
+        """
+        Args:
+            test (GenericTest): The test used to run commands
+            node (str): The MS filename
+        """
+        self.test = test
+        self.node = node
+        self.tool_path = os.path.join(TOOL_DIR, TOOL_NAME)
+        self._installed = False
+
+    def install(self):
+        """ Copy the backup tool to the MS """
+        if not self._installed:
+            self.test.assertTrue(self.test.copy_file_to(
+                self.node,
+                os.path.join(os.path.dirname(__file__), TOOL_NAME),
+                self.tool_path, root_copy=True))
+            self._installed = True
+
+    def measure(self, cmd, drop_caches=False, timeout_secs=1800):
+        """
+        Description:
+            Run a command as root and measure it
+        Args:
+            cmd (str): The command to run
+            drop_caches (bool): Drop the page cache first, so that
+                                'read_bytes' counts every byte read
+            timeout_secs (int): Timeout of the command
+        Return:
+            tuple, The output lines, the measurement dict and the rc
+        """
+        if drop_caches:
+            self.test.run_command(self.node, DROP_CACHES_CMD, su_root=True,
+                                  default_asserts=True)
+        stdout, _, rcode = self.test.run_command(
+            self.node, measured_cmd(cmd), su_root=True,
+            su_timeout_secs=timeout_secs)
+        lines, measurement = parse_measurement(stdout)
+        return lines, measurement, rcode
+
+    def _run_tool(self, args, drop_caches=False):
+        """
+        Description:
+            Run the backup tool and merge its result with the measurement
+        Return:
+            dict, The result of the tool, with the 'rc' and the measured
+                  'seconds', 'rchar' and 'read_bytes'
+        """
+        self.install()
+        cmd = '{0} {1} {2}'.format(PYTHON_PATH, self.tool_path,
+                                   ' '.join(pipes.quote(str(arg))
+                                            for arg in args))
+        lines, measurement, rcode = self.measure(cmd, drop_caches)
+        self.test.assertNotEqual([], lines,
+                                 'No result from {0}'.format(cmd))
+        result = json.loads(lines[-1])
+        result.update(measurement)
+        result['rc'] = rcode
+        return result
+
+    def backup(self, backup_dir, threads=1, incremental=False,
+               drop_caches=False):
+        """
+        Description:
+            Write a streaming backup
+        Args:
+            backup_dir (str): The directory of the archives
+            threads (int): Compress with pigz threads if more than one and
+                           pigz is installed, else with zlib
+            incremental (bool): Write a delta of the newest backup chain,
+                                or a new base if it cannot be extended
+            drop_caches (bool): Drop the page cache first
+        Return:
+            dict, 'archive', 'compressor', 'members', 'bytes_written' and
+                  the measurement, and for incremental backups the 'type'
+                  'base' or 'delta', the 'parent', the chain 'length' and
+                  the 'reason' for a new base
+        """
+        args = ['backup', backup_dir, '--threads', threads,
+                '--db-host', self.node]
+        if incremental:
+            args.append('--incremental')
+        result = self._run_tool(args, drop_caches)
+        self.test.assertEqual(0, result['rc'],
+                              'The streaming backup failed')
+        return result
+
+    def verify(self, archive, quick=False, drop_caches=False):
+        """
+        Description:
+            Verify an archive against its checksums
+        Args:
+            archive (str): The archive path on the MS
+            quick (bool): Only check the digest of the compressed archive
+            drop_caches (bool): Drop the page cache first
+        Return:
+            dict, 'valid', 'errors', 'members' and the measurement
+        """
+        args = ['verify', archive]
+        if quick:
+            args.append('--quick')
+        return self._run_tool(args, drop_caches)
+
+    def latest(self, backup_dir, valid=False):
+        """
+        Description:
+            Return the newest archive by the timestamp in its name
+        Args:
+            backup_dir (str): The directory of the archives
+            valid (bool): Skip the archives that fail the quick check
+        Return:
+            str, The archive path, None if there is none
+        """
+        args = ['latest', backup_dir]
+        if valid:
+            args.append('--valid')
+        return self._run_tool(args)['archive']
+
+    def restore(self, archive, target_dir, apply_state=False, jobs=1,
+                drop_caches=False):
+        """
+        Description:
+            Restore the state of an archive by replaying its backup chain
+            from the base, checking the state after every archive
+        Args:
+            archive (str): The archive path on the MS
+            target_dir (str): The directory to restore the files to
+            apply_state (bool): Also load the restored DB and put the
+                                restored puppet manifests in place
+            jobs (int): The parallel pg_restore jobs loading the DB
+            drop_caches (bool): Drop the page cache first
+        Return:
+            dict, 'valid', 'errors', the 'chain' of archive names, the
+                  restored 'members', the seconds of each of the restore
+                  'stages' and the measurement
+        """
+        args = ['restore', archive, target_dir, '--db-host', self.node]
+        if apply_state:
+            args.extend(['--apply', '--jobs', jobs])
+        return self._run_tool(args, drop_caches)
+
+    def cleanup(self):
+        """ Remove the backup tool from the MS """
+        if self._installed:
+            self.test.remove_item(self.node, self.tool_path, su_root=True)
+            self._installed = False
@@ -0,0 +1,199 @@
+"""
+COPYRIGHT Ericsson 2026
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     October 2026
+@author:    LITP Core Testware
+@summary:   Celery worker sizing benchmark.
+            The same parallel firewall rule plan of TORF-124437 runs with a
+            sweep of litpTask worker concurrency and scheduling settings.
+            Each setting records the plan wall time, the phase latencies
+            from the metrics log and the RabbitMQ queue depths, and the
+            results are output as a tuning table.
+"""
+from litp_generic_test import GenericTest, attr
+from bulk_model_builder import BulkModelBuilder
+from plan_state_waiter import PlanStateWaiter
+from plan_timeline import PlanTimeline
+from metrics_log import MetricsLog, PLAN_RUN
+from ssh_session_pool import SSHSessionPool
+from celery_workers import CeleryWorkers
+import test_constants as const
+import json
+import os
+import tempfile
+import time
+
+LIST_QUEUES_CMD = '/usr/sbin/rabbitmqctl -q list_queues name messages'
+
+# Sweep points: (litpTask worker concurrency, fair scheduling)
+SWEEP = [(1, False), (2, False), (4, False), (8, False),
+         (4, True), (8, True)]
+RULES_PER_NODE = 4
+
+
+class CeleryWorkerSweep(GenericTest):
+    """
+    Benchmark of a parallel plan against the Celery worker settings
+    """
+
+    def setUp(self):
+        """ Runs before every single test """
+        super(CeleryWorkerSweep, self).setUp()
+        self.ms1 = self.get_management_node_filename()
+        self.ssh_pool = SSHSessionPool(self)
+        self.plan_waiter = PlanStateWaiter(self, self.ms1)
+        self.model_builder = BulkModelBuilder(self, self.ms1)
+        self.results_file = os.path.join(tempfile.gettempdir(),
+                                         'celery_worker_sweep_results.json')
+        self.celery_workers = CeleryWorkers(self, self.ms1)
+        self.queue_depths = {}
+
+    def tearDown(self):
+        """ Runs after every single test """
+        self.model_builder.cleanup()
+        self.celery_workers.cleanup()
+        self.ssh_pool.close()
+        super(CeleryWorkerSweep, self).tearDown()
+
+    def _firewall_rules(self):
+        """
+        Description:
+            Return the firewall rules of the TORF-124437 parallel plan:
+            rules on the first node of every cluster
+        Return:
+            list, The item dicts of the rules
+        """
+        items = []
+        for cluster_uri in self.find(self.ms1, '/deployments', 'vcs-cluster'):
+            node_uri = self.find(self.ms1, cluster_uri, 'node')[0]
+            fw_coll_uri = self.find(self.ms1, node_uri,
+                                    'collection-of-firewall-rule')[0]
+            for index in range(1, RULES_PER_NODE + 1):
+                items.append({
+                    'url': os.path.join(fw_coll_uri,
+                                        'celery_sweep_{0}'.format(index)),
+                    'type': 'firewall-rule',
+                    'props': 'name="78{0} celery sweep"'.format(index)})
+        return items
+
+    def _sample_queue_depths(self, plan):
+        """
+        Description:
+            Record the deepest RabbitMQ queues seen so far. Subscribed to
+            the plan waiter, so it samples at every plan poll
+        Args:
+            plan (dict): The polled plan data, not used
+        """
+        stdout, _, rcode = self.ssh_pool.run_command(self.ms1,
+                                                     LIST_QUEUES_CMD,
+                                                     su_root=True)
+        if rcode != 0:
+            return
+        for line in stdout:
+            parts = line.split()
+            if len(parts) == 2 and parts[1].isdigit():
+                self.queue_depths[parts[0]] = max(
+                    self.queue_depths.get(parts[0], 0), int(parts[1]))
+
+    def _measure_setting(self, concurrency, fair, items):
+        """
+        Description:
+            Run the firewall rule plan with one worker setting and remove
+            the rules again
+        Return:
+            dict, The setting and its measurements
+        """
+        self.celery_workers.set_options(concurrency, fair)
+        self.model_builder.add_items(items)
+        self.model_builder.apply()
+        self.execute_cli_createplan_cmd(self.ms1)
+
+        self.queue_depths = {}
+        task_timeline = PlanTimeline()
+        self.plan_waiter.subscribe(task_timeline.observe, 'plan_timeline')
+        self.plan_waiter.subscribe(self._sample_queue_depths,
+                                   'queue_depths')
+        start = time.time()
+        self.execute_cli_runplan_cmd(self.ms1)
+        self.plan_waiter.wait_for('plan_timeline', timeout=1800,
+                                  poll_interval=2)
+        wall_time = time.time() - start
+        self.plan_waiter.unsubscribe('queue_depths')
+        self.assertEqual(const.PLAN_COMPLETE,
+                         self.get_current_plan_state(self.ms1))
+
+        metrics_log = MetricsLog.from_node(self, self.ms1, const.METRICS_LOG)
+        phases = PlanTimeline.from_metrics(metrics_log).select('phase')
+        latencies = sorted(span.end - span.start for span in phases)
+        result = {
+            'concurrency': concurrency,
+            'fair': fair,
+            'wall_time': wall_time,
+            'run_time': metrics_log.values(PLAN_RUN, 'TimeTaken')[-1],
+            'phases': len(latencies),
+            'phase_latency_avg': sum(latencies) / len(latencies)
+                                 if latencies else 0.0,
+            'phase_latency_max': latencies[-1] if latencies else 0.0,
+            'max_parallel_phases':
+                PlanTimeline.parallelism(phases)['max_concurrency'],
+            'max_queue_depth': max(self.queue_depths.values() or [0]),
+            'queue_depths': self.queue_depths,
+        }
+
+        self.assertEqual([], self.model_builder.cleanup(),
+                         'The sweep items were not all removed')
+        self.run_and_check_plan(self.ms1, const.PLAN_COMPLETE,
+                                plan_timeout_mins=30, add_to_cleanup=False)
+        return result
+
+    @attr('manual-test', 'non-revert', 'story124425',
+          'story124425_worker_sweep_tc01')
+    def test_01_p_celery_worker_sweep(self):
+        """
+        @tms_id: torf_124425_worker_sweep_tc01
+        @tms_requirements_id: TORF-124425
+        @tms_title: Benchmark a parallel plan against Celery worker settings
+        @tms_description: Runs the TORF-124437 firewall rule plan on every
+         cluster with a sweep of litpTask worker concurrency and fair
+         scheduling, and records the plan wall time, the phase latencies,
+         the phases run in parallel and the RabbitMQ queue depths
+        @tms_test_steps:
+         @step: for every setting, set the litpTask worker options and
+                restart Celery
+         @result: Celery restarted with the setting
+         @step: create firewall rules on the first node of every cluster,
+                create and run the plan
+         @result: the plan completes
+         @step: remove the rules and run the plan
+         @result: the plan completes
+         @result: the tuning table is logged and saved to
+                  celery_worker_sweep_results.json in the temporary
+                  directory
+        @tms_test_precondition: A multi cluster deployment
+        @tms_execution_type: Automated
+        """
+        items = self._firewall_rules()
+        self.backup_file(self.ms1, const.METRICS_LOG, backup_mode_cp=False)
+
+        results = []
+        for concurrency, fair in SWEEP:
+            self.log('info', 'litpTask concurrency={0} fair={1}'
+                     .format(concurrency, fair))
+            results.append(self._measure_setting(concurrency, fair, items))
+
+        self.log('info', 'concurrency fair wall_time run_time phases '
+                 'latency_avg latency_max parallel_phases max_queue_depth')
+        for result in results:
+            self.log('info', '{concurrency:>11} {fair!s:>5} '
+                     '{wall_time:>9.1f} {run_time:>8.1f} {phases:>6} '
+                     '{phase_latency_avg:>11.1f} {phase_latency_max:>11.1f} '
+                     '{max_parallel_phases:>15} {max_queue_depth:>15}'
+                     .format(**result))
+        with open(self.results_file, 'w') as results_file:
+            json.dump(results, results_file, indent=4, sort_keys=True)
+        self.log('info', 'results saved to {0}'.format(self.results_file))
@@ -0,0 +1,347 @@
+"""
+COPYRIGHT Ericsson 2026
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     October 2026
+@author:    LITP Core Testware
+@summary:   Model migration benchmark.
+            Thousands of migrations-node-config and package items are
+            migrated forwards and backwards by AddProperty, RenameProperty,
+            UpdateCollectionType and the LITPCDS-2509 style merge and split
+            operations. Each migration records the litpd restart wall time
+            and the peak memory of litpd.
+"""
+from litp_generic_test import GenericTest, attr
+from bulk_model_builder import BulkModelBuilder
+from ssh_session_pool import SSHSessionPool
+from log_follower import LogFollower
+from redhat_cmd_utils import RHCmdUtils
+import test_constants as const
+import json
+import os
+import tempfile
+import time
+
+NUM_NODE_CONFIGS = 2000
+# Every node config has a migration_items_collection; the first ones also
+# hold a migration-config so that non empty collections are converted too
+NUM_NODE_CONFIG_CHILDREN = 50
+NUM_PACKAGES = 2000
+
+OLD_VERSION = '1.2.1'
+NEW_VERSION = '1.2.2'
+
+FWD_LOG = 'INFO: forwards migrations to_apply:'
+BK_LOG = 'INFO: backwards migrations to_apply:'
+
+NODE_CONFIG_URL = '/ms/configs/mig_bench_{0:05d}'
+MERGE_PACKAGE_URL = '/software/items/mig_merge_{0:05d}'
+SPLIT_PACKAGE_URL = '/software/items/mig_split_{0:05d}'
+
+# (name, extension, migration script, item path checked, properties
+# expected after the forward and after the backward migration, None for a
+# property that must not be there)
+MIGRATION_ROUNDS = [
+    ('node_config', 'story1126_2509_5568',
+     'migration_benchmark_01_node_config.py', NODE_CONFIG_URL.format(0),
+     {'bench_added': 'bench', 'bench_name': 'mig_bench_00000',
+      'name': None},
+     {'name': 'mig_bench_00000', 'bench_added': None, 'bench_name': None}),
+    ('merge', 'package', 'migration_benchmark_02_merge.py',
+     MERGE_PACKAGE_URL.format(0),
+     {'release': 'mbench00000-1.0', 'name': None, 'version': None},
+     {'name': 'mbench00000', 'version': '1.0', 'release': None}),
+    ('split', 'package', 'migration_benchmark_03_split.py',
+     SPLIT_PACKAGE_URL.format(0),
+     {'name': 'mbench', 'version': '00000'},
+     {'name': 'mbench-00000', 'version': None}),
+]
+
+
+class MigrationBenchmark(GenericTest):
+    """
+    Benchmark of forward and backward model migrations on a large model
+    """
+
+    def setUp(self):
+        """ Runs before every single test """
+        super(MigrationBenchmark, self).setUp()
+        self.ms1 = self.get_management_node_filename()
+        self.rhc = RHCmdUtils()
+        self.plugin_id = 'story1126_2509_5568'
+        self.litp_service_bin_file_path = \
+                            '/opt/ericsson/nms/litp//bin/litp_service.py'
+        self.tmp_conf = '/tmp'
+        self.results_file = os.path.join(tempfile.gettempdir(),
+                                         'migration_benchmark_results.json')
+        self.ssh_pool = SSHSessionPool(self)
+        self.syslog = LogFollower(self.ssh_pool, self.ms1)
+        self.model_builder = BulkModelBuilder(self, self.ms1)
+        self._install_rpms()
+
+    def tearDown(self):
+        """ Runs after every single test """
+        self.model_builder.cleanup()
+        self.ssh_pool.close()
+        super(MigrationBenchmark, self).tearDown()
+
+    @staticmethod
+    def get_local_rpm_paths(path, rpm_id):
+        """
+        Description:
+        Method that returns a list of absolute paths to the
+        RPMs required to be installed for testing
+        """
+        rpm_names = [rpm for rpm in os.listdir(path) if rpm_id in rpm]
+        if not rpm_names:
+            return None
+        return [os.path.join(os.path.abspath(path), rpm) for rpm in rpm_names]
+
+    def _install_rpms(self):
+        """
+        Description:
+        Method that installs the story1126_2509_5568 plugin and extension,
+        which define migrations-node-config, if they are not already
+        installed
+        """
+        _, _, rcode = self.run_command(
+            self.ms1, self.rhc.check_pkg_installed([self.plugin_id]),
+            su_root=True)
+        if rcode == 1:
+            local_rpm_paths = self.get_local_rpm_paths(
+                os.path.abspath(
+                    os.path.join(os.path.dirname(__file__), 'plugins')
+                ),
+                self.plugin_id
+            )
+            self.assertTrue(
+                self.copy_and_install_rpms(self.ms1, local_rpm_paths))
+
+    def _populate(self):
+        """
+        Description:
+            Create the node configs and the packages to migrate, with one
+            "litp load" per collection
+        """
+        for index in range(NUM_NODE_CONFIGS):
+            self.model_builder.add_create(
+                NODE_CONFIG_URL.format(index), 'migrations-node-config',
+                {'name': 'mig_bench_{0:05d}'.format(index)})
+        for index in range(NUM_PACKAGES):
+            self.model_builder.add_create(
+                MERGE_PACKAGE_URL.format(index), 'package',
+                {'name': 'mbench{0:05d}'.format(index), 'version': '1.0'})
+            self.model_builder.add_create(
+                SPLIT_PACKAGE_URL.format(index), 'package',
+                {'name': 'mbench-{0:05d}'.format(index)})
+        self.model_builder.apply()
+
+        for index in range(NUM_NODE_CONFIG_CHILDREN):
+            self.model_builder.add_create(
+                '{0}/migration_items_collection/migration_config_01'
+                .format(NODE_CONFIG_URL.format(index)), 'migration-config')
+        self.model_builder.apply()
+
+    @staticmethod
+    def _conf_path(ext):
+        """ Return the path of the conf file of an extension """
+        return '{0}{1}_extension.conf'.format(const.LITP_EXT_PATH, ext)
+
+    def _migration_setup(self, ext):
+        """
+        Description:
+            Create the migrations directory of an extension and save its
+            conf file to /tmp
+        Args:
+            ext (str): The extension name
+        """
+        ext_path = '{0}{1}_extension'.format(const.LITP_MIG_PATH, ext)
+        _, _, rcode = self.run_command(
+            self.ms1, '/bin/mkdir -p {0} && /bin/touch {0}/__init__.py'
+            .format(ext_path), su_root=True)
+        self.assertEqual(0, rcode)
+        self.assertTrue(self.cp_file_on_node(self.ms1, self._conf_path(ext),
+                                             self.tmp_conf, su_root=True))
+
+    def _migration_cleanup(self, ext, mig_script):
+        """
+        Description:
+            Restore the conf file of an extension and remove the migration
+            script
+        Args:
+            ext (str): The extension name
+            mig_script (str): The migration script file name
+        """
+        self.assertTrue(self.cp_file_on_node(
+            self.ms1, '{0}/{1}_extension.conf'.format(self.tmp_conf, ext),
+            self._conf_path(ext), su_root=True))
+        self.remove_item(self.ms1, '{0}{1}_extension/{2}*'.format(
+            const.LITP_MIG_PATH, ext, os.path.splitext(mig_script)[0]),
+            su_root=True)
+
+    def _change_config_version(self, ext, new_version):
+        """
+        Description:
+            Change the version in the conf file of an extension
+        Args:
+            ext (str): The extension name
+            new_version (str): The version to set
+        """
+        conf_file_path = self._conf_path(ext)
+        for line in self.get_file_contents(self.ms1, conf_file_path):
+            if 'version' in line:
+                cmd = self.rhc.get_replace_str_in_file_cmd(
+                    line.split('=')[-1], new_version, conf_file_path,
+                    sed_args='-i')
+                _, _, rcode = self.run_command(self.ms1, cmd, su_root=True)
+                self.assertEqual(0, rcode)
+
+    def _get_litpd_peak_rss(self):
+        """
+        Description:
+            Return the peak resident memory of the litpd daemon since it
+            started, which includes the migrations it applied on startup
+        Return:
+            int, The peak RSS in KiB
+        """
+        cmd = '/bin/grep VmHWM /proc/$(/usr/bin/pgrep -xf "python {0} ' \
+              '--daemonize" -P 1)/status'.format(
+                  self.litp_service_bin_file_path)
+        stdout, _, rcode = self.run_command(self.ms1, cmd, su_root=True)
+        self.assertEqual(0, rcode, 'Cannot read the memory of litpd')
+        return int(stdout[0].split()[1])
+
+    def _restart_litpd(self, expect_log=None):
+        """
+        Description:
+            Restart litpd, which applies the pending migrations, and
+            measure it
+        Args:
+            expect_log (str): A log litpd must write while restarting
+        Return:
+            dict, The restart wall time and the litpd peak RSS
+        """
+        self.syslog.mark()
+        start = time.time()
+        self.restart_litpd_service(self.ms1)
+        wall_time = time.time() - start
+        if expect_log:
+            found = self.syslog.search({expect_log: expect_log})
+            self.assertTrue(expect_log in found,
+                            '"{0}" not logged'.format(expect_log))
+        return {'wall_time': wall_time,
+                'peak_rss_kb': self._get_litpd_peak_rss()}
+
+    def _check_props(self, url, expected):
+        """
+        Description:
+            Check the properties of an item after a migration
+        Args:
+            url (str): The item path
+            expected (dict): The expected values, None for a property that
+                             must not be there
+        """
+        props = self.get_props_from_url(self.ms1, url)
+        for prop, value in expected.items():
+            self.assertEqual(value, props.get(prop),
+                             '{0}: unexpected {1}'.format(url, prop))
+
+    def _measure_round(self, name, ext, mig_script, url, forward_props,
+                       backward_props):
+        """
+        Description:
+            Migrate the model forwards and backwards with one migration
+            script and return the measurements
+        Return:
+            dict, The restart measurements of the round
+        """
+        self._migration_setup(ext)
+        try:
+            self._change_config_version(ext, OLD_VERSION)
+            baseline = self._restart_litpd()
+
+            self.assertTrue(self.copy_file_to(
+                self.ms1,
+                os.path.join(os.path.dirname(__file__), 'migration_scripts',
+                             mig_script),
+                '{0}{1}_extension/{2}'.format(const.LITP_MIG_PATH, ext,
+                                              mig_script),
+                root_copy=True))
+
+            self._change_config_version(ext, NEW_VERSION)
+            forward = self._restart_litpd(FWD_LOG)
+            self._check_props(url, forward_props)
+            if name == 'node_config':
+                self.assertEqual(
+                    'collection-of-node-config',
+                    self.execute_show_data_cmd(
+                        self.ms1,
+                        '{0}/migration_items_collection'.format(url),
+                        'type'))
+
+            self._change_config_version(ext, OLD_VERSION)
+            backward = self._restart_litpd(BK_LOG)
+            self._check_props(url, backward_props)
+        finally:
+            self._migration_cleanup(ext, mig_script)
+            self.restart_litpd_service(self.ms1)
+
+        return {'round': name,
+                'baseline_time': baseline['wall_time'],
+                'baseline_peak_rss_kb': baseline['peak_rss_kb'],
+                'forward_time': forward['wall_time'],
+                'forward_peak_rss_kb': forward['peak_rss_kb'],
+                'backward_time': backward['wall_time'],
+                'backward_peak_rss_kb': backward['peak_rss_kb']}
+
+    @attr('all', 'non-revert', 'migration_benchmark',
+          'migration_benchmark_tc01')
+    def test_01_p_migration_operations_benchmark(self):
+        """
+        @tms_id: migration_benchmark_tc01
+        @tms_requirements_id: LITPCDS-2509
+        @tms_title: Benchmark model migrations on a large model
+        @tms_description: Loads thousands of migrations-node-config and
+         package items and migrates them forwards and backwards with
+         AddProperty, RenameProperty and UpdateCollectionType and with
+         custom merge and split property operations. The litpd restart
+         wall time and the litpd peak RSS of every migration are recorded
+        @tms_test_steps:
+         @step: load the node configs and the packages
+         @result: items are created
+         @step: for every migration script, restart litpd with the old
+                extension version, then copy the script and restart
+                litpd with the new version
+         @result: the forwards migration is logged and applied
+         @step: restart litpd with the old extension version
+         @result: the backwards migration is logged and reverted
+         @result: the measurements are logged and saved to
+                  migration_benchmark_results.json in the temporary
+                  directory
+        @tms_test_precondition: story1126_2509_5568 plugin and extension
+                                RPMs in plugins/
+        @tms_execution_type: Automated
+        """
+        self._populate()
+
+        results = []
+        for migration_round in MIGRATION_ROUNDS:
+            self.log('info', 'Migration round "{0}"'.format(
+                migration_round[0]))
+            results.append(self._measure_round(*migration_round))
+
+        self.log('info', 'round baseline_time forward_time backward_time '
+                 'baseline_peak_rss_kb forward_peak_rss_kb '
+                 'backward_peak_rss_kb')
+        for result in results:
+            self.log('info', '{round} {baseline_time:.1f} '
+                     '{forward_time:.1f} {backward_time:.1f} '
+                     '{baseline_peak_rss_kb} {forward_peak_rss_kb} '
+                     '{backward_peak_rss_kb}'.format(**result))
+        with open(self.results_file, 'w') as results_file:
+            json.dump(results, results_file, indent=4, sort_keys=True)
+        self.log('info', 'results saved to {0}'.format(self.results_file))
@@ -0,0 +1,232 @@
+"""
+COPYRIGHT Ericsson 2026
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     October 2026
+@author:    LITP Core Testware
+@summary:   MS recovery time from a streaming LITP state backup.
+            The steps of the recovery that do not depend on each other are
+            overlapped: the archive is copied back to the MS while litpd is
+            stopped and puppet disabled, and the restore loads the DB while
+            it extracts the archive and puts the manifests in place. The
+            time of each stage is recorded and the whole recovery must fit
+            in a time budget.
+"""
+from litp_generic_test import GenericTest, attr
+from ssh_session_pool import SSHSessionPool
+from stream_backup import StreamBackup, DIGEST_SUFFIX
+from model_snapshot import LITP_PATH
+import test_constants as const
+import json
+import os
+import shutil
+import tempfile
+import threading
+import time
+import traceback
+
+RECOVERY_BUDGET_SECS = 300
+RESTORE_JOBS = 4
+PUPPET_DISABLE_CMD = '{0} agent --disable'.format(const.PUPPET_PATH)
+PUPPET_ENABLE_CMD = '{0} agent --enable'.format(const.PUPPET_PATH)
+LITPD_STOP_CMD = '{0} stop litpd'.format(const.SYSTEMCTL_PATH)
+LITPD_START_CMD = '{0} start litpd'.format(const.SYSTEMCTL_PATH)
+QUIESCE_CMDS = [LITPD_STOP_CMD, PUPPET_DISABLE_CMD]
+QUIESCE_TIMEOUT_SECS = 600
+
+
+class ParallelRestore(GenericTest):
+    """
+    Time of an MS recovery from a streaming backup with overlapped stages
+    """
+
+    def setUp(self):
+        """ Runs before every single test """
+        super(ParallelRestore, self).setUp()
+        self.ms1 = self.get_management_node_filename()
+        self.backup_dir = '/tmp/litp_parallel_restore_archives/'
+        self.restore_dir = '/tmp/litp_parallel_restore'
+        self.local_dir = tempfile.mkdtemp(prefix='parallel_restore_')
+        self.results_file = os.path.join(tempfile.gettempdir(),
+                                         'parallel_restore_results.json')
+        self.stream_backup = StreamBackup(self, self.ms1)
+        self.ssh_pool = SSHSessionPool(self)
+        self.package_url = self.find(self.ms1, '/software',
+                                     'collection-of-software-item')[0] + \
+            '/parallel_restore'
+        self.create_dir_on_node(self.ms1, self.backup_dir, su_root=True,
+                                add_to_cleanup=False)
+
+    def tearDown(self):
+        """ Runs after every single test """
+        # The rest of the cleanup runs before a failed restart is reported
+        cmds = [LITPD_START_CMD, PUPPET_ENABLE_CMD]
+        failures = ['"{0}" failed: {1}'.format(cmd, stderr)
+                    for cmd, (_, stderr, rcode) in zip(
+                        cmds, self.ssh_pool.run_commands(self.ms1, cmds,
+                                                         su_root=True))
+                    if rcode != 0]
+        if not self.wait_for_cmd(self.ms1, '{0} version'.format(LITP_PATH),
+                                 0, default_time=3):
+            failures.append('litpd did not start')
+        self.run_command(self.ms1, '{0} remove -p {1}'.format(
+            LITP_PATH, self.package_url))
+        self.stream_backup.cleanup()
+        self.remove_item(self.ms1, self.backup_dir, su_root=True)
+        self.remove_item(self.ms1, self.restore_dir, su_root=True)
+        self.ssh_pool.close()
+        shutil.rmtree(self.local_dir, ignore_errors=True)
+        super(ParallelRestore, self).tearDown()
+        self.assertEqual([], failures,
+                         'The MS was not restarted: {0}'.format(failures))
+
+    def _copy_back(self, local_paths):
+        """
+        Description:
+            Copy the backup files from the gateway to the backup directory
+        Args:
+            local_paths (list): The paths of the files on the gateway
+        """
+        for local_path in local_paths:
+            self.assertTrue(self.copy_file_to(
+                self.ms1, local_path, self.backup_dir, root_copy=True))
+
+    def _run_on_ms(self, cmds):
+        """ Run commands as root on the MS in one round trip """
+        self._check_results(cmds, self.ssh_pool.run_commands(
+            self.ms1, cmds, su_root=True))
+
+    def _check_results(self, cmds, results):
+        """ Assert that every command run on the MS succeeded """
+        for cmd, (_, stderr, rcode) in zip(cmds, results):
+            self.assertEqual(0, rcode, '"{0}" failed: {1}'.format(cmd,
+                                                                 stderr))
+
+    def _quiesce(self, outcome):
+        """
+        Description:
+            Stop litpd and disable puppet through the SSH session pool.
+            Runs on a thread of its own, so it only records its outcome
+        Args:
+            outcome (dict): Receives the 'results' of the commands, or the
+                            'error' raised, and the 'seconds' taken
+        """
+        start = time.time()
+        try:
+            outcome['results'] = self.ssh_pool.run_commands(
+                self.ms1, QUIESCE_CMDS, su_root=True)
+        except Exception:  # pylint: disable=W0703
+            outcome['error'] = traceback.format_exc()
+        outcome['seconds'] = time.time() - start
+
+    def _recover(self, archive, local_paths):
+        """
+        Description:
+            Recover the MS from an archive held on the gateway
+        Args:
+            archive (str): The path of the archive once on the MS
+            local_paths (list): The archive and its digest on the gateway
+        Return:
+            dict, The seconds of each recovery stage
+        """
+        stages = {}
+        start = time.time()
+        # Only the pooled SSH commands run on another thread, as the
+        # GenericTest helpers the copy uses are not thread-safe
+        outcome = {}
+        quiesce = threading.Thread(target=self._quiesce, args=(outcome,),
+                                   name='quiesce')
+        quiesce.daemon = True
+        quiesce.start()
+        self._copy_back(local_paths)
+        stages['copy'] = time.time() - start
+        quiesce.join(QUIESCE_TIMEOUT_SECS)
+        self.assertFalse(quiesce.is_alive(), 'The MS was not quiesced in '
+                         '{0}s'.format(QUIESCE_TIMEOUT_SECS))
+        self.assertFalse('error' in outcome, outcome.get('error'))
+        self._check_results(QUIESCE_CMDS, outcome['results'])
+        stages['quiesce'] = outcome['seconds']
+
+        result = self.stream_backup.restore(archive, self.restore_dir,
+                                            apply_state=True,
+                                            jobs=RESTORE_JOBS)
+        self.assertTrue(result['valid'], 'The restore of {0} failed: {1}'
+                        .format(archive, result['errors']))
+        for stage, seconds in result['stages'].items():
+            stages['restore_' + stage] = seconds
+
+        stage = time.time()
+        self._run_on_ms([LITPD_START_CMD, PUPPET_ENABLE_CMD])
+        self.assertTrue(self.wait_for_cmd(
+            self.ms1, '{0} version'.format(LITP_PATH), 0, default_time=3),
+            'litpd did not start')
+        stages['restart'] = time.time() - stage
+        stages['total'] = time.time() - start
+        return stages
+
+    @attr('all', 'revert', 'story315425',
+          'story315425_parallel_restore_tc01')
+    def test_01_p_parallel_restore_within_budget(self):
+        """
+        @tms_id: torf_315425_parallel_restore_tc01
+        @tms_requirements_id: TORF-107258
+        @tms_title: Recover the MS from a streaming backup within a budget
+        @tms_description: Takes a streaming backup and copies it to the
+         gateway, changes the model, then recovers the MS from the backup
+         with the independent stages overlapped and checks the recovery
+         time and the restored model
+        @tms_test_steps:
+         @step: take a streaming backup and copy it to the gateway
+         @result: the backup is valid
+         @step: create a package item
+         @result: the item is created
+         @step: copy the backup back to the MS while litpd is stopped and
+                puppet disabled, restore it loading the DB in parallel,
+                then start litpd and enable puppet
+         @result: the restore is valid and litpd is running
+         @result: the recovery took less than 300 seconds
+         @result: the package item is not in the model
+         @result: the stage times are logged and saved to
+                  parallel_restore_results.json in the temporary directory
+        @tms_test_precondition: NA
+        @tms_execution_type: Automated
+        """
+        self.log('info', '1. Take a streaming backup')
+        backup = self.stream_backup.backup(self.backup_dir)
+        local_paths = []
+        for remote_path in [backup['archive'],
+                            backup['archive'] + DIGEST_SUFFIX]:
+            local_path = os.path.join(self.local_dir,
+                                      os.path.basename(remote_path))
+            self.assertTrue(self.download_file_from_node(
+                self.ms1, remote_path, local_path, root_copy=True))
+            self.remove_item(self.ms1, remote_path, su_root=True)
+            local_paths.append(local_path)
+
+        self.log('info', '2. Create a package item')
+        self.execute_cli_create_cmd(self.ms1, self.package_url, 'package',
+                                    'name=parallel-restore',
+                                    add_to_cleanup=False)
+
+        self.log('info', '3. Recover the MS from the backup')
+        stages = self._recover(backup['archive'], local_paths)
+
+        self.log('info', 'stage seconds')
+        for stage in sorted(stages):
+            self.log('info', '{0:>16} {1:>7.2f}'.format(stage,
+                                                        stages[stage]))
+        with open(self.results_file, 'w') as results_file:
+            json.dump({'budget': RECOVERY_BUDGET_SECS, 'stages': stages},
+                      results_file, indent=4, sort_keys=True)
+        self.log('info', 'results saved to {0}'.format(self.results_file))
+        self.assertTrue(stages['total'] < RECOVERY_BUDGET_SECS,
+                        'The recovery took {0:.1f}s, over the {1}s budget'
+                        .format(stages['total'], RECOVERY_BUDGET_SECS))
+
+        self.log('info', '4. Check the package item is not in the model')
+        self.execute_cli_show_cmd(self.ms1, self.package_url,
+                                  expect_positive=False)
@@ -0,0 +1,102 @@
+"""
+COPYRIGHT Ericsson 2026
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     October 2026
+@author:    LITP Core Testware
+@summary:   Critical path and parallelism bounds of cluster dependencies.
+            The PhaseDag of a synthetic 20 cluster upgrade plan is built
+            for several dependency_list layouts, to show how much each
+            layout serialises the plan.
+"""
+from litp_generic_test import GenericTest, attr
+from phase_dag import PhaseDag
+
+NUM_CLUSTERS = 20
+PHASES_PER_CLUSTER = 3
+
+
+def upgrade_phases(clusters):
+    """
+    Description:
+        Return the phases of an upgrade plan: one MS phase, then the
+        phases of each cluster in turn
+    Args:
+        clusters (list): The cluster ids, in plan order
+    Return:
+        dict, The cluster ids of each phase keyed by phase number
+    """
+    phases = {1: set()}
+    for cluster in clusters:
+        for _ in range(PHASES_PER_CLUSTER):
+            phases[len(phases) + 1] = set([cluster])
+    return phases
+
+
+class PhaseDagBounds(GenericTest):
+    """
+    Phase graph bounds of 20 cluster upgrades with different dependencies
+    """
+
+    def setUp(self):
+        """ Runs before every single test """
+        super(PhaseDagBounds, self).setUp()
+        self.clusters = ['c{0}'.format(index)
+                         for index in range(1, NUM_CLUSTERS + 1)]
+        self.phases = upgrade_phases(self.clusters)
+
+    def tearDown(self):
+        """ Runs after every single test """
+        super(PhaseDagBounds, self).tearDown()
+
+    @attr('all', 'non-revert', 'story124437', 'story124437_phase_dag_tc01')
+    def test_01_p_phase_dag_bounds_of_dependency_lists(self):
+        """
+        @tms_id: torf_124437_phase_dag_tc01
+        @tms_requirements_id: TORF-124437
+        @tms_title: Critical path and parallelism of cluster dependencies
+        @tms_description: Builds the phase graph of a 20 cluster upgrade
+         plan with no dependencies, with two groups of ten clusters that
+         depend on the previous cluster of their group, and with a chain
+         of dependencies through every cluster
+        @tms_test_steps:
+         @step: build the phase graph without dependencies
+         @result: every cluster can run in parallel and the critical path
+                  is the MS phase and the phases of one cluster
+         @step: build the phase graph of the two dependency chains
+         @result: two clusters can run in parallel and the critical path
+                  goes through the ten clusters of a chain
+         @step: build the phase graph of the single dependency chain
+         @result: the phases run one at a time
+        @tms_test_precondition: NA
+        @tms_execution_type: Automated
+        """
+        half = NUM_CLUSTERS / 2
+        layouts = [
+            ('none', {}, NUM_CLUSTERS, 1 + PHASES_PER_CLUSTER),
+            ('two chains',
+             dict((cluster, set([self.clusters[index - 1]]))
+                  for index, cluster in enumerate(self.clusters)
+                  if index % half),
+             2, 1 + half * PHASES_PER_CLUSTER),
+            ('one chain',
+             dict((cluster, set([self.clusters[index - 1]]))
+                  for index, cluster in enumerate(self.clusters) if index),
+             1, 1 + NUM_CLUSTERS * PHASES_PER_CLUSTER),
+        ]
+        for name, dependencies, parallelism, path_length in layouts:
+            phase_dag = PhaseDag(self.phases, dependencies)
+            length, path = phase_dag.critical_path()
+            per_phase = phase_dag.max_parallelism_per_phase()
+            self.log('info', '{0}: max parallelism {1}, critical path {2} '
+                     'phases, phase 2 runs alongside {3} phases'
+                     .format(name, phase_dag.max_parallelism(), length,
+                             per_phase[2] - 1))
+            self.assertEqual(parallelism, phase_dag.max_parallelism())
+            self.assertEqual(path_length, length)
+            self.assertEqual(length, len(path))
+            self.assertEqual(1, per_phase[1])
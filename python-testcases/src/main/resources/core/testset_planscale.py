@@ -0,0 +1,237 @@
+"""
+COPYRIGHT Ericsson 2026
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     October 2026
+@author:    LITP Core Testware
+@summary:   create_plan scale benchmark.
+            The planscale plugin generates N nodes x M items x K task kinds,
+            with configurable OrderedTaskList depth and requires fan-in.
+            Each point of the sweep records the [LITP][PLAN][Create]
+            TimeTaken and the memory of litpd.
+"""
+from litp_generic_test import GenericTest, attr
+from bulk_model_builder import BulkModelBuilder
+from metrics_log import MetricsLog, PLAN_CREATE
+from model_snapshot import LITP_PATH
+from redhat_cmd_utils import RHCmdUtils
+import test_constants as const
+import json
+import os
+import tempfile
+
+SCALE_ITEM_TYPE = 'plan-scale-item'
+TASK_KINDS = ['config', 'callback', 'remote']
+
+
+class PlanScale(GenericTest):
+    """
+    Benchmark of create_plan against the size and shape of the plan
+    """
+
+    def setUp(self):
+        """ Runs before every single test """
+        super(PlanScale, self).setUp()
+        self.ms1 = self.get_management_node_filename()
+        self.rhc = RHCmdUtils()
+        self.plugin_id = 'planscale'
+        self.litp_service_bin_file_path = \
+                            '/opt/ericsson/nms/litp//bin/litp_service.py'
+        self.metrics_log_file = const.METRICS_LOG
+        self.results_file = os.path.join(tempfile.gettempdir(),
+                                         'planscale_results.json')
+        self.model_builder = BulkModelBuilder(self, self.ms1)
+        self._install_rpms()
+        self.node_urls = ['/ms'] + sorted(
+            self.get_node_url_from_filename(self.ms1, node)
+            for node in self.get_managed_node_filenames())
+
+        # Sweep points: (nodes, items per node, task kinds, ordered list
+        # depth, requires fan-in)
+        self.sweep = [
+            (1, 10, 1, 1, 0),
+            (1, 100, 1, 1, 0),
+            (1, 100, 3, 1, 0),
+            (len(self.node_urls), 100, 3, 1, 0),
+            (len(self.node_urls), 100, 3, 5, 0),
+            (len(self.node_urls), 100, 3, 1, 5),
+            (len(self.node_urls), 500, 3, 5, 5),
+        ]
+
+    def tearDown(self):
+        """ Runs after every single test """
+        # A failed sweep point may leave its plan and items behind
+        self.run_command(self.ms1, '{0} remove_plan'.format(LITP_PATH))
+        self.model_builder.cleanup()
+        super(PlanScale, self).tearDown()
+
+    @staticmethod
+    def get_local_rpm_paths(path, rpm_id):
+        """
+        Description:
+        Method that returns a list of absolute paths to the
+        RPMs required to be installed for testing
+        """
+        rpm_names = [rpm for rpm in os.listdir(path) if rpm_id in rpm]
+        if not rpm_names:
+            return None
+        return [os.path.join(os.path.abspath(path), rpm) for rpm in rpm_names]
+
+    def _install_rpms(self):
+        """
+        Description:
+        Method that installs the planscale plugin and extension
+        if they are not already installed
+        """
+        _, _, rcode = self.run_command(
+            self.ms1, self.rhc.check_pkg_installed([self.plugin_id]),
+            su_root=True)
+        if rcode == 1:
+            local_rpm_paths = self.get_local_rpm_paths(
+                os.path.abspath(
+                    os.path.join(os.path.dirname(__file__), 'plugins')
+                ),
+                self.plugin_id
+            )
+            self.assertNotEqual(None, local_rpm_paths,
+                                'The ERIClitpplanscale RPMs are not in '
+                                'plugins/')
+            self.assertTrue(
+                self.copy_and_install_rpms(self.ms1, local_rpm_paths))
+
+    def _get_litpd_rss(self):
+        """
+        Description:
+            Return the resident memory of the litpd daemon
+        Return:
+            int, The RSS in KiB
+        """
+        cmd = '/bin/ps -o rss= -p $(/usr/bin/pgrep -xf "python {0} ' \
+              '--daemonize" -P 1)'.format(self.litp_service_bin_file_path)
+        stdout, _, rcode = self.run_command(self.ms1, cmd, su_root=True)
+        self.assertEqual(0, rcode, 'Cannot read the memory of litpd')
+        return int(stdout[0])
+
+    @staticmethod
+    def _expected_tasks(nodes, items, kinds, depth):
+        """ Return the number of tasks the plugin generates """
+        per_item = len(kinds) - 1 + max(1, depth) if 'config' in kinds \
+            else len(kinds)
+        return nodes * items * per_item
+
+    def _populate(self, nodes, items, kinds, depth, fan_in):
+        """
+        Description:
+            Create the scale items and inherit them on the first nodes,
+            with one "litp load" per collection
+        Args:
+            nodes (int): The number of nodes, the MS first
+            items (int): The number of items per node
+            kinds (list): The task kinds of every item
+            depth (int): The OrderedTaskList depth
+            fan_in (int): The number of previous items required
+        """
+        props = {'task_kinds': ','.join(kinds),
+                 'ordered_depth': str(depth),
+                 'fan_in': str(fan_in)}
+        for index in range(items):
+            self.model_builder.add_create(
+                '/software/items/scale{0:04d}'.format(index),
+                SCALE_ITEM_TYPE, props)
+        self.model_builder.apply()
+        for node_url in self.node_urls[:nodes]:
+            for index in range(items):
+                self.model_builder.add_inherit(
+                    '{0}/items/scale{1:04d}'.format(node_url, index),
+                    '/software/items/scale{0:04d}'.format(index),
+                    SCALE_ITEM_TYPE)
+        self.model_builder.apply()
+
+    def _measure_point(self, nodes, items, num_kinds, depth, fan_in):
+        """
+        Description:
+            Populate the model for one sweep point, create the plan and
+            return its measurements
+        Return:
+            dict, The sweep point and its measurements
+        """
+        kinds = TASK_KINDS[:num_kinds]
+        self._populate(nodes, items, kinds, depth, fan_in)
+
+        rss_before = self._get_litpd_rss()
+        self.execute_cli_createplan_cmd(self.ms1)
+        rss_after = self._get_litpd_rss()
+
+        metrics_log = MetricsLog.from_node(self, self.ms1,
+                                           self.metrics_log_file)
+        plan = metrics_log.plans()[-1]
+        result = {
+            'nodes': nodes, 'items': items, 'kinds': num_kinds,
+            'depth': depth, 'fan_in': fan_in,
+            'expected_tasks': self._expected_tasks(nodes, items, kinds,
+                                                   depth),
+            'create_time': metrics_log.values(PLAN_CREATE, 'TimeTaken',
+                                              plan)[-1],
+            'tasks': metrics_log.values(PLAN_CREATE, 'TotalNoOfTasks',
+                                        plan)[-1],
+            'phases': metrics_log.values(PLAN_CREATE, 'NoOfPhases',
+                                         plan)[-1],
+            'rss_kb': rss_after,
+            'rss_delta_kb': rss_after - rss_before,
+        }
+
+        self.execute_cli_removeplan_cmd(self.ms1)
+        self.model_builder.cleanup()
+        return result
+
+    @attr('all', 'non-revert', 'planscale', 'planscale_tc01')
+    def test_01_p_create_plan_scale_sweep(self):
+        """
+        @tms_id: planscale_tc01
+        @tms_requirements_id: planscale
+        @tms_title: Benchmark create_plan against the plan size and shape
+        @tms_description: Sweeps the number of nodes, items per node,
+         task kinds, OrderedTaskList depth and requires fan-in generated
+         by the planscale plugin, and records the create_plan TimeTaken
+         from /var/log/litp/metrics.log and the memory of litpd
+        @tms_test_steps:
+         @step: for every sweep point, load the plan-scale-items and
+                inherit them on the nodes
+         @result: items are created
+         @step: create plan
+         @result: plan is created with at least the tasks generated by
+                  the planscale plugin
+         @step: read the create plan metrics and the litpd RSS, remove
+                the plan and the items
+         @result: the measurements are logged and saved to
+                  planscale_results.json in the temporary directory
+        @tms_test_precondition: planscale plugin and extension RPMs in
+                                plugins/
+        @tms_execution_type: Automated
+        """
+        self.backup_file(self.ms1, self.metrics_log_file,
+                         backup_mode_cp=False)
+
+        results = []
+        for point in self.sweep:
+            self.log('info', 'nodes={0} items={1} kinds={2} depth={3} '
+                     'fan_in={4}'.format(*point))
+            result = self._measure_point(*point)
+            self.assertTrue(result['tasks'] >= result['expected_tasks'],
+                'Plan has {0} tasks, expected at least {1}'
+                .format(result['tasks'], result['expected_tasks']))
+            results.append(result)
+
+        self.log('info', 'nodes items kinds depth fan_in tasks phases '
+                 'create_time rss_kb rss_delta_kb')
+        for result in results:
+            self.log('info', '{nodes} {items} {kinds} {depth} {fan_in} '
+                     '{tasks} {phases} {create_time:.3f} {rss_kb} '
+                     '{rss_delta_kb}'.format(**result))
+        with open(self.results_file, 'w') as results_file:
+            json.dump(results, results_file, indent=4, sort_keys=True)
+        self.log('info', 'results saved to {0}'.format(self.results_file))
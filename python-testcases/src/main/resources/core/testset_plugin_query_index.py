@@ -0,0 +1,169 @@
+"""
+COPYRIGHT Ericsson 2026
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     October 2026
+@author:    LITP Core Testware
+@summary:   Micro-benchmark of the QueryIndex used by the test plugins.
+            The nested node.query() lookups of the test plugins and the
+            QueryIndex lookups are run on a synthetic 200 node model that
+            queries like the plugin API, counting the items each one walks
+            and logging the time taken.
+"""
+from litp_generic_test import GenericTest, attr
+from plugin_query_index import QueryIndex
+import time
+
+NUM_NODES = 200
+NUM_SOURCE_ITEMS = 20
+ITEM_TYPE = 'story4429'
+
+
+class SyntheticItem(object):
+    """
+    Model item answering query() by walking its subtree, like a QueryItem.
+    The items walked by all queries are counted in visited.
+    """
+
+    visited = 0
+
+    def __init__(self, vpath, item_type, name=None, source=None):
+        self.vpath = vpath
+        self.item_type = item_type
+        self.name = name
+        self.source = source
+        self.hostname = vpath.split('/')[-1]
+        self.children = []
+
+    def add(self, child):
+        """ Add a child item and return it """
+        self.children.append(child)
+        return child
+
+    def get_vpath(self):
+        """ Return the path of the item """
+        return self.vpath
+
+    def get_source(self):
+        """ Return the item this item is inherited from, or itself """
+        return self.source or self
+
+    def query(self, item_type):
+        """ Return the items of a type in the subtree of the item """
+        found = []
+        for child in self.children:
+            SyntheticItem.visited += 1
+            if child.item_type == item_type:
+                found.append(child)
+            found.extend(child.query(item_type))
+        return found
+
+
+def build_model(num_nodes, num_source_items):
+    """
+    Description:
+        Build a deployment of num_nodes nodes and the ms, each inheriting
+        every one of num_source_items items
+    Return:
+        SyntheticItem, The root item
+    """
+    root = SyntheticItem('/', 'root')
+    software = root.add(SyntheticItem('/software', 'software'))
+    sources = [software.add(SyntheticItem(
+        '/software/items/test_{0:02d}'.format(index), ITEM_TYPE,
+        'test_{0:02d}'.format(index))) for index in range(num_source_items)]
+    nodes = [root.add(SyntheticItem('/ms', 'ms'))]
+    for index in range(num_nodes):
+        nodes.append(root.add(SyntheticItem(
+            '/deployments/d1/clusters/c1/nodes/node{0}'.format(index),
+            'node')))
+    for node in nodes:
+        for source in sources:
+            node.add(SyntheticItem(
+                '{0}/items/{1}'.format(node.vpath, source.name), ITEM_TYPE,
+                source.name, source))
+    return root
+
+
+class PluginQueryIndex(GenericTest):
+    """
+    Benchmark of the plugin side QueryIndex against nested node.query()
+    """
+
+    def setUp(self):
+        """ Runs before every single test """
+        super(PluginQueryIndex, self).setUp()
+        self.model = build_model(NUM_NODES, NUM_SOURCE_ITEMS)
+
+    def tearDown(self):
+        """ Runs after every single test """
+        super(PluginQueryIndex, self).tearDown()
+
+    def _nested_lookup(self):
+        """ The lookups of story4429_plugin before the QueryIndex """
+        references = []
+        nodes = self.model.query('node') + self.model.query('ms')
+        for model_item in self.model.query(ITEM_TYPE):
+            if model_item.get_source() is not model_item:
+                continue
+            for node in nodes:
+                references.extend(
+                    ref_item for ref_item in node.query(ITEM_TYPE)
+                    if ref_item.get_source().get_vpath() ==
+                    model_item.get_vpath())
+        return references
+
+    def _indexed_lookup(self):
+        """ The same lookups through a QueryIndex """
+        references = []
+        index = QueryIndex(self.model, [ITEM_TYPE])
+        for model_item in index.items(ITEM_TYPE):
+            if model_item.get_source() is not model_item:
+                continue
+            for node in index.get_nodes(include_ms=True):
+                references.extend(index.references(node, ITEM_TYPE,
+                                                   model_item))
+        return references
+
+    @attr('all', 'non-revert', 'plugin_query_index',
+          'plugin_query_index_tc01')
+    def test_01_p_query_index_benchmark(self):
+        """
+        @tms_id: plugin_query_index_tc01
+        @tms_requirements_id: NA
+        @tms_title: Benchmark the test plugin query index
+        @tms_description: Runs the reference item lookups of the test
+         plugins with nested node.query() calls and with a QueryIndex on a
+         synthetic 200 node model and counts the model items each walks
+        @tms_test_steps:
+         @step: run the nested and the indexed lookups
+         @result: both find the same items
+         @result: the indexed lookup walks fewer model items
+        @tms_test_precondition: NA
+        @tms_execution_type: Automated
+        """
+        SyntheticItem.visited = 0
+        start = time.time()
+        nested = self._nested_lookup()
+        nested_time = time.time() - start
+        nested_visited = SyntheticItem.visited
+
+        SyntheticItem.visited = 0
+        start = time.time()
+        indexed = self._indexed_lookup()
+        indexed_time = time.time() - start
+        indexed_visited = SyntheticItem.visited
+
+        self.log('info', 'nodes={0} items={1} nested={2:.3f}s/{3} walked '
+                 'indexed={4:.3f}s/{5} walked'.format(
+                     NUM_NODES, NUM_SOURCE_ITEMS, nested_time,
+                     nested_visited, indexed_time, indexed_visited))
+        self.assertEqual([item.get_vpath() for item in nested],
+                         [item.get_vpath() for item in indexed])
+        self.assertTrue(indexed_visited < nested_visited,
+                        'QueryIndex lookup walked {0} items, the nested '
+                        'lookup {1}'.format(indexed_visited, nested_visited))
@@ -0,0 +1,208 @@
+"""
+COPYRIGHT Ericsson 2026
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     October 2026
+@author:    LITP Core Testware
+@summary:   Per node against grouped RemoteExecutionTasks.
+            The mockpackagerpc plugin generates the same "service status"
+            remote call on every node, as one task per node (mock-package
+            version 11.0) or as one multi-node task (version 12.0). The
+            number of tasks, of MCollective requests and the plan duration
+            of both shapes are compared and saved.
+"""
+import json
+import os
+import re
+import tempfile
+import time
+import test_constants as const
+from litp_generic_test import GenericTest, attr
+from redhat_cmd_utils import RHCmdUtils
+from litp_cli_utils import CLIUtils
+from plan_model import PlanModelCache
+from ssh_session_pool import SSHSessionPool
+from log_follower import LogFollower
+from metrics_log import MetricsLog, PLAN_RUN
+
+# The MCollective requests logged by litpd on the MS
+MCO_REQUEST_REGEX = re.compile(r'\bmco\b.*\bservice\b.*\bstatus\b',
+                               re.IGNORECASE)
+# Installed only by the mockpackagerpc rpms that group the remote calls
+GROUPING_MODULE = \
+    '/opt/ericsson/nms/litp/lib/mockpackagerpc_plugin/rpc_task_grouping.py'
+
+
+class RpcTaskGrouping(GenericTest):
+    """
+    Compare the plans of identical remote calls generated as one
+    RemoteExecutionTask per node and as one task for all the nodes
+    """
+
+    def setUp(self):
+        """ Runs before every single test """
+        super(RpcTaskGrouping, self).setUp()
+        self.ms1 = self.get_management_node_filename()
+        self.managed_nodes = self.get_managed_node_filenames()
+        self.rhc = RHCmdUtils()
+        self.cli = CLIUtils()
+        self.plan_models = PlanModelCache(self.cli)
+        self.ssh_pool = SSHSessionPool(self)
+        self.plugin_type = 'mock-package'
+        self.properties = 'name=\'{0}\' version=\'{1}\''
+        self.test_plugins = (
+            'ERIClitpmockpackageapi.rpm',
+            'ERIClitpmockpackagerpc.rpm')
+        self.results_file = os.path.join(tempfile.gettempdir(),
+                                         'rpc_task_grouping_results.json')
+        self._install_rpms()
+
+    def tearDown(self):
+        """ Runs after every single test """
+        self.ssh_pool.close()
+        super(RpcTaskGrouping, self).tearDown()
+
+    def _install_rpms(self):
+        """
+        Description:
+        Method that installs plugins and extensions
+        if they are not already installed. A mockpackagerpc plugin
+        installed from an rpm without the grouped calls is replaced.
+        """
+        test_plugins = self.test_plugins
+        _, _, rcode = self.run_command(
+            self.ms1, self.rhc.check_pkg_installed(
+                [plugin.split('.rpm')[0] for plugin in test_plugins]),
+            su_root=True)
+
+        if rcode == 0:
+            _, _, rcode = self.run_command(
+                self.ms1, 'test -f {0}'.format(GROUPING_MODULE),
+                su_root=True)
+            if rcode != 0:
+                _, _, rcode = self.run_command(
+                    self.ms1, self.rhc.get_yum_remove_cmd(
+                        ['ERIClitpmockpackagerpc_CXP1234567']),
+                    add_to_cleanup=False, su_root=True)
+                self.assertEqual(0, rcode)
+                test_plugins = ('ERIClitpmockpackagerpc.rpm',)
+                rcode = 1
+
+        if rcode == 1:
+            plugin_dir = os.path.abspath(
+                os.path.join(os.path.dirname(__file__), 'plugins'))
+            local_rpm_paths = [os.path.join(plugin_dir, plugin)
+                               for plugin in test_plugins]
+            self.assertTrue(
+                self.copy_and_install_rpms(self.ms1, local_rpm_paths))
+
+    def _create_packages(self, package_name, version):
+        """
+        Description:
+            Create a mock-package and inherit it on the MS and on every
+            managed node
+        Args:
+            package_name (str): The name property of the package
+            version (str): The version that selects the task shape
+        """
+        source_path = '/software/items/{0}'.format(package_name)
+        self.execute_cli_create_cmd(
+            self.ms1, source_path, self.plugin_type,
+            self.properties.format(package_name, version))
+
+        node_urls = ['/ms'] + [
+            self.get_node_url_from_filename(self.ms1, node)
+            for node in self.managed_nodes]
+        for node_url in node_urls:
+            self.execute_cli_inherit_cmd(
+                self.ms1, '{0}/items/{1}'.format(node_url, package_name),
+                source_path)
+
+    def _measure_shape(self, package_name, version):
+        """
+        Description:
+            Create and run the plan of one task shape
+        Args:
+            package_name (str): The name property of the package
+            version (str): The version that selects the task shape
+        Return:
+            dict, The number of tasks, MCollective requests and the plan
+                  duration
+        """
+        self._create_packages(package_name, version)
+        self.execute_cli_createplan_cmd(self.ms1)
+        plan = self.plan_models.from_node(self, self.ms1)
+        tasks = plan.find_tasks(
+            description='RPCTask for {0}:'.format(package_name))
+
+        follower = LogFollower(self.ssh_pool, self.ms1)
+        follower.mark()
+        start = time.time()
+        self.execute_cli_runplan_cmd(self.ms1)
+        self.assertTrue(self.wait_for_plan_state(self.ms1,
+                                                 const.PLAN_COMPLETE))
+        duration = time.time() - start
+
+        requests = [line for line in follower.read_new_lines()
+                    if MCO_REQUEST_REGEX.search(line)]
+        metrics_log = MetricsLog.from_node(self, self.ms1, const.METRICS_LOG)
+        run_times = metrics_log.values(PLAN_RUN, 'TimeTaken')
+
+        return {'tasks': len(tasks),
+                'phases': plan.num_phases(),
+                'mco_requests': len(requests),
+                'duration': duration,
+                'run_time': run_times[-1] if run_times else None}
+
+    @attr('all', 'non-revert', 'story1575', 'story1575_grouping_tc01')
+    def test_01_p_grouped_rpc_tasks_against_per_node(self):
+        """
+        @tms_id: litpcds_1575_grouping_tc01
+        @tms_requirements_id: LITPCDS-1575
+        @tms_title: Compare per node and grouped remote execution tasks
+        @tms_description: The same remote call on the MS and every managed
+         node is generated as one RemoteExecutionTask per node and as one
+         multi-node RemoteExecutionTask. The number of tasks, MCollective
+         requests and the plan durations of both plans are compared and
+         saved
+        @tms_test_steps:
+         @step: create and inherit a mock-package with version 11.0,
+                create plan, run plan
+         @result: the plan has one task per node and completes
+         @step: create and inherit a mock-package with version 12.0,
+                create plan, run plan
+         @result: the plan has fewer tasks than the per node plan and
+                  completes
+         @result: the grouped plan does not need more MCollective requests
+         @result: the plan durations of both plans are saved
+        @tms_test_precondition: A multi-node deployment
+        @tms_execution_type: Automated
+        """
+        num_nodes = len(self.managed_nodes) + 1
+
+        self.log('info', '1. Per node remote execution tasks')
+        per_node = self._measure_shape('pkg_rpc_per_node', '11.0')
+        self.assertEqual(num_nodes, per_node['tasks'])
+
+        self.log('info', '2. Grouped remote execution task')
+        grouped = self._measure_shape('pkg_rpc_grouped', '12.0')
+        # core may still split the task, e.g. per node of a locked cluster
+        self.assertTrue(1 <= grouped['tasks'] < per_node['tasks'],
+                        'The grouped plan has {0} tasks, the per node plan '
+                        '{1}'.format(grouped['tasks'], per_node['tasks']))
+
+        for shape, result in (('per node', per_node), ('grouped', grouped)):
+            self.log('info', '{0}: tasks={1[tasks]} phases={1[phases]} '
+                     'mco_requests={1[mco_requests]} '
+                     'duration={1[duration]:.1f}s run_time={1[run_time]}'
+                     .format(shape, result))
+        with open(self.results_file, 'w') as results_file:
+            json.dump({'per_node': per_node, 'grouped': grouped},
+                      results_file, indent=4, sort_keys=True)
+        self.log('info', 'results saved to {0}'.format(self.results_file))
+        self.assertTrue(grouped['mco_requests'] <= per_node['mco_requests'],
+                        'The grouped task needed more MCollective requests')
@@ -0,0 +1,256 @@
+"""
+COPYRIGHT Ericsson 2026
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     October 2026
+@author:    LITP Core Testware
+@summary:   Single pass against per operation model migration.
+            The property operations of the story1126 migration scripts are
+            applied to a synthetic upgrade sized model once per operation,
+            as the BaseMigration operations do, and grouped by item type in
+            a SinglePassOperation. The resulting models and the number of
+            model scans are compared. That the steps migrate like the litp
+            AddProperty, RemoveProperty and RenameProperty operations is
+            checked on the MS by story1126 test_06.
+"""
+from litp_generic_test import GenericTest, attr
+from single_pass_migration import SinglePassOperation, AddPropertyStep, \
+    RemovePropertyStep, RenamePropertyStep
+import copy
+import time
+
+NUM_ITEMS_PER_TYPE = 5000
+
+# The properties of the synthetic items of each type
+ITEM_PROPERTIES = {
+    'network-profile': {'management_network': 'mgmt'},
+    'storage-profile': {'storage_profile_name': 'sp1'},
+    'os-profile': {'name': 'sample-profile', 'arch': 'x86_64',
+                   'path': '/profiles/node-iso/'},
+    'physical-device': {'device_name': 'eth0'},
+    'volume-group': {'volume_group_name': 'vg_root'},
+    'file-system': {'size': '8G'},
+    'network': {'name': 'mgmt', 'default_gateway': 'true'},
+}
+
+# The supertype of the synthetic item types that extend another one
+ITEM_SUPERTYPES = {
+    'os-profile': 'profile',
+    'storage-profile': 'profile',
+}
+
+# The property operations of the story1126_test_01 and _03 scripts
+STEPS = [
+    AddPropertyStep('network-profile', 'prop4', 'ghi'),
+    RenamePropertyStep('network-profile', 'management_network',
+                       'mgmt_network'),
+    AddPropertyStep('storage-profile', 'prop1', 'storage1'),
+    RemovePropertyStep('storage-profile', 'storage_profile_name', 'sp1'),
+    AddPropertyStep('os-profile', 'prop1', 'os-profile-1'),
+    RemovePropertyStep('os-profile', 'arch', 'x86_64'),
+    RemovePropertyStep('os-profile', 'path', '/profiles/node-iso/'),
+    AddPropertyStep('physical-device', 'prop4', 'prp'),
+    AddPropertyStep('volume-group', 'prop2', 'null'),
+    RemovePropertyStep('file-system', 'size', '8G'),
+    AddPropertyStep('file-system', 'prop3', 'item'),
+    RenamePropertyStep('os-profile', 'name', 'updatedprop'),
+    AddPropertyStep('network', 'type', 'GSM'),
+    RenamePropertyStep('network', 'default_gateway', 'gateway_used'),
+]
+
+# Steps on a supertype and a subtype that touch the same property, so that
+# applying the third before the second gives another os-profile
+MIXED_TYPE_STEPS = [
+    AddPropertyStep('profile', 'prop5', 'first'),
+    RenamePropertyStep('os-profile', 'prop5', 'prop6'),
+    AddPropertyStep('profile', 'prop5', 'second'),
+]
+
+
+class SyntheticModelItem(object):
+    """
+    Model item with the property interface the migration operations use
+    """
+
+    def __init__(self, vpath, item_type_id, properties):
+        self.vpath = vpath
+        self.item_type_id = item_type_id
+        self.properties = dict(properties)
+
+    def __getattr__(self, name):
+        """ Return the value of a property, None if it is not set """
+        if name.startswith('__') or name == 'properties':
+            raise AttributeError(name)
+        return self.properties.get(name)
+
+    def set_property(self, name, value):
+        """ Set a property """
+        self.properties[name] = value
+
+    def delete_property(self, name):
+        """ Delete a property """
+        del self.properties[name]
+
+
+class SyntheticModelManager(object):
+    """
+    Model manager whose find_modelitems() scans every item of the model,
+    returning the items of the type and of the types that extend it
+    """
+
+    def __init__(self, items):
+        self.items = items
+        self.scans = 0
+        self.items_scanned = 0
+
+    def find_modelitems(self, item_type_id):
+        """ Return the items of a type """
+        self.scans += 1
+        self.items_scanned += len(self.items)
+        return [item for item in self.items
+                if item_type_id in (item.item_type_id,
+                                    ITEM_SUPERTYPES.get(item.item_type_id))]
+
+    def snapshot(self):
+        """ Return the properties of every item, by path """
+        return dict((item.vpath, dict(item.properties))
+                    for item in self.items)
+
+
+def build_model(num_items_per_type):
+    """
+    Description:
+        Build the items of every type of ITEM_PROPERTIES
+    Return:
+        list, The SyntheticModelItems
+    """
+    items = []
+    for item_type_id in sorted(ITEM_PROPERTIES):
+        for index in range(num_items_per_type):
+            items.append(SyntheticModelItem(
+                '/{0}/items/{1}'.format(item_type_id, index), item_type_id,
+                ITEM_PROPERTIES[item_type_id]))
+    return items
+
+
+class SinglePassMigration(GenericTest):
+    """
+    Compare single pass and per operation migrations of the same model
+    """
+
+    def setUp(self):
+        """ Runs before every single test """
+        super(SinglePassMigration, self).setUp()
+        self.items = build_model(NUM_ITEMS_PER_TYPE)
+
+    def tearDown(self):
+        """ Runs after every single test """
+        super(SinglePassMigration, self).tearDown()
+
+    @staticmethod
+    def _migrate(model_manager, operations, forward):
+        """
+        Description:
+            Apply the operations of a migration, in reverse order backwards
+        Return:
+            float, The time taken in seconds
+        """
+        start = time.time()
+        if forward:
+            for operation in operations:
+                operation.mutate_forward(model_manager)
+        else:
+            for operation in reversed(operations):
+                operation.mutate_backward(model_manager)
+        return time.time() - start
+
+    @attr('all', 'non-revert', 'story1126', 'story1126_single_pass_tc01')
+    def test_01_p_single_pass_migration_same_result(self):
+        """
+        @tms_id: litpcds_1126_single_pass_tc01
+        @tms_requirements_id: LITPCDS-1126
+        @tms_title: Single pass migration gives the per operation result
+        @tms_description: The property operations of the story1126
+         migration scripts are applied forwards and backwards to a synthetic
+         model of 35000 items, once as one operation per step and once as a
+         SinglePassOperation. Both give the same models, and the single
+         pass scans the model once per item type
+        @tms_test_steps:
+         @step: migrate two copies of the model forwards, per operation and
+                in a single pass
+         @result: the models are identical
+         @result: the single pass scans the model once per item type
+         @step: migrate both models backwards
+         @result: the models are identical to the original model
+        @tms_test_precondition: NA
+        @tms_execution_type: Automated
+        """
+        per_operation = SyntheticModelManager(copy.deepcopy(self.items))
+        single_pass = SyntheticModelManager(copy.deepcopy(self.items))
+        original = per_operation.snapshot()
+        per_operation_ops = [SinglePassOperation([step]) for step in STEPS]
+        single_pass_ops = [SinglePassOperation(STEPS)]
+        num_item_types = len(set(step.item_type_id for step in STEPS))
+
+        for forward in (True, False):
+            per_operation.scans = single_pass.scans = 0
+            per_operation.items_scanned = single_pass.items_scanned = 0
+            per_operation_time = self._migrate(per_operation,
+                                               per_operation_ops, forward)
+            single_pass_time = self._migrate(single_pass, single_pass_ops,
+                                             forward)
+            self.log('info', '{0}: per operation scans={1} items={2} '
+                     '{3:.3f}s, single pass scans={4} items={5} {6:.3f}s'
+                     .format('forwards' if forward else 'backwards',
+                             per_operation.scans,
+                             per_operation.items_scanned,
+                             per_operation_time, single_pass.scans,
+                             single_pass.items_scanned, single_pass_time))
+
+            self.assertEqual(per_operation.snapshot(), single_pass.snapshot())
+            self.assertEqual(len(STEPS), per_operation.scans)
+            self.assertEqual(num_item_types, single_pass.scans)
+
+        self.assertEqual(original, single_pass.snapshot())
+
+    @attr('all', 'non-revert', 'story1126', 'story1126_single_pass_tc02')
+    def test_02_p_single_pass_migration_supertype_and_subtype(self):
+        """
+        @tms_id: litpcds_1126_single_pass_tc02
+        @tms_requirements_id: LITPCDS-1126
+        @tms_title: Single pass migration of a supertype and a subtype
+        @tms_description: Steps on the profile supertype and on its
+         os-profile subtype that touch the same property are applied
+         forwards and backwards, once as one operation per step and once
+         as a SinglePassOperation. The step that cannot be moved ahead of
+         the subtype step gets a scan of its own, and both give the same
+         models
+        @tms_test_steps:
+         @step: migrate two copies of the model forwards, per operation and
+                in a single pass
+         @result: the models are identical
+         @result: the single pass scans the model once per step
+         @step: migrate both models backwards
+         @result: the models are identical to the original model
+        @tms_test_precondition: NA
+        @tms_execution_type: Automated
+        """
+        per_operation = SyntheticModelManager(copy.deepcopy(self.items))
+        single_pass = SyntheticModelManager(copy.deepcopy(self.items))
+        original = per_operation.snapshot()
+        per_operation_ops = [SinglePassOperation([step])
+                             for step in MIXED_TYPE_STEPS]
+        single_pass_ops = [SinglePassOperation(MIXED_TYPE_STEPS)]
+
+        for forward in (True, False):
+            single_pass.scans = 0
+            self._migrate(per_operation, per_operation_ops, forward)
+            self._migrate(single_pass, single_pass_ops, forward)
+            self.assertEqual(per_operation.snapshot(), single_pass.snapshot())
+            self.assertEqual(len(MIXED_TYPE_STEPS), single_pass.scans)
+
+        self.assertEqual(original, single_pass.snapshot())
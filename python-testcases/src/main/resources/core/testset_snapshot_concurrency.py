@@ -0,0 +1,230 @@
+"""
+COPYRIGHT Ericsson 2026
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     October 2026
+@author:    LITP Core Testware
+@summary:   Spread of the create_snapshot plan across the nodes.
+            The tasks of a named snapshot plan are timed from the plan
+            polls and grouped by node, to compare the plan wall time with
+            the snapshot time of the slowest node and of all the nodes in
+            sequence, with and without --exclude_nodes, and for a sweep of
+            the litpTask worker concurrency that caps the tasks run at once.
+"""
+from collections import defaultdict
+from litp_generic_test import GenericTest, attr
+from plan_state_waiter import PlanStateWaiter
+from plan_timeline import PlanTimeline, Span, phase_number
+from celery_workers import CeleryWorkers
+import test_constants as const
+import json
+import os
+import tempfile
+import time
+
+SNAPSHOT_NAME = 'concurrency'
+WORKER_SWEEP = [1, 2, 4, 8]
+
+
+class SnapshotConcurrency(GenericTest):
+    """
+    Benchmark of how the create_snapshot tasks run in parallel on the nodes
+    """
+
+    def setUp(self):
+        """ Runs before every single test """
+        super(SnapshotConcurrency, self).setUp()
+        self.ms1 = self.get_management_node_filename()
+        self.plan_waiter = PlanStateWaiter(self, self.ms1)
+        self.celery_workers = CeleryWorkers(self, self.ms1)
+        self.results_dir = tempfile.gettempdir()
+        self.node_urls = dict(
+            (self.get_node_att(node, 'hostname'),
+             self.get_node_url_from_filename(self.ms1, node))
+            for node in self.get_managed_node_filenames())
+        self.remove_all_snapshots(self.ms1)
+
+    def tearDown(self):
+        """ Runs after every single test """
+        self.celery_workers.cleanup()
+        self.remove_all_snapshots(self.ms1)
+        super(SnapshotConcurrency, self).tearDown()
+
+    def _task_nodes(self, plan):
+        """
+        Description:
+            Map the tasks of a plan to the node they run on, from the node
+            their item belongs to or, failing that, the node named in their
+            description
+        Args:
+            plan (dict): Plan data
+        Return:
+            dict, The hostname, or 'ms', keyed by (phase number, cluster,
+                  task description)
+        """
+        nodes = {}
+        for phase, clusters in plan['phases'].iteritems():
+            for cluster, tasks in clusters.iteritems():
+                for task in tasks:
+                    node = 'ms'
+                    for hostname, url in self.node_urls.iteritems():
+                        if task['url'].startswith(url + '/') or \
+                                '"{0}"'.format(hostname) in task['desc']:
+                            node = hostname
+                            break
+                    nodes[(phase_number(phase), cluster, task['desc'])] = \
+                        node
+        return nodes
+
+    def _measure_snapshot(self, excluded):
+        """
+        Description:
+            Create a named snapshot, time its tasks per node and remove it
+        Args:
+            excluded (list): The hostnames passed to --exclude_nodes
+        Return:
+            dict, The plan 'wall_time', the snapshot 'node_seconds' of
+                  every node, the 'slowest_node_seconds', the
+                  'serial_seconds' of all the nodes in sequence, the
+                  'wall_time_over_slowest_node' ratio, the 'phases' and
+                  how many ran at once, and the most tasks run at once on
+                  every cluster
+        """
+        args = '-n {0}'.format(SNAPSHOT_NAME)
+        if excluded:
+            args += ' --exclude_nodes="{0}"'.format(','.join(excluded))
+        timeline = PlanTimeline()
+        self.plan_waiter.subscribe(timeline.observe, 'snapshot_timeline')
+        start = time.time()
+        self.execute_cli_createsnapshot_cmd(self.ms1, args,
+                                            add_to_cleanup=False)
+        self.plan_waiter.wait_for('snapshot_timeline', timeout=3600,
+                                  poll_interval=1)
+        wall_time = time.time() - start
+        self.assertEqual(const.PLAN_COMPLETE,
+                         self.get_current_plan_state(self.ms1))
+
+        task_nodes = self._task_nodes(self.plan_waiter.last_plan)
+        node_spans = defaultdict(list)
+        phase_spans = {}
+        cluster_spans = defaultdict(list)
+        for span in timeline.select():
+            node_spans[task_nodes.get((span.lane, span.category, span.name),
+                                      'ms')].append(span)
+            cluster_spans[span.category].append(span)
+            phase = phase_spans.get(span.lane, span)
+            phase_spans[span.lane] = Span(
+                'Phase {0}'.format(span.lane), 'phase', span.lane,
+                min(phase.start, span.start), max(phase.end, span.end))
+        for hostname in excluded:
+            self.assertFalse(node_spans.get(hostname),
+                             'Snapshot tasks on excluded node {0}'
+                             .format(hostname))
+
+        node_seconds = dict(
+            (node, PlanTimeline.parallelism(spans)['busy_time'])
+            for node, spans in node_spans.iteritems())
+        slowest_node_seconds = max(node_seconds.values() or [0.0])
+        result = {
+            'excluded': excluded,
+            'wall_time': wall_time,
+            'node_seconds': node_seconds,
+            'slowest_node_seconds': slowest_node_seconds,
+            # 1.0 when the plan is no longer than the slowest node
+            'wall_time_over_slowest_node': wall_time / slowest_node_seconds
+                                           if slowest_node_seconds else None,
+            'serial_seconds': sum(node_seconds.values()),
+            'phases': len(phase_spans),
+            'max_parallel_phases': PlanTimeline.parallelism(
+                phase_spans.values())['max_concurrency'],
+            'cluster_max_tasks': dict(
+                (cluster, PlanTimeline.parallelism(spans)['max_concurrency'])
+                for cluster, spans in cluster_spans.iteritems()),
+        }
+
+        self.execute_cli_removesnapshot_cmd(
+            self.ms1, '-n {0}'.format(SNAPSHOT_NAME), add_to_cleanup=False)
+        self.assertTrue(self.wait_for_plan_state(self.ms1,
+                                                 const.PLAN_COMPLETE),
+                        'remove_snapshot did not complete')
+        return result
+
+    def _report(self, results, file_name):
+        """ Log the results table and save it to the results directory """
+        self.log('info', 'workers wall_time slowest_node ratio serial '
+                 'phases parallel_phases excluded')
+        for result in results:
+            ratio = result['wall_time_over_slowest_node']
+            self.log('info', '{0:>7} {wall_time:>9.1f} '
+                     '{slowest_node_seconds:>12.1f} {1:>5} '
+                     '{serial_seconds:>6.1f} {phases:>6} '
+                     '{max_parallel_phases:>15} {excluded}'.format(
+                         result.get('concurrency', '-'),
+                         '-' if ratio is None else '{0:.2f}'.format(ratio),
+                         **result))
+        results_path = os.path.join(self.results_dir, file_name)
+        with open(results_path, 'w') as results_file:
+            json.dump(results, results_file, indent=4, sort_keys=True)
+        self.log('info', 'results saved to {0}'.format(results_path))
+
+    @attr('manual-test', 'revert', 'story176181',
+          'story176181_snapshot_concurrency_tc01')
+    def test_01_p_snapshot_spread_across_nodes(self):
+        """
+        @tms_id: torf_176181_snapshot_concurrency_tc01
+        @tms_requirements_id: TORF-176181
+        @tms_title: Benchmark the spread of create_snapshot across nodes
+        @tms_description: Creates a named snapshot of every node and then
+         with one node excluded, and times the snapshot tasks of each node
+         to compare the plan wall time with the slowest node
+        @tms_test_steps:
+         @step: litp create_snapshot -n concurrency
+         @result: the plan completes
+         @step: litp create_snapshot -n concurrency --exclude_nodes with
+                one node
+         @result: the plan completes with no task on the excluded node
+         @result: the ratio of the plan wall time to the snapshot time of
+                  the slowest node is logged for each plan
+         @result: the measurements are logged and saved to
+                  snapshot_concurrency_results.json in the temporary
+                  directory
+        @tms_test_precondition: A deployment with two or more nodes
+        @tms_execution_type: Automated
+        """
+        results = [self._measure_snapshot([]),
+                   self._measure_snapshot(sorted(self.node_urls)[:1])]
+        self._report(results, 'snapshot_concurrency_results.json')
+
+    @attr('manual-test', 'revert', 'story176181',
+          'story176181_snapshot_concurrency_tc02')
+    def test_02_p_snapshot_worker_concurrency_sweep(self):
+        """
+        @tms_id: torf_176181_snapshot_concurrency_tc02
+        @tms_requirements_id: TORF-176181
+        @tms_title: Benchmark create_snapshot against the tasks run at once
+        @tms_description: Creates a named snapshot with a sweep of litpTask
+         worker concurrency, which caps how many snapshot tasks run at the
+         same time, and records the plan wall time against the snapshot
+         time of the slowest node and of all nodes in sequence
+        @tms_test_steps:
+         @step: for every setting, set the litpTask worker concurrency,
+                restart Celery and create a named snapshot
+         @result: the plan completes
+         @result: the measurements are logged and saved to
+                  snapshot_concurrency_sweep_results.json in the temporary
+                  directory
+        @tms_test_precondition: A deployment with two or more nodes
+        @tms_execution_type: Automated
+        """
+        results = []
+        for concurrency in WORKER_SWEEP:
+            self.log('info', 'litpTask concurrency={0}'.format(concurrency))
+            self.celery_workers.set_options(concurrency)
+            result = self._measure_snapshot([])
+            result['concurrency'] = concurrency
+            results.append(result)
+        self._report(results, 'snapshot_concurrency_sweep_results.json')
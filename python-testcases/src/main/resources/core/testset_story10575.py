@@ -17,6 +17,8 @@ import os
 import re
 from litp_generic_test import GenericTest, attr
 from redhat_cmd_utils import RHCmdUtils
+from ssh_session_pool import SSHSessionPool
+from puppet_manifest import ManifestReader
 import test_constants as const
 import time
 
@@ -45,11 +47,14 @@ class Story10575(GenericTest):
         self.timestamp_regex = re.compile(r'\w{3}\s+\d{1,2} \d{2}:\d{2}:\d{2}')
         self.litp_service_bin_file_path = \
                             '/opt/ericsson/nms/litp//bin/litp_service.py'
+        self.ssh_pool = SSHSessionPool(self)
+        self.manifests = ManifestReader(self.ssh_pool, self.ms1)
 
     def tearDown(self):
         """ Runs after every single test """
         super(Story10575, self).tearDown()
         self._uninstall_rpms()
+        self.ssh_pool.close()
 
     def ensure_puppet_is_not_running_or_about_to_run(self):
         """
@@ -104,14 +109,14 @@ class Story10575(GenericTest):
                               testing
         """
         rpms = self.get_local_rpm_path_ls(local_rpm_dir, rpm_filter)
-        rpms_to_install = []
-        for rpm in rpms:
-            pkg_name = (os.path.basename(rpm)).rstrip('.rpm')
-            is_pkg_installed = self.check_pkgs_installed(node,
-                                                         [pkg_name],
-                                                         su_root=True)
-            if not is_pkg_installed:
-                rpms_to_install.append(rpm)
+        # Query all the packages on the node in a single round trip
+        results = self.ssh_pool.run_commands(
+            node,
+            ['/bin/rpm -q {0}'.format((os.path.basename(rpm)).rstrip('.rpm'))
+             for rpm in rpms],
+            su_root=True)
+        rpms_to_install = [rpm for rpm, (_, _, rc) in zip(rpms, results)
+                           if rc != 0]
         if rpms_to_install:
             self.assertTrue(self.copy_and_install_rpms(node, rpms_to_install))
 
@@ -189,27 +194,24 @@ class Story10575(GenericTest):
         Returns:
         list, Puppet manifest lines if expect_positive=True
         """
-        grep_cmd = self.rhc.get_grep_file_cmd(
-            const.PUPPET_MANIFESTS_DIR + "/" + node + ".pp", task_id,
-            grep_args="-A 3 -B 2"
-        )
+        manifest_file = node + ".pp"
+        self.manifests.refresh(manifest_file)
+        manifest = self.manifests.get(manifest_file)
+        self.assertNotEqual(None, manifest,
+            'Puppet manifest "{0}" not found'.format(manifest_file))
 
-        std_out, std_err, rcode = self.run_command(self.ms1, grep_cmd,
-            su_root=True)
+        std_out = manifest.grep(task_id, before=2, after=3)
 
         if expect_positive:
             self.assertNotEqual([], std_out)
-            self.assertEqual([], std_err)
-            self.assertEqual(0, rcode)
 
             return std_out
 
         else:
             self.assertEqual([], std_out)
-            self.assertEqual([], std_err)
-            self.assertEqual(1, rcode)
 
-    def _get_puppet_manifest_data(self, manifest_file, class_id, log=True):
+    def _get_puppet_manifest_data(self, manifest_file, class_id, log=True,
+                                  refresh=True):
         """
         Description:
             Get contents of the class from specified puppet manifest file for
@@ -218,22 +220,15 @@ class Story10575(GenericTest):
             manifest_file (str): The manifest file to search
             class_id (str)     : The ID of the required class
             log (bool)         : Controls log dump
+            refresh (bool)     : Fetch the manifest again rather than reuse
+                                 the one already fetched
         Return:
             list, The content of the class definition
         """
-        manifest_file_path = os.path.join(const.PUPPET_MANIFESTS_DIR,
-                                          manifest_file)
-        cmd = '/bin/grep -F -A 15 "{0}" {1}'. \
-              format(class_id, manifest_file_path)
-        stdout, _, _ = self.run_command(self.ms1, cmd, logging=False,
-            su_root=True)
-
-        manifest_data = []
-        class_regex = re.compile('class ')
-        for i, line in enumerate(stdout[1:]):
-            if class_regex.match(line):
-                manifest_data = stdout[:i]
-                break
+        if refresh:
+            self.manifests.refresh(manifest_file)
+        manifest = self.manifests.get(manifest_file)
+        manifest_data = manifest.class_body(class_id) if manifest else []
         if log:
             for line in manifest_data:
                 self.log('info', line)
@@ -463,12 +458,15 @@ class Story10575(GenericTest):
             items (list)          : The items to check for
             class_ids (list)      : The class ids to check for
         """
+        # The manifest is fetched once for all the classes
+        self.manifests.refresh(ms_manifest_file)
         for item in items:
             for resource in class_ids:
                 if item.get(resource):
                     class_data = self._get_puppet_manifest_data(
                                                     ms_manifest_file,
-                                                    item[resource])
+                                                    item[resource],
+                                                    refresh=False)
                     self.assertNotEqual([], class_data,
                         'Puppet class "{0}" not found in manifest "{1}"'
                         .format(item[resource], ms_manifest_file))
@@ -804,12 +802,14 @@ class Story10575(GenericTest):
         self.log('info',
         '10. Check all the MS puppet resources created by this test are '
             'removed')
+        self.manifests.refresh(ms_manifest_file)
         for item in [child_1, child_2, child_3, child_4]:
             for resource in ['class_file_id', 'class_pkg_id']:
                 if item.get(resource):
                     class_data = self._get_puppet_manifest_data(
                                                     ms_manifest_file,
-                                                    item[resource])
+                                                    item[resource],
+                                                    refresh=False)
                     self.assertEqual([], class_data,
                         'Extra puppet class "{0}" found in manifest "{1}"'
                         .format(item[resource], ms_manifest_file))
@@ -1680,10 +1680,12 @@ class Story10575(GenericTest):
         self.log('info',
         '3. Check that expected classes are defined in MS puppet manifest')
         manifest_before = []
+        self.manifests.refresh(ms_manifest_file)
         for item in [child_1, child_2]:
             for resource in [item['class_file_id'], item['class_pkg_id']]:
                 class_data = self._get_puppet_manifest_data(ms_manifest_file,
-                                                            resource)
+                                                            resource,
+                                                            refresh=False)
                 self.assertNotEqual([], class_data,
                     'Puppet class "{0}" not found in manifest "{1}"'
                     .format(resource, ms_manifest_file))
@@ -1793,11 +1795,13 @@ class Story10575(GenericTest):
             '8. Check that changes to puppet MS manifest that were made while '
                'the plan was running have been reverted')
             manifest_after = []
+            self.manifests.refresh(ms_manifest_file)
             for item in [child_1, child_2]:
                 for resource in [item['class_file_id'], item['class_pkg_id']]:
                     class_data = self._get_puppet_manifest_data(
                                                         ms_manifest_file,
-                                                        resource)
+                                                        resource,
+                                                        refresh=False)
                     self.assertNotEqual([], class_data,
                         'Puppet class "{0}" not found in manifest "{1}"'
                         .format(resource, ms_manifest_file))
@@ -20,9 +20,12 @@ program(s) have been supplied.
 from litp_generic_test import GenericTest, attr
 import test_constants
 from redhat_cmd_utils import RHCmdUtils
+from metrics_log import MetricsLog, parse_metric_value, \
+    load_baseline, save_baseline, compare_to_baseline
 import datetime
 import os
 import re
+import tempfile
 
 
 class Story107192(GenericTest):
@@ -40,6 +43,9 @@ class Story107192(GenericTest):
         self.redhatutils = RHCmdUtils()
         self.metrics_log_file = test_constants.METRICS_LOG
         self.plugin_id = 'story107192'
+        self.metrics_baseline_file = os.path.join(
+            os.path.dirname(os.path.abspath(__file__)),
+            'story107192_metrics_baseline.json')
         self._install_rpms()
         self.default_plugins = ['bootmgr_plugin',
                                 'puppet_manager',
@@ -245,20 +251,56 @@ class Story107192(GenericTest):
         if TimeTaken or Size checks if format is as expected
         """
         for metric in metrics:
+            name, _, value = metric.partition('=')
             self.assertFalse(
-                'UnableToGetMetricsValue' in
-                metric.split('=')[-1] or not metric.split('=')[-1],
+                'UnableToGetMetricsValue' in value or not value,
                 'all metrics should be gathered successfully'
-                'failed to gather {0} metric'.format(metric.split('=')[0]))
-            if 'TimeTaken' in metric:
-                self.assertTrue(re.match(r'TimeTaken=[\d]+\.[\d]{3}', metric),
+                'failed to gather {0} metric'.format(name))
+            _, valid = parse_metric_value(name, value)
+            if name == 'TimeTaken':
+                self.assertTrue(valid,
                     'TimeTaken metric should be posted '
                     'with expected format, failed: {0}'.format(metric))
-            if 'Size' in metric:
-                self.assertTrue(re.match(r'Size=[\d]+', metric),
+            if name == 'Size':
+                self.assertTrue(valid,
                     'Size metric should be posted '
                     'with expected format, failed: {0}'.format(metric))
 
+    def check_metrics_against_baseline(self):
+        """
+        Description:
+        parses the metrics log and compares the TimeTaken of the last plan
+        create and run, of its phases and StorageSave, the StorageSave Size
+        and the task counts of every phase with the stored baseline.
+        The test is skipped if there is no baseline yet, once the metrics
+        of the run are saved to a temporary file to be committed as the
+        baseline
+        """
+        metrics_log = MetricsLog.from_node(self, self.ms_node,
+                                           self.metrics_log_file)
+        self.assertEqual([], metrics_log.invalid,
+                         'all metrics should be gathered successfully')
+        self.assertNotEqual([], metrics_log.plans(),
+                            'plan metrics should be posted')
+        summary = metrics_log.summarise(metrics_log.plans()[-1])
+        for key in sorted(summary):
+            self.log('info', '{0}={1}'.format(key, summary[key]))
+
+        if not os.path.exists(self.metrics_baseline_file):
+            recorded_file = os.path.join(
+                tempfile.gettempdir(),
+                os.path.basename(self.metrics_baseline_file))
+            save_baseline(recorded_file, summary)
+            self.skipTest('No metrics baseline {0}, the metrics of this run '
+                          'are saved to {1} to be committed as the baseline'
+                          .format(self.metrics_baseline_file, recorded_file))
+
+        regressions = compare_to_baseline(
+            summary, load_baseline(self.metrics_baseline_file))
+        self.assertEqual([], regressions,
+                         'plan metrics regressed against the baseline:\n{0}'
+                         .format('\n'.join(regressions)))
+
     @attr('all', 'revert', 'story107192', 'story107192_tc01')
     def test_01_create_file_on_startup(self):
         """
@@ -795,3 +837,46 @@ class Story107192(GenericTest):
             self.assertTrue(self.wait_for_plan_state(self.ms_node,
                                             test_constants.PLAN_COMPLETE))
             self.check_remove_snapshot_metric()
+
+    # Not in 'all' until a baseline captured on the reference deployment
+    # is committed, as the test skips without one
+    @attr('manual-test', 'revert', 'story107192', 'story107192_tc05')
+    def test_05_p_plan_metrics_against_baseline(self):
+        """
+        @tms_id: torf_107192_tc05
+        @tms_requirements_id: TORF-107192
+        @tms_title: Verify plan metrics against the stored baseline
+        @tms_description: Benchmark mode: checks that the create plan,
+         run plan, phase and StorageSave times, the StorageSave size and
+         the task counts of every phase logged in /var/log/litp/metrics.log
+         did not regress against the stored baseline
+        @tms_test_steps:
+         @step: move /var/log/litp/metrics.log away, execute litp create
+                and inherit commands to add model items as defined in
+                test plugin, create plan, run plan
+         @result: plan completes successfully
+         @step: parse /var/log/litp/metrics.log
+         @result: all metrics have a valid value
+         @step: compare the plan metrics with the stored baseline, skip
+                the test saving the metrics to a temporary file if there is
+                no baseline yet
+         @result: no TimeTaken or Size is above the baseline tolerance and
+                the phase task counts are the same as in the baseline
+        @tms_test_precondition: NA
+        @tms_execution_type: Automated
+        """
+        self.log('info', 'backing up metrics file')
+        self.backup_file(self.ms_node, self.metrics_log_file,
+                         backup_mode_cp=False)
+
+        self.log('info', 'create plan, run plan')
+        self.create_packages()
+        self.execute_cli_createplan_cmd(self.ms_node)
+        self.execute_cli_runplan_cmd(self.ms_node)
+        self.assertTrue(
+            self.wait_for_plan_state(self.ms_node,
+                                     test_constants.PLAN_COMPLETE)
+        )
+
+        self.log('info', 'compare plan metrics with the baseline')
+        self.check_metrics_against_baseline()
@@ -16,8 +16,16 @@ program(s) have been supplied.
 from litp_generic_test import GenericTest, attr
 from litp_cli_utils import CLIUtils
 from redhat_cmd_utils import RHCmdUtils
+from ssh_session_pool import SSHSessionPool
+from log_follower import LogFollower
 import test_constants
 import os
+import re
+import tempfile
+
+# The import the single pass migration script replaces with the module
+SINGLE_PASS_IMPORT = re.compile(
+    r'^from single_pass_migration import [^\n]*(?:\\\n[^\n]*)*\n', re.M)
 
 
 class Story1126(GenericTest):
@@ -48,6 +56,17 @@ class Story1126(GenericTest):
         self.redhatutils = RHCmdUtils()
         # Test Attributes
         self.tmp_conf = "/tmp"
+        self.ssh_pool = SSHSessionPool(self)
+        self.syslog = LogFollower(self.ssh_pool, self.ms_node)
+        self.syslog_lines = []
+
+    def tearDown(self):
+        """
+        Description:
+            Runs after every single test
+        """
+        self.ssh_pool.close()
+        super(Story1126, self).tearDown()
 
     def create_mig_dir(self):
         """
@@ -116,6 +135,60 @@ class Story1126(GenericTest):
         self.assertTrue(self.copy_file_to(self.ms_node, \
             local_migration_filepath, migration_filepath, root_copy=True))
 
+    def cp_single_pass_script_to_node(self, mig_script, ext):
+        """
+        Method that copies a migration script onto MS with its
+        single_pass_migration import replaced by the module itself, so
+        that litpd runs the code the testware checks
+        """
+        local_filepath = os.path.dirname(__file__)
+        with open(os.path.join(local_filepath, 'single_pass_migration.py')) \
+                as module_file:
+            module = module_file.read()
+        with open(os.path.join(local_filepath, 'migration_scripts',
+                               mig_script)) as script_file:
+            script, count = SINGLE_PASS_IMPORT.subn(
+                lambda match: module + '\n\n', script_file.read())
+        self.assertEqual(1, count)
+
+        handle, local_script_path = tempfile.mkstemp(suffix='.py')
+        try:
+            with os.fdopen(handle, 'w') as local_script:
+                local_script.write(script)
+            migration_filepath = '{0}{1}_extension/{2}'.format(
+                test_constants.LITP_MIG_PATH, ext, mig_script)
+            self.assertTrue(self.copy_file_to(
+                self.ms_node, local_script_path, migration_filepath,
+                root_copy=True))
+        finally:
+            os.remove(local_script_path)
+
+    def get_props_from_urls(self, urls):
+        """
+        Method that returns the properties of each of the given items
+        """
+        return dict((url, self.get_props_from_url(self.ms_node, url))
+                    for url in urls)
+
+    def migrate_fwd_bk(self, original):
+        """
+        Method that migrates the core extension forwards and backwards with
+        the scripts on the MS. The backwards migration must restore the
+        original properties of the given items
+        Returns the properties of the items after the forwards migration
+        """
+        self.mark_log_position()
+        self.change_config_version("core", "1.1.11")
+        self.restart_litpd_service(self.ms_node)
+        self.log_search("INFO: forwards migrations to_apply:")
+        migrated = self.get_props_from_urls(original.keys())
+
+        self.change_config_version("core", "1.1.10")
+        self.restart_litpd_service(self.ms_node)
+        self.log_search("INFO: backwards migrations to_apply:")
+        self.assertEqual(original, self.get_props_from_urls(original.keys()))
+        return migrated
+
     def migration_cleanup(self, ext):
         """
         Method to copy orignal config file back and
@@ -129,19 +202,26 @@ class Story1126(GenericTest):
         script_path = test_constants.LITP_MIG_PATH + ext + "_extension/*.py"
         self.remove_item(self.ms_node, script_path, su_root=True)
 
-    def log_search(self, log, test_logs_len):
+    def mark_log_position(self):
         """
-        Method that searches /var/log/messages for a
-        particular log
+        Method that sets the start of the test logs in /var/log/messages
         """
-        cmd = RHCmdUtils().get_grep_file_cmd(
-            test_constants.GEN_SYSTEM_LOG_PATH, log, \
-            file_access_cmd="tail -n {0}".format(test_logs_len))
-        stdout, stderr, returnc = self.run_command(
-        self.ms_node, cmd, add_to_cleanup=False)
-        self.assertNotEqual([], stdout)
-        self.assertEqual([], stderr)
-        self.assertEqual(0, returnc)
+        self.syslog.mark()
+        self.syslog_lines = []
+
+    def log_search(self, *logs):
+        """
+        Method that searches /var/log/messages for particular logs
+        written since mark_log_position(). Only the lines added since the
+        previous search are read from the MS and all the given logs are
+        looked for in a single pass.
+        """
+        self.syslog_lines.extend(self.syslog.read_new_lines())
+        logs = [log.strip() for log in logs if log.strip()]
+        patterns = dict((log, re.compile(re.escape(log))) for log in logs)
+        found = self.syslog.search(patterns, lines=self.syslog_lines)
+        missing = [log for log in logs if log not in found]
+        self.assertEqual([], missing)
 
     def check_test_03_migration(self):
         """
@@ -263,8 +343,7 @@ class Story1126(GenericTest):
             fwd_log = "INFO: forwards migrations to_apply:"
             bk_log = "INFO: backwards migrations to_apply:"
             logfile = "story1126_test_01_logs.txt"
-            start_log_pos = self.get_file_len(self.ms_node, \
-                test_constants.GEN_SYSTEM_LOG_PATH)
+            self.mark_log_position()
 
             # Migration Test Setup
             self.create_mig_dir()
@@ -283,11 +362,6 @@ class Story1126(GenericTest):
             self.get_file_contents(
                 self.ms_node,
                 test_constants.LITP_EXT_PATH + "core_extension.conf")
-            # Get current log position
-            curr_log_pos = self.get_file_len(
-                self.ms_node, test_constants.GEN_SYSTEM_LOG_PATH)
-            test_logs_len = curr_log_pos - start_log_pos
-
             # Copy migration scripts onto MS
             self.cp_mig_script_to_node(script1, "network")
             self.cp_mig_script_to_node(script2, "core")
@@ -302,15 +376,14 @@ class Story1126(GenericTest):
             self.restart_litpd_service(self.ms_node)
 
             # Check log for forwards migration INFO log
-            self.log_search(fwd_log, test_logs_len)
+            self.log_search(fwd_log)
 
             local_filepath = os.path.dirname(__file__)
             log_filepath = local_filepath + \
             "/migration_scripts/" + logfile
 
             log_file = open(log_filepath, 'r')
-            for line in log_file:
-                self.log_search(line, test_logs_len)
+            self.log_search(*log_file.readlines())
             log_file.close()
 
             # Confirm forwards migration
@@ -372,7 +445,7 @@ class Story1126(GenericTest):
                 self.ms_node,
                 test_constants.LITP_EXT_PATH + "core_extension.conf")
             # Check log for backwards migration INFO log
-            self.log_search(bk_log, test_logs_len)
+            self.log_search(bk_log)
 
             # Confirm backwards migration
             for line in net_pro:
@@ -492,8 +565,7 @@ class Story1126(GenericTest):
             "'AddProperty' is not defined"
             restart_err2 = \
             "'list' object has no attribute 'mutate_forward'"
-            start_log_pos = self.get_file_len(
-                self.ms_node, test_constants.GEN_SYSTEM_LOG_PATH)
+            self.mark_log_position()
 
             # Migration Test Setup
             self.create_mig_dir()
@@ -524,14 +596,9 @@ class Story1126(GenericTest):
             self.assertTrue(self.is_text_in_list(restart_err1, stdout))
             self.assertEqual(1, returnc)
 
-            # Get current log position
-            curr_log_pos = self.get_file_len(
-                self.ms_node, test_constants.GEN_SYSTEM_LOG_PATH)
-            test_logs_len = curr_log_pos - start_log_pos
-
             # Check expected log was outputed during the test
             # for offending migration script 4
-            self.log_search(error1, test_logs_len)
+            self.log_search(error1)
 
             # Remove script causing error
             script_path = test_constants.LITP_MIG_PATH \
@@ -548,7 +615,7 @@ class Story1126(GenericTest):
 
             # Check expected log was outputed during the test
             # for offending migration script 1
-            self.log_search(error2, test_logs_len)
+            self.log_search(error2)
 
             # Remove script causing error
             script_path = test_constants.LITP_MIG_PATH + \
@@ -559,7 +626,7 @@ class Story1126(GenericTest):
             self.restart_litpd_service(self.ms_node)
 
             # Check log for forwards migration INFO log
-            self.log_search(fwd_log, test_logs_len)
+            self.log_search(fwd_log)
 
             # Check property has not been added by the migration scripts
             # GET IP RANGE PATH
@@ -579,7 +646,7 @@ class Story1126(GenericTest):
             self.restart_litpd_service(self.ms_node)
 
             # Check log for backwards migration INFO log
-            self.log_search(bk_log, test_logs_len)
+            self.log_search(bk_log)
 
             # Check property has not been added by the migration scripts
             # GET IP RANGE PATH
@@ -662,8 +729,7 @@ class Story1126(GenericTest):
             # Get the start of test log file position
             fwd_log = "INFO: forwards migrations to_apply:"
             bk_log = "INFO: backwards migrations to_apply:"
-            start_log_pos = self.get_file_len(
-                self.ms_node, test_constants.GEN_SYSTEM_LOG_PATH)
+            self.mark_log_position()
 
             # Migration Test Setup
             self.create_mig_dir()
@@ -678,11 +744,6 @@ class Story1126(GenericTest):
             # Restart litpd service
             self.restart_litpd_service(self.ms_node)
 
-            # Get current log position
-            curr_log_pos = self.get_file_len(
-                self.ms_node, test_constants.GEN_SYSTEM_LOG_PATH)
-            test_logs_len = curr_log_pos - start_log_pos
-
             # COPY MIGRATION FILE ONTO NODE
             self.cp_mig_script_to_node(script1, "core")
             self.cp_mig_script_to_node(script2, "core")
@@ -697,7 +758,7 @@ class Story1126(GenericTest):
             self.restart_litpd_service(self.ms_node)
 
             # Check log for forwards migration INFO log
-            self.log_search(fwd_log, test_logs_len)
+            self.log_search(fwd_log)
 
             # Check that migration script was triggered and
             # the model has been updated accordingly
@@ -713,7 +774,7 @@ class Story1126(GenericTest):
             self.restart_litpd_service(self.ms_node)
 
             # Check log for backwards migration INFO log
-            self.log_search(bk_log, test_logs_len)
+            self.log_search(bk_log)
 
             # Check that backwards migration was triggered and
             # the model has been reverted
@@ -851,8 +912,7 @@ class Story1126(GenericTest):
             # Get the start of test log file position
             fwd_log = "INFO: forwards migrations to_apply:"
             bk_log = "INFO: backwards migrations to_apply:"
-            start_log_pos = self.get_file_len(self.ms_node, \
-                test_constants.GEN_SYSTEM_LOG_PATH)
+            self.mark_log_position()
 
             # Migration Test Setup
             self.migration_setup("core")
@@ -864,11 +924,6 @@ class Story1126(GenericTest):
             # Restart litpd service
             self.restart_litpd_service(self.ms_node)
 
-            # Get current log position
-            curr_log_pos = self.get_file_len(
-                self.ms_node, test_constants.GEN_SYSTEM_LOG_PATH)
-            test_logs_len = curr_log_pos - start_log_pos
-
             # Copy migration script onto MS
             self.cp_mig_script_to_node(script1, "core")
             self.cp_mig_script_to_node(script2, "core")
@@ -881,7 +936,7 @@ class Story1126(GenericTest):
             self.restart_litpd_service(self.ms_node)
 
             # Check log do not contain INFO log
-            self.log_search(fwd_log, test_logs_len)
+            self.log_search(fwd_log)
 
             # Confirm forwards migration did not take place
             # GET OS PROFILES PATH
@@ -907,7 +962,7 @@ class Story1126(GenericTest):
             self.restart_litpd_service(self.ms_node)
 
             # Check log for backwards migration INFO log
-            self.log_search(bk_log, test_logs_len)
+            self.log_search(bk_log)
 
             # Confirm backwards migration
             # GET OS PROFILES PATH
@@ -1010,8 +1065,7 @@ class Story1126(GenericTest):
             # Get the start of test log file position
             fwd_log = "INFO: forwards migrations to_apply:"
             bk_log = "INFO: backwards migrations to_apply:"
-            start_log_pos = self.get_file_len(self.ms_node, \
-                test_constants.GEN_SYSTEM_LOG_PATH)
+            self.mark_log_position()
 
             # Migration Test Setup
             self.migration_setup("core")
@@ -1023,11 +1077,6 @@ class Story1126(GenericTest):
             # Restart litpd service
             self.restart_litpd_service(self.ms_node)
 
-            # Get current log position
-            curr_log_pos = self.get_file_len(
-                self.ms_node, test_constants.GEN_SYSTEM_LOG_PATH)
-            test_logs_len = curr_log_pos - start_log_pos
-
             # Copy migration script onto MS
             self.cp_mig_script_to_node(script1, "core")
 
@@ -1045,7 +1094,7 @@ class Story1126(GenericTest):
 
             # Check expected log was outputed during the test
             # for offending migration script 1
-            self.log_search(error1, test_logs_len)
+            self.log_search(error1)
 
             # Remove script causing error
             script_path = test_constants.LITP_MIG_PATH + \
@@ -1059,7 +1108,7 @@ class Story1126(GenericTest):
             self.restart_litpd_service(self.ms_node)
 
             # Check log do not contain INFO log
-            self.log_search(fwd_log, test_logs_len)
+            self.log_search(fwd_log)
 
             # Change version in .config file back to initial version
             # to be used during test
@@ -1070,7 +1119,7 @@ class Story1126(GenericTest):
             self.restart_litpd_service(self.ms_node)
 
             # Check log for backwards migration INFO log
-            self.log_search(bk_log, test_logs_len)
+            self.log_search(bk_log)
 
             # Confirm backwards migration
             for line in os_pro:
@@ -1095,3 +1144,72 @@ class Story1126(GenericTest):
                 self.ms_node, expect_positive=False)
             self.assertTrue(
                 self.is_text_in_list("DoNothingPlanError ", stderr))
+
+    @attr('manual-test')
+    def test_06_p_fwd_bk_single_pass_migration(self):
+        """
+        Description:
+        Test that a SinglePassOperation migrates the model forwards and
+        backwards like the AddProperty and RemoveProperty operations of
+        story1126_test_01_script2 and script3 it groups
+
+        Actions:
+        1. Migration Test Setup
+        2. Change version in .config file to initial version
+        3. Restart litpd service
+        4. Read the properties of the storage and os profiles
+        5. Copy story1126_test_01_script2 and script3 onto MS
+        6. Change version in .config file to match version
+           in migration scripts and restart litpd service
+        7. Check log for forwards migration INFO log and read the
+           migrated properties
+        8. Change version in .config file back to initial version
+           and restart litpd service
+        9. Check log for backwards migration INFO log and that the
+           properties are restored
+        10.Replace the scripts by the single pass migration script
+        11.Repeat steps 6 to 9 and check that the properties are those
+           migrated by the story1126_test_01 scripts
+        12.Move original core_extension.conf back
+        13.Restart litpd service
+
+        Result:
+        The storage and os profiles are migrated as by the separate
+        AddProperty and RemoveProperty operations
+        """
+        try:
+            per_operation_scripts = ["story1126_test_01_script2.py",
+                                     "story1126_test_01_script3.py"]
+            single_pass_script = "story1126_test_06_script1.py"
+
+            # Migration Test Setup
+            self.create_mig_dir()
+            self.migration_setup("core")
+            self.change_config_version("core", "1.1.10")
+            self.restart_litpd_service(self.ms_node)
+
+            stor_pro = self.find(self.ms_node,
+                                 "/infrastructure", "storage-profile", True)
+            os_pro = self.find(self.ms_node, "/software", "os-profile", True)
+            original = self.get_props_from_urls(stor_pro + os_pro)
+
+            # Migrate with the AddProperty and RemoveProperty operations
+            for script in per_operation_scripts:
+                self.cp_mig_script_to_node(script, "core")
+            per_operation = self.migrate_fwd_bk(original)
+            for line in stor_pro:
+                self.assertEqual("storage1", per_operation[line].get("prop1"))
+            for line in os_pro:
+                self.assertEqual("os-profile-1",
+                                 per_operation[line].get("prop1"))
+
+            # Migrate with the SinglePassOperation of the same steps
+            for script in per_operation_scripts:
+                self.remove_item(self.ms_node, "{0}core_extension/{1}".format(
+                    test_constants.LITP_MIG_PATH, script), su_root=True)
+            self.cp_single_pass_script_to_node(single_pass_script, "core")
+            single_pass = self.migrate_fwd_bk(original)
+            self.assertEqual(per_operation, single_pass)
+        finally:
+            self.migration_cleanup("core")
+            self.restart_litpd_service(self.ms_node)
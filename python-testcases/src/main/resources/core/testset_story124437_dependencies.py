@@ -14,6 +14,14 @@ program(s) have been supplied.
             based off phases from a phase order tree.
 """
 from litp_generic_test import GenericTest, attr
+from ssh_session_pool import SSHSessionPool
+from node_fanout import NodeFanOut
+from bulk_model_builder import BulkModelBuilder
+from litp_cli_utils import CLIUtils
+from plan_model import PlanModelCache
+from phase_dag import PhaseDag, cluster_id, parse_dependency_list
+from plan_timeline import PlanTimeline
+from metrics_log import MetricsLog
 import test_constants as const
 import time
 
@@ -51,9 +59,14 @@ class Story124437Dependencies(GenericTest):
 
         self.clusters_to_expand = [self.cluster2, self.cluster3, self.cluster4]
         self.nodes_to_expand = list()
+        self.ssh_pool = SSHSessionPool(self)
+        self.model_builder = BulkModelBuilder(self, self.ms1)
+        self.plan_models = PlanModelCache(CLIUtils())
 
     def tearDown(self):
         """ Runs after every single test """
+        self.ssh_pool.close()
+        self.model_builder.cleanup()
         super(Story124437Dependencies, self).tearDown()
 
     def _expand_model(self):
@@ -70,9 +83,11 @@ class Story124437Dependencies(GenericTest):
             props = 'cluster_type=sfha low_prio_net=mgmt llt_nets=hb1,hb2 ' \
                     'cluster_id={0}'.format(cluster['cluster_id'])
 
-            self.execute_cli_create_cmd(self.ms1, cluster['url'],
-                                        'vcs-cluster', props=props)
+            self.model_builder.add_create(cluster['url'], 'vcs-cluster',
+                                          props=props)
+        self.model_builder.apply()
 
+        for cluster in self.clusters_to_expand:
             self.execute_expand_script(self.ms1, cluster['script'])
 
     def _check_deployment_type_and_create_snapshot(self):
@@ -131,11 +146,17 @@ class Story124437Dependencies(GenericTest):
         # Assume all node are SSHable
         all_sshable = True
 
-        for node in nodes_to_check:
-            node = node['node']
-            stdout, stderr, rc = self.run_command(
-                self.ms1, "ssh -T litp-admin@{0}".format(node))
-
+        # The ssh probes run in parallel from the MS, each one on its own
+        # channel of the pooled MS session, so that nodes that are still
+        # down do not add up their connection timeouts
+        nodes = [node['node'] for node in nodes_to_check]
+        results = NodeFanOut().run(
+            lambda node: self.ssh_pool.run_command(
+                self.ms1, "ssh -T litp-admin@{0}".format(node)),
+            nodes)
+
+        for node in nodes:
+            stdout, stderr, rc = results[node]
             self.assertEqual([], stdout)
             self.assertNotEqual([], stderr)
             self.assertEqual(255, rc)
@@ -218,6 +239,61 @@ class Story124437Dependencies(GenericTest):
         self.assertFalse(dependee_running and depender_running,
                          both_running_msg)
 
+    def _get_phase_dag(self):
+        """
+        Description:
+            Build the phase graph of the created plan from its tasks and
+            the dependency_list of every cluster
+        Return:
+            PhaseDag, The phase graph of the plan
+        """
+        dependencies = {}
+        for url in self.find(self.ms1, '/deployments', 'vcs-cluster',
+                             assert_not_empty=False):
+            props = self.get_props_from_url(self.ms1, url)
+            dependencies[cluster_id(url)] = parse_dependency_list(
+                props.get('dependency_list'))
+        plan = self.plan_models.from_node(self, self.ms1)
+        phase_dag = PhaseDag.from_plan_model(plan, dependencies)
+        length, path = phase_dag.critical_path()
+        self.log('info', 'Phases: {0}, critical path: {1} phases {2}, '
+                 'max parallelism: {3}'.format(len(phase_dag.phases), length,
+                                               path,
+                                               phase_dag.max_parallelism()))
+        return phase_dag
+
+    def _check_parallelism_against_dag(self, phase_dag):
+        """
+        Description:
+            Compare the phase parallelism of the completed plan, from the
+            phase metrics, with the bounds of its phase graph. Phases that
+            depend on each other must not overlap. Running fewer phases at
+            once than the graph allows is logged as a finding, as it points
+            to a dependency_list, or a plan, that serialises phases it does
+            not need to, while timing alone can also explain it
+        Args:
+            phase_dag (PhaseDag): The phase graph of the plan
+        """
+        timeline = PlanTimeline.from_metrics(
+            MetricsLog.from_node(self, self.ms1, const.METRICS_LOG))
+        spans = timeline.select('phase')
+        achieved = PlanTimeline.parallelism(spans)
+        durations = dict((span.lane, span.end - span.start)
+                         for span in spans)
+        critical_time, _ = phase_dag.critical_path(durations)
+        self.log('info', 'Achieved parallelism {0[max_concurrency]} of '
+                 '{1}, wall time {0[wall_time]:.1f}s for a critical path '
+                 'of {2:.1f}s'.format(achieved, phase_dag.max_parallelism(),
+                                      critical_time))
+        self.assertTrue(
+            achieved['max_concurrency'] <= phase_dag.max_parallelism(),
+            'Phases that depend on each other ran in parallel')
+        if achieved['max_concurrency'] < phase_dag.max_parallelism():
+            self.log('info', 'FINDING: at most {0} phases ran at once, '
+                     'the phase graph allows {1}'.format(
+                         achieved['max_concurrency'],
+                         phase_dag.max_parallelism()))
+
     def _dummy_firewall_rules(self, rules):
         """
         Description:
@@ -603,6 +679,7 @@ class Story124437Dependencies(GenericTest):
 
             self.log("info", "8. Create and run upgrade plan.")
             self.execute_cli_createplan_cmd(self.ms1)
+            phase_dag = self._get_phase_dag()
             self.execute_cli_runplan_cmd(self.ms1)
             self.assertTrue(self.wait_for_plan_state(
                 self.ms1, const.PLAN_IN_PROGRESS))
@@ -653,6 +730,7 @@ class Story124437Dependencies(GenericTest):
             # Assert that at some stage, 2 phases were running in parallel
             self.assertTrue(parallel_running,
                             "No phases were detected to run in parallel.")
+            self._check_parallelism_against_dag(phase_dag)
 
             self.log("info", "9. Ensuring Phases ran in correct order.")
             # Get last occurrence of dependee cluster running in plan execution
@@ -797,6 +875,7 @@ class Story124437Dependencies(GenericTest):
 
             self.log("info", "8. Create and run upgrade plan.")
             self.execute_cli_createplan_cmd(self.ms1)
+            phase_dag = self._get_phase_dag()
             self.execute_cli_runplan_cmd(self.ms1)
             self.assertTrue(self.wait_for_plan_state(
                 self.ms1, const.PLAN_IN_PROGRESS))
@@ -848,6 +927,7 @@ class Story124437Dependencies(GenericTest):
             # Assert that at some stage, 2 phases were running in parallel
             self.assertTrue(parallel_running,
                             "No phases were detected to run in parallel.")
+            self._check_parallelism_against_dag(phase_dag)
 
             self.log("info", "9. Ensuring Phases ran in correct order.")
             # Get last occurrences of dependee
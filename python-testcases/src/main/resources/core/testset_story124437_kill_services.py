@@ -16,9 +16,13 @@ program(s) have been supplied.
 from redhat_cmd_utils import RHCmdUtils
 from litp_generic_test import GenericTest, attr
 import test_constants as const
+from bulk_model_builder import BulkModelBuilder
+from plan_state_waiter import PlanStateWaiter, wait_for_condition
+from plan_timeline import PlanTimeline
+from metrics_log import MetricsLog
 import os
 import re
-import time
+import tempfile
 
 
 class Story124437KillServices(GenericTest):
@@ -32,6 +36,7 @@ class Story124437KillServices(GenericTest):
         """ Runs before every single test """
         super(Story124437KillServices, self).setUp()
         self.ms1 = self.get_management_node_filename()
+        self.plan_waiter = PlanStateWaiter(self, self.ms1)
 
         self.cluster2 = {'id': 'c2',
                          'cluster_id': '1043',
@@ -64,10 +69,12 @@ class Story124437KillServices(GenericTest):
                                self.celery_plan_reg,
                                self.celery_task_reg]
         self.plan_mode = ''
+        self.model_builder = BulkModelBuilder(self, self.ms1)
 
     def tearDown(self):
         """ Runs after every single test """
         if not self.skip_cleanup:
+            self.model_builder.cleanup()
             super(Story124437KillServices, self).tearDown()
         else:
             self.log('info',
@@ -131,10 +138,10 @@ class Story124437KillServices(GenericTest):
                      'llt_nets=hb1,hb2 '
                      'cluster_id={0}'.format(cluster['cluster_id']))
 
-            self.execute_cli_create_cmd(self.ms1,
-                                        cluster['url'],
-                                        'vcs-cluster',
-                                        props=props)
+            self.model_builder.add_create(cluster['url'],
+                                          'vcs-cluster',
+                                          props=props)
+        self.model_builder.apply()
 
         for cluster in self.clusters_to_expand:
             self.execute_expand_script(self.ms1, cluster['script'])
@@ -211,13 +218,12 @@ class Story124437KillServices(GenericTest):
         # All test_items are to be removed
         #
         # Mixed cases will cause the test to fail
-        for item in self.test_items:
-            if self.plan_mode == 'create':
-                self.execute_cli_create_cmd(self.ms1,
-                                            item['url'],
-                                            item['type'],
-                                            item['props'])
-            elif self.plan_mode == 'remove':
+        if self.plan_mode == 'create':
+            # All the rules are loaded with one "litp load" per node
+            self.model_builder.add_items(self.test_items)
+            self.model_builder.apply()
+        elif self.plan_mode == 'remove':
+            for item in self.test_items:
                 self.execute_cli_remove_cmd(self.ms1,
                                             item['url'])
 
@@ -259,48 +265,17 @@ class Story124437KillServices(GenericTest):
         kill_cmd = "/usr/bin/pkill {0} -f {1}".format(kill_args, queue)
         return self.run_command(node, kill_cmd, su_root=su_root)
 
-    def _wait_for_conditions(self, conditions, timeout, poll_interval):
-        """
-        Description:
-            Wait for specified condition to be met
-        Args:
-            conditions (func): The logic to apply to verify the condition
-            timeout (int): Timeout in seconds
-            poll_interval (int): The interval between polls in seconds
-        Return:
-            Data that describe how the condition has been met as returned by
-            the call to conditions() function
-        """
-        start_time = time.time()
-        while True:
-            iteration_start_time = time.time()
-            elapsed_time = int(iteration_start_time - start_time)
-            self.assertTrue(elapsed_time < timeout,
-                'Timeout reached while waiting for "{0}"'
-                .format(conditions.__name__))
-
-            self.log('info',
-            'Waiting for condition "{0}" to be met. Remaining time: {1}s'
-            .format(conditions.__name__, int(timeout - elapsed_time)))
-
-            result = conditions()
-            if result:
-                return result
-
-            sleep_time = poll_interval - (time.time() - iteration_start_time)
-            if sleep_time > 0:
-                time.sleep(sleep_time)
-
-    def _multiple_phases_running(self):
+    def _multiple_phases_running(self, plan):
         """
         Description:
             Determine if there are multiple phase running at same time
+        Args:
+            plan (dict): Plan data fetched by the plan waiter
         Return:
             Dict, Data that describe the plan at the time multiple phases are
                   found to be running in parallel. If no phases running in
                   parallel are found return an empty dict.
         """
-        plan = self.get_plan_data(self.ms1)
         phases_with_running_tasks = \
                         self.get_tasks_by_state(self.ms1, 'Running', plan)
         if self._is_parallel_plan_state_reached(phases_with_running_tasks):
@@ -358,6 +333,35 @@ class Story124437KillServices(GenericTest):
             self.log('info', line)
         self.log('info', '-' * 80)
 
+    def _run_plan_recording_timeline(self):
+        """
+        Description:
+            Run the plan to completion while recording the start and end of
+            its tasks from the plan waiter polls, then log the parallelism
+            of the phases and of the tasks and write both timelines as
+            Chrome trace files in the temporary directory
+        """
+        task_timeline = PlanTimeline()
+        self.plan_waiter.subscribe(task_timeline.observe, 'plan_timeline')
+        self.execute_cli_runplan_cmd(self.ms1)
+        self.plan_waiter.wait_for('plan_timeline', timeout=300,
+                                  poll_interval=2)
+        self.assertEqual(const.PLAN_COMPLETE,
+                         self.get_current_plan_state(self.ms1))
+
+        phase_timeline = PlanTimeline.from_metrics(
+            MetricsLog.from_node(self, self.ms1, const.METRICS_LOG))
+        for name, timeline, spans in (
+                ('phases', phase_timeline, phase_timeline.select('phase')),
+                ('tasks', task_timeline, task_timeline.select())):
+            self.log('info', '{0}: {1}'.format(
+                name, PlanTimeline.parallelism(spans)))
+            trace_file = os.path.join(
+                tempfile.gettempdir(),
+                '{0}_{1}_trace.json'.format(self._testMethodName, name))
+            timeline.dump(trace_file)
+            self.log('info', 'trace saved to {0}'.format(trace_file))
+
     def _celery_service_running(self):
         """
         Description:
@@ -484,7 +488,7 @@ class Story124437KillServices(GenericTest):
         '3. Assert that celery worker processes are restarted automatically')
         puppet_interval = self.get_puppet_interval(self.ms1)
         self.start_new_puppet_run(self.ms1)
-        self.assertTrue(self._wait_for_conditions(
+        self.assertTrue(wait_for_condition(self,
                                             self._celery_service_running,
                                             timeout=puppet_interval,
                                             poll_interval=3),
@@ -542,7 +546,7 @@ class Story124437KillServices(GenericTest):
 
         self.log('info',
         '3. wait for parallelism in plan')
-        plan_parallel = self._wait_for_conditions(
+        plan_parallel = self.plan_waiter.wait_for_condition(
                                         self._multiple_phases_running,
                                         timeout=180,
                                         poll_interval=1)
@@ -589,10 +593,7 @@ class Story124437KillServices(GenericTest):
         '7. Re-create and run the plan')
         self.execute_cli_createplan_cmd(self.ms1)
         self.execute_cli_showplan_cmd(self.ms1)
-        self.execute_cli_runplan_cmd(self.ms1)
-        self.assertTrue(self.wait_for_plan_state(self.ms1,
-                                                 const.PLAN_COMPLETE,
-                                                 5))
+        self._run_plan_recording_timeline()
 
         self.log('info',
         '8. Check that all test items are in the correct state')
@@ -649,7 +650,7 @@ class Story124437KillServices(GenericTest):
 
         self.log('info',
         '3. wait for parallelism in plan')
-        plan_parallel = self._wait_for_conditions(
+        plan_parallel = self.plan_waiter.wait_for_condition(
                                         self._multiple_phases_running,
                                         timeout=180,
                                         poll_interval=1)
@@ -668,7 +669,7 @@ class Story124437KillServices(GenericTest):
 
         self.log('info',
         '5. Wait for "litpd" service to die')
-        self._wait_for_conditions(
+        wait_for_condition(self,
                             self._service_dead('litpd', ['dead', 'stopped']),
                             timeout=180,
                             poll_interval=3)
@@ -698,10 +699,7 @@ class Story124437KillServices(GenericTest):
         '9. Re-create and run the plan to completion')
         self.execute_cli_createplan_cmd(self.ms1)
         self.execute_cli_showplan_cmd(self.ms1)
-        self.execute_cli_runplan_cmd(self.ms1)
-        self.assertTrue(self.wait_for_plan_state(self.ms1,
-                                                 const.PLAN_COMPLETE,
-                                                 5))
+        self._run_plan_recording_timeline()
 
         self.log('info',
         '10. Check that all test items are in the correct state')
@@ -755,7 +753,7 @@ class Story124437KillServices(GenericTest):
 
         self.log('info',
         '3. wait for parallelism in plan')
-        plan_parallel = self._wait_for_conditions(
+        plan_parallel = self.plan_waiter.wait_for_condition(
                                         self._multiple_phases_running,
                                         timeout=180,
                                         poll_interval=1)
@@ -791,10 +789,7 @@ class Story124437KillServices(GenericTest):
         '7. Re-create and run the plan')
         self.execute_cli_createplan_cmd(self.ms1)
         self.execute_cli_showplan_cmd(self.ms1)
-        self.execute_cli_runplan_cmd(self.ms1)
-        self.assertTrue(self.wait_for_plan_state(self.ms1,
-                                                 const.PLAN_COMPLETE,
-                                                 5))
+        self._run_plan_recording_timeline()
 
         self.log('info',
         '8. Check that all test items are in the correct state')
@@ -850,7 +845,7 @@ class Story124437KillServices(GenericTest):
 
         self.log('info',
         '3. Wait for parallelism in plan')
-        plan_parallel = self._wait_for_conditions(
+        plan_parallel = self.plan_waiter.wait_for_condition(
                                         self._multiple_phases_running,
                                         timeout=180,
                                         poll_interval=1)
@@ -866,7 +861,7 @@ class Story124437KillServices(GenericTest):
         self.log('info',
         '4. Stop the "celeryd" service')
         self.stop_service(self.ms1, 'celeryd', assert_success=False)
-        self._wait_for_conditions(
+        wait_for_condition(self,
                             self._service_dead('celeryd', ['down', 'stopped']),
                             timeout=180,
                             poll_interval=3)
@@ -874,9 +869,10 @@ class Story124437KillServices(GenericTest):
         self.log('info',
         '5. Wait for "puppet" to restart "celeryd"')
         puppet_interval = self.get_puppet_interval(self.ms1)
-        self._wait_for_conditions(self._celery_service_running,
-                                  timeout=puppet_interval,
-                                  poll_interval=3)
+        wait_for_condition(self,
+                           self._celery_service_running,
+                           timeout=puppet_interval,
+                           poll_interval=3)
 
         self.log('info',
         '6. Wait for the plan to complete')
@@ -939,7 +935,7 @@ class Story124437KillServices(GenericTest):
 
         self.log('info',
         '3. wait for parallelism in plan')
-        plan_parallel = self._wait_for_conditions(
+        plan_parallel = self.plan_waiter.wait_for_condition(
                                         self._multiple_phases_running,
                                         timeout=180,
                                         poll_interval=1)
@@ -955,7 +951,7 @@ class Story124437KillServices(GenericTest):
         self.log('info',
         '4. Send SIGTERM the "litpDefault" service')
         self._kill_celery_queue(self.ms1, 'litpDefault', su_root=True)
-        self._wait_for_conditions(
+        wait_for_condition(self,
                             self._service_dead('celeryd', ['down', 'stopped']),
                             timeout=60,
                             poll_interval=3)
@@ -963,9 +959,10 @@ class Story124437KillServices(GenericTest):
         self.log('info',
         '5. Wait for "puppet" to restart "celeryd"')
         puppet_interval = self.get_puppet_interval(self.ms1)
-        self._wait_for_conditions(self._celery_service_running,
-                                  timeout=puppet_interval,
-                                  poll_interval=3)
+        wait_for_condition(self,
+                           self._celery_service_running,
+                           timeout=puppet_interval,
+                           poll_interval=3)
 
         self.log('info',
         '6. Wait for the plan to complete')
@@ -1030,7 +1027,7 @@ class Story124437KillServices(GenericTest):
 
         self.log('info',
         '3. wait for parallelism in plan')
-        plan_parallel = self._wait_for_conditions(
+        plan_parallel = self.plan_waiter.wait_for_condition(
                                         self._multiple_phases_running,
                                         timeout=180,
                                         poll_interval=1)
@@ -1048,7 +1045,7 @@ class Story124437KillServices(GenericTest):
         self._kill_celery_queue(self.ms1,
                                 'litpPlan',
                                 su_root=True)
-        self._wait_for_conditions(
+        wait_for_condition(self,
                             self._service_dead('celeryd', ['down', 'stopped']),
                             timeout=60,
                             poll_interval=3)
@@ -1056,9 +1053,10 @@ class Story124437KillServices(GenericTest):
         self.log('info',
         '5. Wait for "puppet" to restart "celeryd"')
         puppet_interval = self.get_puppet_interval(self.ms1)
-        self._wait_for_conditions(self._celery_service_running,
-                                  timeout=puppet_interval,
-                                  poll_interval=3)
+        wait_for_condition(self,
+                           self._celery_service_running,
+                           timeout=puppet_interval,
+                           poll_interval=3)
 
         self.log('info',
         '6. Wait for the plan to fail')
@@ -1070,10 +1068,7 @@ class Story124437KillServices(GenericTest):
         '7. Re-create and run the plan')
         self.execute_cli_createplan_cmd(self.ms1)
         self.execute_cli_showplan_cmd(self.ms1)
-        self.execute_cli_runplan_cmd(self.ms1)
-        self.assertTrue(self.wait_for_plan_state(self.ms1,
-                                                 const.PLAN_COMPLETE,
-                                                 5))
+        self._run_plan_recording_timeline()
 
         self.log('info',
         '8. Check that all test items are in the correct state')
@@ -1132,7 +1127,7 @@ class Story124437KillServices(GenericTest):
 
         self.log('info',
         '3. wait for parallelism in plan')
-        plan_parallel = self._wait_for_conditions(
+        plan_parallel = self.plan_waiter.wait_for_condition(
                                         self._multiple_phases_running,
                                         timeout=180,
                                         poll_interval=1)
@@ -1150,7 +1145,7 @@ class Story124437KillServices(GenericTest):
         self._kill_celery_queue(self.ms1,
                                 'litpTask',
                                 su_root=True)
-        self._wait_for_conditions(
+        wait_for_condition(self,
                             self._service_dead('celeryd', ['down', 'stopped']),
                             timeout=60,
                             poll_interval=3)
@@ -1158,9 +1153,10 @@ class Story124437KillServices(GenericTest):
         self.log('info',
         '5. Wait for "puppet" to restart "celeryd"')
         puppet_interval = self.get_puppet_interval(self.ms1)
-        self._wait_for_conditions(self._celery_service_running,
-                                  timeout=puppet_interval,
-                                  poll_interval=3)
+        wait_for_condition(self,
+                           self._celery_service_running,
+                           timeout=puppet_interval,
+                           poll_interval=3)
 
         self.log('info',
         '6. Wait for the plan to fail')
@@ -1172,10 +1168,7 @@ class Story124437KillServices(GenericTest):
         '7. Re-create and run the plan')
         self.execute_cli_createplan_cmd(self.ms1)
         self.execute_cli_showplan_cmd(self.ms1)
-        self.execute_cli_runplan_cmd(self.ms1)
-        self.assertTrue(self.wait_for_plan_state(self.ms1,
-                                                 const.PLAN_COMPLETE,
-                                                 5))
+        self._run_plan_recording_timeline()
 
         self.log('info',
         '8. Check that all test items are in the correct state')
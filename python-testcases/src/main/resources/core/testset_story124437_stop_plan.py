@@ -16,8 +16,10 @@ program(s) have been supplied.
 """
 from litp_generic_test import GenericTest, attr
 import test_constants as const
+from bulk_model_builder import BulkModelBuilder
+from plan_state_waiter import PlanStateWaiter, RestPlanSource
+from rest_utils import RestUtils
 import os
-import time
 from paramiko import AuthenticationException
 import re
 
@@ -33,6 +35,12 @@ class Story124437StopPlan(GenericTest):
         """ Runs before every single test """
         super(Story124437StopPlan, self).setUp()
         self.ms1 = self.get_management_node_filename()
+        self.plan_source = RestPlanSource(
+                            RestUtils(self.get_node_att(self.ms1, 'ipv4')))
+        self.plan_waiter = PlanStateWaiter(self,
+                                           self.ms1,
+                                           plan_source=self.plan_source)
+        self.model_builder = BulkModelBuilder(self, self.ms1)
 
         self.cluster2 = {'id': 'c2',
                          'cluster_id': '1043',
@@ -66,6 +74,7 @@ class Story124437StopPlan(GenericTest):
                 self.run_command(node, mv_cmd, su_root=True)
                 self.run_command(node, sysctl_cmd, su_root=True)
 
+        self.model_builder.cleanup()
         super(Story124437StopPlan, self).tearDown()
 
     def _expand_model(self, cluster_coll_url):
@@ -86,10 +95,10 @@ class Story124437StopPlan(GenericTest):
                      'llt_nets=hb1,hb2 '
                      'cluster_id={0}'.format(cluster['cluster_id']))
 
-            self.execute_cli_create_cmd(self.ms1,
-                                        cluster['url'],
-                                        'vcs-cluster',
-                                        props=props)
+            self.model_builder.add_create(cluster['url'],
+                                          'vcs-cluster',
+                                          props=props)
+        self.model_builder.apply()
 
         for cluster in self.clusters_to_expand:
             self.execute_expand_script(self.ms1, cluster['script'])
@@ -143,14 +152,12 @@ class Story124437StopPlan(GenericTest):
                 item['url'] = os.path.join(fw_coll_uri, item['id'])
                 item['type'] = 'firewall-rule'
                 item['props'] = 'name="77{0} story124437"'.format(i)
-
-                self.execute_cli_create_cmd(self.ms1,
-                                            item['url'],
-                                            item['type'],
-                                            item['props'])
-
                 self.test_items.append(item)
 
+        # All the rules are loaded with one "litp load" per node
+        self.model_builder.add_items(self.test_items)
+        self.model_builder.apply()
+
     @staticmethod
     def _is_parallel_plan_state_reached(
             phases_with_running_tasks, skip_vcs_task=True):
@@ -176,44 +183,11 @@ class Story124437StopPlan(GenericTest):
             return True
         return False
 
-    def _wait_for_conditions(self, conditions, timeout, poll_interval):
-        """
-        Description:
-            Wait for specified condition to be met
-        Args:
-            conditions (func): The logic to apply to verify the condition
-            timeout (int): Timeout in seconds1
-            poll_interval (int): The interval between polls in seconds
-        Return:
-            Data that describe how the condition has been met as returned by
-            the call to conditions() function
-        """
-        start_time = time.time()
-        while True:
-            iteration_start_time = time.time()
-            elapsed_time = int(iteration_start_time - start_time)
-            self.assertTrue(elapsed_time < timeout,
-                'Timeout reached while waiting for "{0}"'
-                .format(conditions.__name__))
-
-            self.log('info',
-            'Waiting for condition "{0}" to be met. Remaining time: {1}s'
-            .format(conditions.__name__, int(timeout - elapsed_time)))
-
-            result = conditions()
-
-            if result:
-                return result
-
-            sleep_time = poll_interval - (time.time() - iteration_start_time)
-            if sleep_time > 0:
-                time.sleep(sleep_time)
-
-    def _multiple_phases_running(self):
+    def _multiple_phases_running(self, plan):
         """
             Determine if there are multiple phase running at same time
+            in the plan data fetched by the plan waiter
         """
-        plan = self.get_plan_data(self.ms1)
         phases_with_running_tasks = \
                         self.get_tasks_by_state(self.ms1, 'Running', plan)
         if self._is_parallel_plan_state_reached(phases_with_running_tasks):
@@ -301,12 +275,11 @@ class Story124437StopPlan(GenericTest):
             expected_states (list): List of task state that defines a completed
                                     phase
         """
-        def running_phases_completed():
+        def running_phases_completed(plan):
             """
                 Check if all tasks in the given phases are in the expected
                 state
             """
-            plan = self.get_plan_data(self.ms1)
             for phase in phases:
                 for tasks in plan['phases'][phase].values():
                     for task in tasks:
@@ -315,13 +288,11 @@ class Story124437StopPlan(GenericTest):
             return plan
         return running_phases_completed
 
-    def _multiple_phases_running_and_task_failed(self):
+    def _multiple_phases_running_and_task_failed(self, plan):
         """
             Check if there are phases running in parallel and at least one
-            task failed
+            task failed in the plan data fetched by the plan waiter
         """
-        plan = self.get_plan_data(self.ms1)
-
         failed_tasks = self.get_tasks_by_state(self.ms1, 'Failed', plan)
         if failed_tasks == {}:
             return {}
@@ -385,7 +356,7 @@ class Story124437StopPlan(GenericTest):
         self.execute_cli_createplan_cmd(self.ms1)
         self.execute_cli_runplan_cmd(self.ms1)
 
-        plan_at_stop = self._wait_for_conditions(
+        plan_at_stop = self.plan_waiter.wait_for_condition(
                                             self._multiple_phases_running,
                                             timeout=120,
                                             poll_interval=1)
@@ -401,7 +372,7 @@ class Story124437StopPlan(GenericTest):
                                                     'Running',
                                                     plan_data=plan_at_stop)
         running_phases_at_stop = tasks_running_at_stop.keys()
-        phase_complete_plan = self._wait_for_conditions(
+        phase_complete_plan = self.plan_waiter.wait_for_condition(
             self._running_phases_completed(running_phases_at_stop,
                                            ['Success']),
             timeout=240,
@@ -409,7 +380,7 @@ class Story124437StopPlan(GenericTest):
 
         self.log('info',
         '6. Wait for plan to transition to "Stopped"')
-        self.wait_for_plan_state(self.ms1, const.PLAN_STOPPED, 5)
+        self.plan_waiter.wait_for_plan_state(const.PLAN_STOPPED, timeout=300)
 
         self.log('info',
         '7. Check that plan state is correct')
@@ -449,7 +420,7 @@ class Story124437StopPlan(GenericTest):
         '8. (Re)Create and Run plan')
         self.execute_cli_createplan_cmd(self.ms1)
         self.execute_cli_runplan_cmd(self.ms1)
-        self.wait_for_plan_state(self.ms1, const.PLAN_COMPLETE, 5)
+        self.plan_waiter.wait_for_plan_state(const.PLAN_COMPLETE, timeout=300)
 
     @attr('manual-test', 'non-revert', 'story124437',
           'story124437Fail_one_config_task',
@@ -553,7 +524,7 @@ class Story124437StopPlan(GenericTest):
         self.execute_cli_showplan_cmd(self.ms1)
         self.execute_cli_runplan_cmd(self.ms1)
 
-        plan_at_fail = self._wait_for_conditions(
+        plan_at_fail = self.plan_waiter.wait_for_condition(
                             self._multiple_phases_running_and_task_failed,
                             timeout=240,
                             poll_interval=1)
@@ -576,7 +547,7 @@ class Story124437StopPlan(GenericTest):
         '8. Wait for phases that were running at fail complete')
         running_phases_at_fail = running_tasks_at_fail.keys()
         statuses = ['Success', 'Failed']
-        plan_at_phase_complete = self._wait_for_conditions(
+        plan_at_phase_complete = self.plan_waiter.wait_for_condition(
             self._running_phases_completed(running_phases_at_fail, statuses),
             timeout=240,
             poll_interval=1)
@@ -587,7 +558,7 @@ class Story124437StopPlan(GenericTest):
 
         self.log('info',
         '8. Wait for plan to fail and check task statuses')
-        self.wait_for_plan_state(self.ms1, const.PLAN_FAILED, 5)
+        self.plan_waiter.wait_for_plan_state(const.PLAN_FAILED, timeout=300)
         failed_plan = self.get_plan_data(self.ms1)
         self._log_plan_state_details(failed_plan)
 
@@ -724,7 +695,7 @@ class Story124437StopPlan(GenericTest):
         self.execute_cli_showplan_cmd(self.ms1)
         self.execute_cli_runplan_cmd(self.ms1)
 
-        plan_at_fail = self._wait_for_conditions(
+        plan_at_fail = self.plan_waiter.wait_for_condition(
                             self._multiple_phases_running_and_task_failed,
                             timeout=240,
                             poll_interval=1)
@@ -751,7 +722,7 @@ class Story124437StopPlan(GenericTest):
         '8. Wait for phases that were running at fail complete')
         running_phases_at_fail = running_tasks_at_fail.keys()
         statuses = ['Success', 'Failed']
-        plan_at_phase_complete = self._wait_for_conditions(
+        plan_at_phase_complete = self.plan_waiter.wait_for_condition(
             self._running_phases_completed(running_phases_at_fail, statuses),
             timeout=240,
             poll_interval=1)
@@ -762,7 +733,7 @@ class Story124437StopPlan(GenericTest):
 
         self.log('info',
         '9. Wait for plan to fail and check task statuses')
-        self.wait_for_plan_state(self.ms1, const.PLAN_STOPPED, 5)
+        self.plan_waiter.wait_for_plan_state(const.PLAN_STOPPED, timeout=300)
         failed_plan = self.get_plan_data(self.ms1)
         self._log_plan_state_details(failed_plan)
 
@@ -20,6 +20,8 @@ import test_constants as const
 import re
 import os
 from vcs_utils import VCSUtils
+from litp_stream_backup import newest_first
+from snapshot_merge_progress import SnapshotMergeProgress
 
 
 class Story138482(GenericTest):
@@ -50,9 +52,11 @@ class Story138482(GenericTest):
 
         self.cmd_puppet_enable = "/usr/bin/puppet agent --enable"
         self.cmd_puppet_disable = "/usr/bin/puppet agent --disable"
+        self.merge_progress = SnapshotMergeProgress(self, self.ms1)
 
     def tearDown(self):
         """ Runs for every test """
+        self.merge_progress.cleanup()
         super(Story138482, self).tearDown()
 
     def verify_file_name(self, backup_file):
@@ -194,15 +198,17 @@ class Story138482(GenericTest):
         self.log("info", "Wait for MS to be reachable again after reboot.")
         self.wait_for_node_up(self.ms1)
 
+        self.log("info", "Monitor the snapshot merge progress.")
+        self.merge_progress.start(timeout_secs=self.timeout_mins * 60)
+
         self.log("info", "Wait for litpd service to be running.")
-        cmd = self.rhc.get_service_running_cmd('litpd')
+        cmd = self.rhcmd.get_service_running_cmd('litpd')
         self.assertTrue(self.wait_for_cmd(self.ms1, cmd, 0, timeout_mins=5),
                         "litpd service is not online")
 
         self.log("info", "Wait for snapshot to merge.")
-        cmd = "/sbin/lvs | /bin/awk '{print $3}' | /bin/grep 'Owi'"
-        self.assertTrue(self.wait_for_cmd(
-            self.ms1, cmd, 1, timeout_mins=self.timeout_mins, su_root=True))
+        self.assertTrue(self.merge_progress.wait(self.timeout_mins),
+                        "Snapshot merge has not completed")
 
     def restore_litp_backup(self, backup_path):
         """ Restore LITP backup """
@@ -247,13 +253,15 @@ class Story138482(GenericTest):
 
     def list_backups(self, folder=None):
         """
-            Lists files in folder on MS (by default /tmp/litp_backup/)
+            Lists backup archives in folder on MS (by default
+            /tmp/litp_backup/), newest first by the timestamp in their name
+            rather than by modification time
         """
         if not folder:
             folder = self.backup_dir
-        cmd = "/bin/ls -1t {0}".format(folder)
+        cmd = "/bin/ls -1 {0}".format(folder)
         bkp_files = self.run_command(self.ms1, cmd, default_asserts=True)[0]
-        return bkp_files
+        return newest_first(bkp_files)
 
     def verify_backup_is_created(
             self, backup_files, expect_created=True, compare=True):
@@ -433,9 +441,7 @@ class Story138482(GenericTest):
         self.log("info", "#5. Run backup script.")
         self.run_backup_script()
 
-        cmd_list_backup_dir = "/bin/ls -1t {0}".format(self.backup_dir)
-        backup_file, _, _ = self.run_command(self.ms1, cmd_list_backup_dir,
-                                             default_asserts=True)
+        backup_file = self.list_backups()
         self.assertTrue(1 == len(backup_file))
 
         self.log("info", "#6. Copy the backup to the gateway.")
@@ -800,101 +800,6 @@ class Story1838(GenericTest):
                     #"Unable to reset the value of the HA_Manager property"
                 #)
 
-    #attr('all', 'non-revert')
-    def obsolete_09_p_rpctask_expansion(self):
-        """
-            Description:
-                Given a LITP deployment, if a node is part of a HA_cluster
-                and the plan contains at least one task for that node,
-                if the plugin provides lock/unlock tasks and an remote
-                execution task, then the plan output will return three
-                remote execution tasks, one per node, with
-                lock/unlock tasks present as well
-            Actions:
-                1. Copy over and install test RPMS
-                2. Run create + link commands
-                3. Run create_plan
-                4. Assert that the output is as expected
-            Result:
-                The returned RemoteExecutionTask() is actually expanded to
-                multiple tasks, one per node with associated lock/unlock
-                tasks
-        """
-        #ha_manager_prop_updated = False
-        #software_path = self.get_software_path(self.plugin_id)
-        #node_urls = self.find(self.test_ms, "/deployments", "node")
-
-        # 1. copy over and install RPMs
-        #self.assertTrue(self.install_rpms())
-
-        #try:
-            #self.assertTrue(self.update_ha_manager_prop("vcs"))
-            # 3. execute create CLI command
-            #self.execute_cli_create_cmd(
-                #self.test_ms, software_path,
-                #self.plugin_id, props="name=test_09"
-            #)
-
-            # the test plugin code queries the node context, so link this
-            # new software item with a new node item
-            #for node_url in node_urls:
-                #url_to_link = os.path.join(node_url, "items", self.plugin_id)
-                #self.execute_cli_inherit_cmd(
-                    #self.test_ms, url_to_link, software_path,
-                #)
-
-            # create strings as expected output in plan std_out
-            #lock_strs, unlock_strs = self.get_lock_unlock_strings(node_urls)
-
-            # 4. execute create_plan CLI command
-            #self.execute_cli_createplan_cmd(self.test_ms)
-
-            # 5. assert that there are no lock/unlock tasks (were not required)
-            #std_out, _, _ = self.execute_cli_showplan_cmd(self.test_ms)
-
-            # check that lock task strings are present
-            #self.log("info", "Are {0} in {1}?".format(lock_strs, std_out))
-            #self.assertTrue(
-                #all([
-                    #self.is_text_in_list(lock_str, std_out)
-                    #for lock_str in lock_strs
-                #])
-            #)
-
-            # check that unlock task strings are present
-            #self.log("info", "Are {0} in {1}?".format(unlock_strs, std_out))
-            #self.assertTrue(
-                #all([
-                    #self.is_text_in_list(unlock_str, std_out)
-                    #for unlock_str in unlock_strs
-                #])
-            #)
-
-            # check number of RemoteExecutionTasks
-            #task_str = "RemoteExecutionTask() test_09"
-            #num_nodes = len(self.get_managed_node_filenames())
-            #task_count = 0
-
-            # count number of RemoteExecutionTasks
-            #for line in std_out:
-                #if task_str in line:
-                    #task_count += 1
-
-            # check that we got enough RemoteExecutionTasks
-            #self.assertTrue(task_count == num_nodes)
-
-            # assert that the lock/unlock tasks come in the correct order
-            #self.assertTrue(
-                #self.lock_unlock_tasks_correct_order(std_out, node_urls)
-            #)
-        #finally:
-            # if the HA_Manager property was updated, reset it
-            #if ha_manager_prop_updated:
-                #self.assertTrue(
-                    #self.update_ha_manager_prop(reset=True),
-                    #"Unable to reset the value of the HA_Manager property"
-                #)
-
     @attr('all', 'non-revert', 'story1838', 'story1838_tc10')
     def test_10_n_cluster_lock_unlock(self):
         """
@@ -14,6 +14,7 @@ program(s) have been supplied.
 """
 from litp_generic_test import GenericTest, attr
 import test_constants as const
+from bulk_model_builder import BulkModelBuilder
 
 
 class Story184851(GenericTest):
@@ -52,6 +53,7 @@ class Story184851(GenericTest):
 
         self.clusters_to_expand = [self.cluster2, self.cluster3, self.cluster4]
         self.nodes_to_expand = list()
+        self.model_builder = BulkModelBuilder(self, self.ms_node)
 
     def tearDown(self):
         """ Runs after every single test """
@@ -82,10 +84,11 @@ class Story184851(GenericTest):
             props = 'cluster_type=sfha low_prio_net=mgmt llt_nets=hb1,hb2 ' \
                     'cluster_id={0}'.format(cluster['cluster_id'])
 
-            self.execute_cli_create_cmd(
-                self.ms_node, cluster['url'], 'vcs-cluster',
-                props=props, add_to_cleanup=False)
+            self.model_builder.add_create(cluster['url'], 'vcs-cluster',
+                                          props=props, add_to_cleanup=False)
+        self.model_builder.apply()
 
+        for cluster in self.clusters_to_expand:
             self.execute_expand_script(self.ms_node, cluster['script'])
 
     def _check_item_state(self, state, paths):
@@ -15,13 +15,27 @@ program(s) have been supplied.
                 Sub-Task: LITPCDS-3489, LITPCDS-3483, LITPCDS-3484
 '''
 
+import json
 import os
+import tempfile
 import time
+from collections import Counter
 import test_constants as const
 from litp_generic_test import GenericTest, attr
 from litp_cli_utils import CLIUtils
 from rest_utils import RestUtils
 from redhat_cmd_utils import RHCmdUtils
+from model_snapshot import parse_show_output
+from bulk_model_builder import BulkModelBuilder
+from metrics_log import MetricsLog, PLAN_RUN
+
+# The number of items, and so of callback updates, of each test_18 plan
+TC18_ROUND_ITEMS = (250, 500, 1000)
+# How much the time per update may grow from the smallest to the largest
+# test_18 plan
+TC18_GROWTH_TOLERANCE = 2.0
+# Installed only by the plugin rpms with the shared value source
+VALUES_MODULE = '/opt/ericsson/nms/litp/lib/story2783_plugin/unique_values.py'
 
 
 class Story2783(GenericTest):
@@ -70,6 +84,10 @@ class Story2783(GenericTest):
         self.xml_invalid_link = 'link_invalid_story2783.xml'
         self.xml_no_value = 'update_none_story2783.xml'
         self.xml_value = 'update_value_story2783.xml'
+        # bulk item creation and results of test_18
+        self.model_builder = BulkModelBuilder(self, self.management_node)
+        self.tc18_results_file = os.path.join(tempfile.gettempdir(),
+                                              'story2783_tc18_results.json')
 
     def tearDown(self):
         """
@@ -77,6 +95,7 @@ class Story2783(GenericTest):
             Runs after every test to perform the test teardown/cleanup
         """
 
+        self.model_builder.cleanup()
         # call super class teardown
 
         super(Story2783, self).tearDown()
@@ -146,6 +165,20 @@ class Story2783(GenericTest):
             install them
         """
 
+        # a plugin installed from an rpm built before the shared value
+        # source is replaced by the one in plugins/
+        plugin_package = self.test_plugins[1].split('.rpm')[0]
+        _, _, rcode = self.run_command(self.management_node,
+                                       'test -f {0}'.format(VALUES_MODULE),
+                                       su_root=True)
+        if rcode != 0 and self._is_plugin_installed(plugin_package):
+            _, _, rcode = self.run_command(self.management_node,
+                                           self.rhc.get_yum_remove_cmd(
+                                               [plugin_package]),
+                                           add_to_cleanup=False,
+                                           su_root=True)
+            self.assertEqual(0, rcode)
+
         plugins_require_install = self._check_installed_plugins()
         if plugins_require_install:
             # get the local filepath to the plugin rpm directory
@@ -2027,3 +2060,104 @@ class Story2783(GenericTest):
         self.assertEqual(0, rcode)
         self.assertEqual([], stderr)
         self.assertNotEqual([], stdout)
+
+    def _run_update_round(self, item_urls, first_index):
+        """
+        Description:
+            Load story2783 items whose callbacks each update the both
+            property once, then create and run the plan
+        Args:
+            item_urls (list): The urls of the items to create
+            first_index (int): The number in the name of the first item
+        Return:
+            float, The TimeTaken of the plan run in metrics.log
+        """
+        for index, item_url in enumerate(item_urls, first_index):
+            self.model_builder.add_create(
+                item_url, self.item_type,
+                self.properties[0].format('18_{0:05d}'.format(index)))
+        self.model_builder.apply()
+
+        self.execute_cli_createplan_cmd(self.management_node)
+        self.execute_cli_runplan_cmd(self.management_node)
+        self.assertTrue(self.wait_for_plan_state(self.management_node,
+                                                 const.PLAN_COMPLETE))
+        metrics_log = MetricsLog.from_node(self, self.management_node,
+                                           const.METRICS_LOG)
+        return metrics_log.values(PLAN_RUN, 'TimeTaken')[-1]
+
+    @attr('all', 'non-revert', 'story2783', 'story2783_tc18')
+    def test_18_p_plugin_property_values_unique_across_callbacks(self):
+        """
+        Description:
+            Plans of growing size run callback tasks that each write a new
+            value to the both property of their own story2783 item. The
+            callbacks run in the forked Celery worker processes, which must
+            never issue the same value twice, and the time of a plan run
+            must grow linearly with the number of updates
+
+        Test Steps:
+            1. For 250, 500 and 1000 items: load the items, each with its
+               own name, then create and run the plan
+            2. Check that every plan completes and record its run time
+            3. Check that every item has a value in both and that no value
+               was issued twice
+            4. Check that the run time per update of the largest plan is
+               at most twice that of the smallest
+
+        Expected Result:
+            The callbacks of every worker process issue values that are all
+            different, and the cost of an update does not grow with the
+            number of updates
+        """
+        self._install_plugins()
+        software_item_url = self.find(self.management_node, '/software',
+                                      'software-item',
+                                      rtn_type_children=False)[0]
+        self.backup_file(self.management_node, const.METRICS_LOG,
+                         backup_mode_cp=False)
+
+        item_urls = []
+        results = []
+        for num_items in TC18_ROUND_ITEMS:
+            round_urls = ['{0}{1}_tc18_{2:05d}'.format(
+                software_item_url, self.plugin_model_item, index)
+                for index in range(len(item_urls),
+                                   len(item_urls) + num_items)]
+            run_time = self._run_update_round(round_urls, len(item_urls))
+            item_urls.extend(round_urls)
+            results.append({'updates': num_items, 'run_time': run_time,
+                            'time_per_update': run_time / num_items})
+            self.log('info', 'updates={updates} run_time={run_time:.3f}s '
+                     'time_per_update={time_per_update:.4f}s'.format(
+                         **results[-1]))
+        with open(self.tc18_results_file, 'w') as results_file:
+            json.dump(results, results_file, indent=4, sort_keys=True)
+        self.log('info', 'results saved to {0}'.format(
+            self.tc18_results_file))
+
+        stdout, _, rcode = self.run_command(
+            self.management_node,
+            self.cli.get_show_cmd(software_item_url, '-r'), logging=False)
+        self.assertEqual(0, rcode)
+        items = parse_show_output(stdout)
+        prop = self.properties[3].split('=')[0]
+        values = [items[item_url].properties.get(prop)
+                  for item_url in item_urls]
+        self.assertFalse(None in values, 'Items without a {0} value: {1}'
+                         .format(prop, [item_url for item_url, value
+                                        in zip(item_urls, values)
+                                        if value is None]))
+        self.assertEqual(len(values), len(set(values)),
+                         'Values issued more than once: {0}'.format(
+                             sorted(value for value, count in
+                                    Counter(values).items() if count > 1)))
+
+        smallest, largest = results[0], results[-1]
+        self.assertTrue(
+            largest['time_per_update'] <=
+            TC18_GROWTH_TOLERANCE * smallest['time_per_update'],
+            'An update took {0:.4f}s in a plan of {1} updates and '
+            '{2:.4f}s in a plan of {3}'.format(
+                largest['time_per_update'], largest['updates'],
+                smallest['time_per_update'], smallest['updates']))
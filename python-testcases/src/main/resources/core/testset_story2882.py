@@ -97,6 +97,8 @@ class Story2882(GenericTest):
                                            self.mco_agent_name, ext),
                 [search_string], "-l"))
 
+        # wait_for_puppet_action triggers puppet runs from the MS, so the
+        # nodes are checked one at a time
         for node in self.mn_nodes:
             for cmd in cmds:
                 self.assertTrue(self.wait_for_puppet_action(
@@ -17,6 +17,8 @@ program(s) have been supplied.
 from litp_generic_test import GenericTest, attr
 from redhat_cmd_utils import RHCmdUtils
 from litp_cli_utils import CLIUtils
+from node_fanout import NodeFanOut
+from ssh_session_pool import SSHSessionPool
 import test_constants
 
 
@@ -36,9 +38,12 @@ class Story289801(GenericTest):
         self.cli = CLIUtils()
         self.uptime_cmd = "/usr/bin/uptime"
         self.litp_path = "/usr/bin/litp"
+        self.fanout = NodeFanOut(timeout=60)
+        self.ssh_pool = SSHSessionPool(self)
 
     def tearDown(self):
         """run after every test"""
+        self.ssh_pool.close()
         super(Story289801, self).tearDown()
         # EXTRA CODE ADDED ON ACCOUNT OF TORF-302424
         # WHICH ESSENTIALLY PREVENTS restore_model FROM
@@ -142,7 +147,7 @@ class Story289801(GenericTest):
                 .format(self.litp_path, url)
             return cmd
 
-    def chk_node_uptime(self, node, node_uptimes):
+    def chk_node_uptime(self, node, node_uptimes, stdout=None):
         """
         Description:
             Function to check the uptime on the supplied node.
@@ -151,12 +156,16 @@ class Story289801(GenericTest):
 
             node_uptimes (list): list to which the nodes
                                  uptime is to be added.
+
+            stdout (list): Output of the uptime command already run on
+                           the node. The command is run if None.
         Returns:
             dict. Uptimes of the nodes with node filename as key
         """
         # ISSUE THE UPTIME COMMAND ON THE SUPPLIED NODE.
-        stdout, _, _ = \
-            self.run_command(node, self.uptime_cmd)
+        if stdout is None:
+            stdout, _, _ = \
+                self.run_command(node, self.uptime_cmd)
 
         # PARSE THE UPTIME COMMAND OUTPUT AND CONVERT
         # DAYS AND HOURS DECLARATIONS TO MINUTES
@@ -202,6 +211,29 @@ class Story289801(GenericTest):
                     hour_converted_mins + mins
                 return node_uptimes
 
+    def _get_node_uptimes(self):
+        """
+        Description:
+            Check the uptime on all the managed nodes in parallel.
+            The uptime command runs on a pooled session of each node and
+            times out before the fan-out gives up on the node. Only the
+            sessions of the nodes that rebooted are closed, and those
+            nodes reconnect in parallel on the fan-out threads
+        Returns:
+            dict. Uptimes of the nodes with node filename as key
+        """
+        self.ssh_pool.close_inactive()
+        outputs = self.fanout.run(
+            lambda node: self.ssh_pool.run_command(node, self.uptime_cmd,
+                                                   timeout=30),
+            self.list_managed_nodes)
+        node_uptimes = {}
+        for node, (stdout, stderr, rcode) in outputs.iteritems():
+            self.assertEqual(0, rcode, '"{0}" failed on {1}: {2}'.format(
+                self.uptime_cmd, node, stderr))
+            self.chk_node_uptime(node, node_uptimes, stdout)
+        return node_uptimes
+
     def compare_uptimes(self, starting_node_uptimes, current_node_uptimes):
         """
         Description:
@@ -323,10 +355,7 @@ class Story289801(GenericTest):
         @tms_execution_type: Automated
         """
         self.log('info', "Gather the starting uptimes of the nodes.")
-        starting_node_uptimes = {}
-        for node in self.list_managed_nodes:
-            starting_node_uptimes = \
-                self.chk_node_uptime(node, starting_node_uptimes)
+        starting_node_uptimes = self._get_node_uptimes()
 
         self.log('info', "Gather the URLs for some LITP items.")
         package_url = \
@@ -403,9 +432,7 @@ class Story289801(GenericTest):
 
         self.log('info', "Cycle through the nodes and "
                          "ensure the uptime shows the node to have rebooted.")
-        new_node_uptimes = {}
-        for node in self.list_managed_nodes:
-            new_node_uptimes = self.chk_node_uptime(node, new_node_uptimes)
+        new_node_uptimes = self._get_node_uptimes()
 
         self.compare_uptimes(starting_node_uptimes, new_node_uptimes)
 
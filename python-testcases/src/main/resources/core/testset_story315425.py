@@ -14,6 +14,7 @@ program(s) have been supplied.
 
 from litp_generic_test import GenericTest, attr
 from test_constants import BASH_PATH, GZIP_PATH, DD_PATH, ECHO_PATH
+from stream_backup import StreamBackup
 
 
 class Story315425(GenericTest):
@@ -31,6 +32,8 @@ class Story315425(GenericTest):
             '{0} -x /opt/ericsson/nms/litp/bin/litp_state_backup.sh {1}'\
             .format(BASH_PATH, self.backup_dir)
         self.ms_node = self.get_management_node_filename()
+        self.stream_backup = StreamBackup(self, self.ms_node)
+        self.restore_dir = '/tmp/litp_restore_check'
 
         self.log('info', 'Creating the backup directory')
         self.create_dir_on_node(node=self.ms_node,
@@ -40,6 +43,8 @@ class Story315425(GenericTest):
 
     def tearDown(self):
         """Run after every test"""
+        self.stream_backup.cleanup()
+        self.remove_item(self.ms_node, self.restore_dir, su_root=True)
         super(Story315425, self).tearDown()
 
     @attr('all', 'revert', 'Story315425', 'TORF_315425_tc03')
@@ -130,3 +135,165 @@ class Story315425(GenericTest):
 
         self.assertTrue('ok' in std_out, 'The file {0} is corrupted!'
                         .format(good_archive_file_name))
+
+    @attr('all', 'revert', 'Story315425', 'TORF_315425_tc04')
+    def test_04_p_corrupted_stream_backup(self):
+        """
+            @tms_id: TORF_315425_tc04
+            @tms_requirements_id: TORF-107258
+            @tms_title: Detect a corrupted streaming LITP backup from its
+                        checksums
+            @tms_description: Test to verify that a corruption of a
+                              streaming backup is found from the checksums
+                              recorded while the backup was written, and
+                              that the newest valid backup is then the next
+                              one created
+            @tms_test_steps:
+             @step:   Create a streaming backup
+             @result: The backup verifies against its checksum manifest
+             @step:   Corrupt the backup file
+             @result: Both the quick digest check and the full member
+                      check report the backup as corrupted
+             @step:   Create another streaming backup
+             @result: The new backup has a new name, verifies and is the
+                      newest valid backup
+            @tms_test_precondition: NA
+            @tms_execution_type: Automated
+        """
+        self.log('info', '1. Creating the streaming backup archive')
+        corrupted_archive_file_name = self.stream_backup.backup(
+            self.backup_dir)['archive']
+        result = self.stream_backup.verify(corrupted_archive_file_name)
+        self.assertTrue(result['valid'], 'The file {0} is corrupted: {1}'
+                        .format(corrupted_archive_file_name,
+                                result['errors']))
+
+        self.log('info', '2. Corrupting the existing backup file')
+        corrupt_archive_command = \
+            '{0} seek=4000 bs=1 count=1 conv=notrunc of={1} ' \
+            '<<<"111100000000000000"'\
+            .format(DD_PATH, corrupted_archive_file_name)
+        self.run_command(node=self.ms_node,
+                         cmd=corrupt_archive_command,
+                         su_root=True)
+
+        for quick in (True, False):
+            result = self.stream_backup.verify(corrupted_archive_file_name,
+                                               quick=quick)
+            self.log('info', 'Verification (quick={0}) errors: {1}'
+                     .format(quick, result['errors']))
+            self.assertFalse(result['valid'],
+                             'The file {0} should have been corrupted!'
+                             .format(corrupted_archive_file_name))
+            self.assertNotEqual(0, result['rc'])
+
+        self.log('info', '3. Checking that a new backup file is created '
+                         'and is the newest valid backup')
+        good_archive_file_name = self.stream_backup.backup(
+            self.backup_dir)['archive']
+        self.assertNotEquals(
+            corrupted_archive_file_name, good_archive_file_name,
+            'The newly generated file name should not have '
+            'the same name as the previous backup file {0}!'
+            .format(good_archive_file_name))
+        result = self.stream_backup.verify(good_archive_file_name)
+        self.assertTrue(result['valid'], 'The file {0} is corrupted: {1}'
+                        .format(good_archive_file_name, result['errors']))
+        self.assertEqual(good_archive_file_name,
+                         self.stream_backup.latest(self.backup_dir,
+                                                   valid=True))
+
+    @attr('all', 'revert', 'Story315425', 'TORF_315425_tc05')
+    def test_05_p_corrupted_incremental_backup(self):
+        """
+            @tms_id: TORF_315425_tc05
+            @tms_requirements_id: TORF-107258
+            @tms_title: Test a new base backup is created if a delta of the
+                        incremental backup chain is corrupted
+            @tms_description: Test to verify that a restore of an
+                              incremental backup chain detects a corrupted
+                              delta, and that the next incremental backup
+                              starts a new chain instead of extending the
+                              corrupted one
+            @tms_test_steps:
+             @step:   Take an incremental backup
+             @result: A base backup is created
+             @step:   Create a package item and take an incremental backup
+             @result: A delta of the base backup is created
+             @step:   Update the package item and take an incremental
+                      backup
+             @result: A delta of the first delta is created
+             @step:   Restore the last delta
+             @result: The chain of three backups is restored
+             @step:   Corrupt the first delta
+             @result: The delta does not verify and the restore of the
+                      last delta reports the corrupted delta
+             @step:   Take an incremental backup
+             @result: A new base backup is created and can be restored
+            @tms_test_precondition: NA
+            @tms_execution_type: Automated
+        """
+        self.log('info', '1. Creating the base backup')
+        base = self.stream_backup.backup(self.backup_dir, incremental=True)
+        self.assertEqual('base', base['type'])
+
+        self.log('info', '2. Creating a delta after a model change')
+        package_url = self.find(self.ms_node, '/software',
+                                'collection-of-software-item')[0] + \
+            '/story315425_delta'
+        self.execute_cli_create_cmd(self.ms_node, package_url, 'package',
+                                    'name=story315425-delta')
+        first_delta = self.stream_backup.backup(self.backup_dir,
+                                                incremental=True)
+        self.assertEqual('delta', first_delta['type'])
+        self.assertEqual(base['archive'].split('/')[-1],
+                         first_delta['parent'])
+
+        self.log('info', '3. Creating a delta of the delta')
+        self.execute_cli_update_cmd(self.ms_node, package_url,
+                                    'version=1.0')
+        second_delta = self.stream_backup.backup(self.backup_dir,
+                                                 incremental=True)
+        self.assertEqual('delta', second_delta['type'])
+        self.assertEqual(3, second_delta['length'])
+        self.log('info', 'Base {0} bytes, deltas {1} and {2} bytes'.format(
+            base['bytes_written'], first_delta['bytes_written'],
+            second_delta['bytes_written']))
+
+        self.log('info', '4. Restoring the last delta')
+        result = self.stream_backup.restore(second_delta['archive'],
+                                            self.restore_dir)
+        self.assertTrue(result['valid'], 'The restore of {0} failed: {1}'
+                        .format(second_delta['archive'], result['errors']))
+        self.assertEqual(3, len(result['chain']))
+
+        self.log('info', '5. Corrupting the first delta')
+        corrupt_archive_command = \
+            '{0} seek=100 bs=1 count=1 conv=notrunc of={1} ' \
+            '<<<"111100000000000000"'\
+            .format(DD_PATH, first_delta['archive'])
+        self.run_command(node=self.ms_node,
+                         cmd=corrupt_archive_command,
+                         su_root=True)
+        result = self.stream_backup.verify(first_delta['archive'])
+        self.assertFalse(result['valid'],
+                         'The file {0} should have been corrupted!'
+                         .format(first_delta['archive']))
+        self.remove_item(self.ms_node, self.restore_dir, su_root=True)
+        result = self.stream_backup.restore(second_delta['archive'],
+                                            self.restore_dir)
+        self.log('info', 'Restore errors: {0}'.format(result['errors']))
+        self.assertFalse(result['valid'])
+        self.assertTrue(any(first_delta['archive'].split('/')[-1] in error
+                            for error in result['errors']))
+
+        self.log('info', '6. Checking a new base backup is created')
+        new_base = self.stream_backup.backup(self.backup_dir,
+                                             incremental=True)
+        self.log('info', 'New base backup: {0}'.format(new_base['reason']))
+        self.assertEqual('base', new_base['type'])
+        self.remove_item(self.ms_node, self.restore_dir, su_root=True)
+        result = self.stream_backup.restore(new_base['archive'],
+                                            self.restore_dir)
+        self.assertTrue(result['valid'], 'The restore of {0} failed: {1}'
+                        .format(new_base['archive'], result['errors']))
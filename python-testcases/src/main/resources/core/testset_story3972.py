@@ -18,10 +18,11 @@ program(s) have been supplied.
 from litp_generic_test import GenericTest, attr
 from litp_cli_utils import CLIUtils
 from xml_utils import XMLUtils
+from model_snapshot import ModelCacheMixin
 import os
 
 
-class Story3972(GenericTest):
+class Story3972(ModelCacheMixin, GenericTest):
 
     '''
         As a LITP User I want a type for collections,
@@ -23,6 +23,10 @@ import re
 import os
 import json
 from redhat_cmd_utils import RHCmdUtils
+from ssh_session_pool import SSHSessionPool
+from remote_file_stat import get_file_stats
+from node_fanout import NodeFanOut
+from log_follower import LogFollower
 from time import sleep
 import test_constants
 
@@ -174,9 +178,12 @@ class Story4060(GenericTest):
         self.audit_key = "agentaudit"
         self.maintenance_url = "/litp/maintenance"
         self.audit_config = "/usr/lib/systemd/system/auditd.service"
+        self.ssh_pool = SSHSessionPool(self)
+        self.syslog = LogFollower(self.ssh_pool, self.ms_node)
 
     def tearDown(self):
         """ Called after every test"""
+        self.ssh_pool.close()
         super(Story4060, self).tearDown()
 
     def _do_cleanup(self, files, restore):
@@ -334,6 +341,27 @@ class Story4060(GenericTest):
                                                       filepart, pkg_name))
             return result
 
+    def _rpms_or_images_available_on_ms(self, pkg_names, filepart,
+                                        is_img=False):
+        """ Check with a single remote call if all the given rpms or
+            images are available on ms in the www folder.
+            pkg_names: names of the packages or images to look for
+            filepart: helps build the filepath ( eg for
+                     <repo_path>/repodata/repomd.xml)
+            is_img: this is a flag to say if these are images or not
+                   Images have no repodata.
+        """
+        base_dir = os.path.join(test_constants.PARENT_PKG_REPO_DIR, filepart)
+        paths = [os.path.join(base_dir, pkg_name) for pkg_name in pkg_names]
+        if not is_img:
+            paths.append(os.path.join(base_dir, 'repodata/repomd.xml'))
+        found = get_file_stats(self.ssh_pool, self.ms_node, paths,
+                               digest=False, su_root=False)
+        missing = [path for path in paths if path not in found]
+        if missing:
+            self.log('info', 'Not found on ms: {0}'.format(missing))
+        return not missing
+
     def _litp_in_mmode(self):
         """ Determine if litp is in maintenance mode. """
         # Modified the path as in LITPCDS-8999 '/litp/maintenance' will be
@@ -352,55 +380,34 @@ class Story4060(GenericTest):
         self.execute_cli_update_cmd(
             self.ms_node, '/litp/maintenance', prop_val)
 
-    def _litp_enters_mmode(self, log_len=0):
+    def _litp_enters_mmode(self):
         """ Wait for log message saying litp has entered maintenance mode. """
         match = self._wait_for_message(
                     '/litp/maintenance',
                     "INFO: Updated item /litp/maintenance. "
                     "Updated properties: 'enabled': true",
-                    log_len=log_len,
                     timeout_sec=180)
         return match is not None
 
-    def _get_sys_log_len(self):
-        """ Find length (in lines) of system log file. """
-        return self.get_file_len(self.ms_node,
-                                 test_constants.GEN_SYSTEM_LOG_PATH)
-
-    def _wait_for_message(self, grep_filter, message_expr,
-                          log_len=0, timeout_sec=180):
+    def _wait_for_message(self, grep_filter, message_expr, timeout_sec=180):
         """ Wait for a message to appear in the system log.
-            The check looks at all lines added to the log beyond the
-            length specified as log_len. (Or the current length, if
-            log_len is zero.)  We first grep for lines matching 'grep_filter',
-            then search those for lines matching the regex 'message_expr'
+            The check looks at the lines added to the log since the last
+            call to self.syslog.mark(). Only the bytes written since the
+            previous poll are read from the MS. Lines containing
+            'grep_filter' are searched for the regex 'message_expr'
             which may contain regex groups, etc.
             The return value is the match object as returned by re.search(),
             or None if the timeout is reached without seeing a match.
         """
         elapsed_sec = 0
         interval_sec = 5
-        log_path = test_constants.GEN_SYSTEM_LOG_PATH
-
-        # Get current log length
-        if log_len == 0:
-            log_len = self._get_sys_log_len()
-        self.assertTrue(log_len != 0, "Log file not found")
-
         reg = re.compile(message_expr, re.DOTALL)
 
         while elapsed_sec < timeout_sec:
             # Check if message is in the latest messages
-            curr_log_pos = self.get_file_len(self.ms_node, log_path)
-            test_logs_len = curr_log_pos - log_len
-            cmd = self.rhcmd.get_grep_file_cmd(log_path, grep_filter,
-                                               file_access_cmd="tail -n {0}"
-                                               .format(test_logs_len))
-            out, err, ret_code = self.run_command(self.ms_node, cmd)
-            self.assertTrue(ret_code < 2)
-            self.assertEqual([], err)
-
-            for line in out:
+            for line in self.syslog.read_new_lines():
+                if grep_filter not in line:
+                    continue
                 match = reg.search(line)
                 if match:
                     return match
@@ -546,18 +553,25 @@ class Story4060(GenericTest):
 
     def _are_rpms_available(self, node_list, rpms_list):
         """ Check if rpms are available on nodes."""
-        _rpm_availability_list = []
-        for node in node_list:
-            for rpm in rpms_list:
-                cmd = ("repoquery -q --qf "
-                       "'%{name}-%{version}-%{release}.%{arch}' " + rpm)
-                out, err, ret_code = self.run_command(node,
-                                                      cmd,
-                                                      su_root=True)
+        cmds = [("repoquery -q --qf "
+                 "'%{name}-%{version}-%{release}.%{arch}' " + rpm)
+                for rpm in rpms_list]
+
+        def query_node(node):
+            """ Query all the rpms on a node in a single round trip """
+            availability = []
+            results = self.ssh_pool.run_commands(node, cmds, su_root=True)
+            for rpm, (out, err, ret_code) in zip(rpms_list, results):
                 self.assertFalse(err)
                 self.assertEqual(0, ret_code)
-                result = self.is_text_in_list(rpm, out)
-                _rpm_availability_list.append(result)
+                availability.append(self.is_text_in_list(rpm, out))
+            return availability
+
+        # Nodes are queried in parallel
+        _rpm_availability_list = []
+        for availability in NodeFanOut().run(query_node,
+                                             node_list).values():
+            _rpm_availability_list.extend(availability)
 
         return "False" in _rpm_availability_list
 
@@ -1058,11 +1072,11 @@ class Story4060(GenericTest):
 
             self.log("info", "# 8. Execute \"litp import_iso\" on the "
                      "directory")
-            log_len = self._get_sys_log_len()
+            self.syslog.mark()
             self.execute_cli_import_iso_cmd(self.ms_node, iso_path)
 
             self.log("info", "# 9. Verify that litp is in maintenance mode.")
-            self.assertTrue(self._litp_enters_mmode(log_len=log_len))
+            self.assertTrue(self._litp_enters_mmode())
 
             self.log("info", "# 10. Check maintenance item properties during "
                      "import_iso")
@@ -1176,13 +1190,9 @@ class Story4060(GenericTest):
                                            base_path,
                                            project_dir))
                         if filename.endswith('.rpm')]
-            for pkg in rpm_list:
-                check_pkg = \
-                    self._rpm_or_image_available_on_ms(pkg, project_dir.
-                                                     split('/')[1],
-                                                     check_www=True,
-                                                     filepart=project_repo_dir)
-                self.assertEquals(check_pkg, True)
+            self.assertTrue(self._rpms_or_images_available_on_ms(
+                                                    rpm_list,
+                                                    project_repo_dir))
 
             self.log("info", "# 17.2 <path>/litp/repo/<project>/<subproject> "
                      "directory are added to a repository named "
@@ -1197,13 +1207,9 @@ class Story4060(GenericTest):
                              project_subdir))
                          if filename.endswith('.rpm')]
 
-            for pkg in rpm_list1:
-                pkg_chk = self._rpm_or_image_available_on_ms(
-                                               pkg,
-                                               project_subdir,
-                                               check_www=True,
-                                               filepart=project_sub_repo_dir)
-                self.assertEquals(pkg_chk, True)
+            self.assertTrue(self._rpms_or_images_available_on_ms(
+                                                    rpm_list1,
+                                                    project_sub_repo_dir))
 
             self.log("info", "# 17.3 <path>/litp/plugins/<project> directory "
                      "are added to a yum repository named \"litp_plugins\"")
@@ -1453,41 +1459,21 @@ class Story4060(GenericTest):
                      'the correct directory structure')
             # 4. Check that images are present in the correct directory
             #    structure
-            for img in image_list1:
-                self.assertEquals(self._rpm_or_image_available_on_ms(
-                    img, project_subdir[0].split('/')[1] + '/' +
-                    project_subdir[0].split('/')[2],
-                    check_www=True,
-                    filepart=project_subdir[0], is_img=True),
-                    True)
-            for img in image_list2:
-                self.assertEquals(self._rpm_or_image_available_on_ms(
-                    img, project_subdir[1].split('/')[1] + '/' +
-                    project_subdir[0].split('/')[2],
-                    check_www=True,
-                    filepart=project_subdir[1], is_img=True),
-                    True)
-            for img in image_list3:
-                self.assertEquals(self._rpm_or_image_available_on_ms(
-                    img, project_subdir[2].split('/')[1] + '/' +
-                    project_subdir[0].split('/')[2],
-                    check_www=True,
-                    filepart=project_subdir[2], is_img=True),
-                    True)
-            for img in image_list4:
-                self.assertEquals(self._rpm_or_image_available_on_ms(
-                    img, project_subdir[3].split('/')[1] + '/' +
-                    project_subdir[0].split('/')[2],
-                    check_www=True,
-                    filepart=project_subdir[3], is_img=True),
-                    True)
+            self.assertTrue(self._rpms_or_images_available_on_ms(
+                image_list1, project_subdir[0], is_img=True))
+            self.assertTrue(self._rpms_or_images_available_on_ms(
+                image_list2, project_subdir[1], is_img=True))
+            self.assertTrue(self._rpms_or_images_available_on_ms(
+                image_list3, project_subdir[2], is_img=True))
+            self.assertTrue(self._rpms_or_images_available_on_ms(
+                image_list4, project_subdir[3], is_img=True))
 
             self.log('info', 'Verify the checksum has been '
                      'created on destination')
             # 5. Verify the checksum has been created on destination
-            for filename in file_paths:
-                self.assertTrue(
-                    self.remote_path_exists(self.ms_node, filename))
+            found = get_file_stats(self.ssh_pool, self.ms_node, file_paths,
+                                   digest=False, su_root=False)
+            self.assertEqual(set(file_paths), set(found.keys()))
             self.log('info', 'Verify that the import handles directories with '
                      'all permissible characters, and import_iso successfully '
                      'overwrites a file that already existed '
@@ -20,6 +20,7 @@ import test_constants
 from litp_generic_test import GenericTest
 from litp_cli_utils import CLIUtils
 from redhat_cmd_utils import RHCmdUtils
+from plan_model import PlanModelCache
 
 
 class Story5508(GenericTest):
@@ -37,6 +38,7 @@ class Story5508(GenericTest):
         self.management_node = self.get_management_node_filename()
         self.ms_ip_address = self.get_node_att(self.management_node, 'ipv4')
         self.cli = CLIUtils()
+        self.plan_models = PlanModelCache(self.cli)
         self.rhc = RHCmdUtils()
         self.item_type = 'story5508'
         self.manifests_dir = test_constants.PUPPET_MANIFESTS_DIR
@@ -140,15 +142,14 @@ class Story5508(GenericTest):
         r_phase = -1
         r_task = -1
         r_task_desc = ''
-        plan_d = self.cli.parse_plan_output(stdout)
-        for phase in plan_d.keys():
-            for task in plan_d[phase].keys():
-                task_desc = self.cli.get_task_desc(stdout, phase, task)
-                if self.is_text_in_list(lookup, task_desc) and \
-                    self.is_text_in_list(node.split('/')[-1], task_desc):
-                    r_phase = phase
-                    r_task = task
-                    r_task_desc = task_desc
+        plan = self.plan_models.from_output(stdout)
+        node_id = node.split('/')[-1]
+        for phase, task in plan.find_task_keys(description=lookup):
+            if self.is_text_in_list(node_id, plan.task(phase, task)['DESC']):
+                r_phase = phase
+                r_task = task
+        if r_phase != -1:
+            r_task_desc = self.cli.get_task_desc(stdout, r_phase, r_task)
         return r_phase, r_task, r_task_desc
 
     def _get_task_state_from_plan(self, r_phase, r_task):
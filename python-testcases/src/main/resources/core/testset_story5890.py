@@ -23,6 +23,7 @@ from litp_cli_utils import CLIUtils
 from redhat_cmd_utils import RHCmdUtils
 from rest_utils import RestUtils
 from vcs_utils import VCSUtils
+from plan_model import PlanModelCache
 
 
 class Story5890(GenericTest):
@@ -39,6 +40,7 @@ class Story5890(GenericTest):
         self.ms_node = self.get_management_node_filename()
         self.ms_ip_address = self.get_node_att(self.ms_node, 'ipv4')
         self.cli = CLIUtils()
+        self.plan_models = PlanModelCache(self.cli)
         self.rhc = RHCmdUtils()
         self.rest = RestUtils(self.ms_ip_address)
         self.vcs = VCSUtils()
@@ -106,14 +108,11 @@ class Story5890(GenericTest):
 
     def _get_first_task_in_plan(self, stdout):
         """Returns task object which is at the top of the plan."""
-        return self.cli.parse_plan_output(stdout)[1][1]
+        return self.plan_models.from_output(stdout).first_task()
 
     def _get_last_task_in_plan(self, stdout):
         """Returns task object which is at the bottom of the plan."""
-        phase = self.cli.get_num_phases_in_plan(stdout)
-        task = self.cli.get_num_tasks_in_phase(stdout, phase)
-        plan_d = self.cli.parse_plan_output(stdout)
-        return plan_d[phase][task]
+        return self.plan_models.from_output(stdout).last_task()
 
     def _get_relevant_task_from_plan(self, stdout, nodes, lookup):
         """
@@ -136,27 +135,14 @@ class Story5890(GenericTest):
 
     def _get_task_state_from_plan(self, lookup):
         """Returns a string of the task state which matches lookup paramter."""
-        task_state = ''
-        stdout, _, _ = self.execute_cli_showplan_cmd(self.ms_node)
-        plan_d = self.cli.parse_plan_output(stdout)
-        for phase in plan_d.keys():
-            for task in plan_d[phase].keys():
-                for desc in plan_d[phase][task]['DESC']:
-                    if lookup in desc:
-                        task_state = plan_d[phase][task]['STATUS']
-        return task_state
+        tasks = self.plan_models.from_node(self, self.ms_node).find_tasks(
+                                                        description=lookup)
+        return tasks[-1]['STATUS'] if tasks else ''
 
     def _find_all_specific_tasks_in_plan(self, stdout, description, node_path):
         """Searches through the plan and returns a list of matching tasks."""
-        matching_tasks = []
-        plan_d = self.cli.parse_plan_output(stdout)
-        for phase in plan_d.keys():
-            for task in plan_d[phase].keys():
-                # Only find matching tasks
-                desc = plan_d[phase][task]['DESC']
-                if description in desc and node_path in desc:
-                    matching_tasks.append(plan_d[phase][task])
-        return matching_tasks
+        return self.plan_models.from_output(stdout).find_tasks_with_lines(
+                                                        description, node_path)
 
     def _manual_unlock(self, node):
         """Manually unlock node."""
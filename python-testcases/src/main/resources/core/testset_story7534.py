@@ -23,9 +23,10 @@ import os
 import re
 from litp_generic_test import GenericTest, attr
 from xml_utils import XMLUtils
+from model_snapshot import ModelCacheMixin
 
 
-class Story7534(GenericTest):
+class Story7534(ModelCacheMixin, GenericTest):
     """
     LITPCDS-7534:
     As a LITP User, I want the XSD validation to allow for property annotation,
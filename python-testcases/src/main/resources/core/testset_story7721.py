@@ -17,6 +17,7 @@ program(s) have been supplied.
 from litp_generic_test import GenericTest, attr
 from redhat_cmd_utils import RHCmdUtils
 from rest_utils import RestUtils
+from puppet_manifest import PuppetManifest
 import test_constants as const
 import json
 
@@ -40,21 +41,31 @@ class Story7721(GenericTest):
         """ Runs after every single test """
         super(Story7721, self).tearDown()
 
-    def _check_manifest(self, manifest_file, search_item):
+    def _get_manifest(self, manifest_file):
+        """
+        Description:
+            Fetch and parse a puppet manifest
+        Args:
+            manifest_file (str): manifest file to be fetched
+        Return:
+            PuppetManifest, The parsed manifest
+        """
+        manifest = PuppetManifest.from_node(self, self.ms1, manifest_file)
+        self.assertNotEqual(None, manifest,
+            'Puppet manifest "{0}" not found'.format(manifest_file))
+        return manifest
+
+    def _check_manifest(self, manifest, search_item):
         """
         Description:
             grep a puppet manifest for a particular line
         Args:
-            manifest_file (str): manifest file to be searched
+            manifest (PuppetManifest): manifest to be searched
             search_item (str): search item
         Return:
             list, The list of lines matching the given pattern
         """
-        manifest_file_path = '{0}{1}'. \
-                             format(const.PUPPET_MANIFESTS_DIR, manifest_file)
-        cmd = self.rhel.get_grep_file_cmd(manifest_file_path, search_item)
-        stdout, _, _ = self.run_command(self.ms1, cmd, default_asserts=True,
-            su_root=True)
+        stdout = manifest.grep(search_item)
         self.assertNotEqual([], stdout)
 
         return stdout
@@ -182,13 +193,14 @@ class Story7721(GenericTest):
         self.log('info',
         '6. Check that the successful tasks in phase 2 are in the manifest '
             'file')
-        manifest_constents = self._check_manifest("node1.pp", "br7721")
+        manifest = self._get_manifest("node1.pp")
+        manifest_constents = self._check_manifest(manifest, "br7721")
         task_br7721 = 'task_node1__litpnetwork_3a_3aconfig__br7721'
         self.assertTrue(
             self.is_text_in_list(task_br7721, manifest_constents),
             "Task for br7721 not found in manifest")
 
-        manifest_constents = self._check_manifest("node1.pp", "eth1_2e629")
+        manifest_constents = self._check_manifest(manifest, "eth1_2e629")
         task_eth1_2e629 = 'task_node1__litpnetwork_3a_3aconfig__eth1_2e629'
         self.assertTrue(
             self.is_text_in_list(task_eth1_2e629, manifest_constents),
@@ -249,12 +261,13 @@ class Story7721(GenericTest):
         self.log('info',
         '10. Check that previously created entries in manifest are not '
             'removed')
-        manifest_constents = self._check_manifest("node1.pp", "br7721")
+        manifest = self._get_manifest("node1.pp")
+        manifest_constents = self._check_manifest(manifest, "br7721")
         self.assertTrue(
             self.is_text_in_list(task_br7721, manifest_constents),
             "dependency not in manifest")
 
-        manifest_constents = self._check_manifest("node1.pp", "eth1_2e629")
+        manifest_constents = self._check_manifest(manifest, "eth1_2e629")
         self.assertTrue(
             self.is_text_in_list(task_eth1_2e629, manifest_constents),
             "dependency not in manifest")
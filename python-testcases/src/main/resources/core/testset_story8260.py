@@ -16,6 +16,10 @@ program(s) have been supplied.
 
 from litp_generic_test import GenericTest, attr
 from redhat_cmd_utils import RHCmdUtils
+from ssh_session_pool import SSHSessionPool
+from remote_file_stat import get_dir_file_stats
+from plan_model import PlanModelCache
+import os
 import test_constants as const
 
 
@@ -37,9 +41,12 @@ class Story8260(GenericTest):
         self.sysparam_node1_config = self.find(self.ms_node, self.node1_path,
                                         "sysparam-node-config")[0]
         self.site_pp = 'site.pp'
+        self.ssh_pool = SSHSessionPool(self)
+        self.plan_models = PlanModelCache(self.cli)
 
     def tearDown(self):
         """ Runs after every single test """
+        self.ssh_pool.close()
         super(Story8260, self).tearDown()
 
     def _check_backed_up_manifests_permissions(self):
@@ -48,20 +55,16 @@ class Story8260(GenericTest):
             readable form of each of the puppet manifests
             in the back-up puppet manifest directory
         """
-        dir_contents = self.list_dir_contents(self.ms_node,
-                                              const.PUPPET_FAILED_DIR)
-
-        # For each of the puppet manifest files listed in the
-        # directory, and using the stat command, find the
-        # access rights in human readable form for each file
-        for pfile in dir_contents:
-            cmd = '{0} -c %A {1}/{2}'. \
-                format(const.STAT_PATH,
-                       const.PUPPET_FAILED_DIR,
-                       pfile)
-            stdout, _, _ = self.run_command(self.ms_node, cmd, su_root=True,
-                default_asserts=True)
-            self.assertTrue(self.is_text_in_list(self.expect_access, stdout))
+        # The access rights in human readable form of every puppet manifest
+        # in the back-up directory are read with a single remote call
+        stats = get_dir_file_stats(self.ssh_pool,
+                                   self.ms_node,
+                                   const.PUPPET_FAILED_DIR,
+                                   digest=False)
+        self.assertTrue(stats, 'No backed up manifest in {0}'
+                        .format(const.PUPPET_FAILED_DIR))
+        for stat in stats.values():
+            self.assertEqual(self.expect_access, stat.access)
 
     def _find_all_specific_tasks_in_plan(self, stdout, description, node_path):
         """
@@ -75,15 +78,8 @@ class Story8260(GenericTest):
             matching_tasks (list): The tasks that match the description and
                 node
         """
-        matching_tasks = []
-        plan_d = self.cli.parse_plan_output(stdout)
-        for phase in plan_d.keys():
-            for task in plan_d[phase].keys():
-                # Only find matching tasks
-                desc = plan_d[phase][task]['DESC']
-                if description in desc and node_path in desc:
-                    matching_tasks.append(plan_d[phase][task])
-        return matching_tasks
+        return self.plan_models.from_output(stdout).find_tasks_with_lines(
+                                                        description, node_path)
 
     def _get_checksums(self, folder):
         """
@@ -96,17 +92,10 @@ class Story8260(GenericTest):
         Return:
             list, The checksum of the content of each file in dir
         """
-        if not folder.endswith('/'):
-            folder += '/'
-        files = self.list_dir_contents(self.ms_node, folder)
-        md5 = {}
-        for filename in files:
-            file_path = '{0}{1}'.format(folder, filename)
-            cmd = self.redhatutils.get_md5sum_cmd('', file_path)
-            out = self.run_command(self.ms_node, cmd, default_asserts=True,
-                su_root=True)[0]
-            md5[filename] = (out[0].split(' '))[0]
-        return md5
+        # Stat and checksum of every file are collected in a single call
+        stats = get_dir_file_stats(self.ssh_pool, self.ms_node, folder)
+        return dict((os.path.basename(path), stat.digest)
+                    for path, stat in stats.items())
 
     @attr('all', 'revert', 'story8260', 'story8260_tc01')
     def test_01_p_manifest_backup_config_task_fail(self):
@@ -322,7 +311,8 @@ class Story8260(GenericTest):
 
             # Assert that there are 2 unlock tasks in the plan
             stdout = self.execute_cli_showplan_cmd(self.ms_node)[0]
-            first_unlock_task = self.cli.parse_plan_output(stdout)[1][1]
+            first_unlock_task = \
+                self.plan_models.from_output(stdout).first_task()
             matching_unlock_tasks = \
                 self._find_all_specific_tasks_in_plan(
                                                 stdout,
@@ -0,0 +1,260 @@
+"""
+COPYRIGHT Ericsson 2026
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     October 2026
+@author:    LITP Core Testware
+@summary:   LITP state backup and verification benchmark.
+            The LITP DB is grown to an upgrade sized model, then backed up
+            with litp_state_backup.sh and checked with "gzip -t", and with
+            the streaming backup, checked against its checksum manifest.
+            The time taken and the bytes read by each backup and check are
+            recorded, as well as the cost of frequent incremental backups.
+"""
+from litp_generic_test import GenericTest, attr
+from bulk_model_builder import BulkModelBuilder
+from stream_backup import StreamBackup
+import test_constants as const
+import json
+import os
+import tempfile
+
+NUM_PACKAGES = 20000
+PACKAGE_URL = '/software/items/stream_bkp_{0:05d}'
+PIGZ_THREADS = 4
+NUM_DELTAS = 5
+PACKAGES_PER_DELTA = 10
+DELTA_BUDGET_BYTES = 5 * 1024 * 1024
+
+
+class StreamBackupBenchmark(GenericTest):
+    """
+    Time and bytes read of the LITP state backups and their verification
+    """
+
+    def setUp(self):
+        """ Runs before every single test """
+        super(StreamBackupBenchmark, self).setUp()
+        self.ms1 = self.get_management_node_filename()
+        self.backup_dir = '/tmp/litp_stream_archives/'
+        self.model_builder = BulkModelBuilder(self, self.ms1)
+        self.stream_backup = StreamBackup(self, self.ms1)
+        self.results_dir = tempfile.gettempdir()
+        self.restore_dir = '/tmp/litp_stream_restore'
+        self.create_dir_on_node(self.ms1, self.backup_dir, su_root=True,
+                                add_to_cleanup=False)
+
+    def tearDown(self):
+        """ Runs after every single test """
+        self.model_builder.cleanup()
+        self.stream_backup.cleanup()
+        self.remove_item(self.ms1, self.backup_dir, su_root=True)
+        self.remove_item(self.ms1, self.restore_dir, su_root=True)
+        super(StreamBackupBenchmark, self).tearDown()
+
+    def _populate(self):
+        """ Grow the LITP DB by NUM_PACKAGES package items """
+        for index in range(NUM_PACKAGES):
+            self.model_builder.add_create(
+                PACKAGE_URL.format(index), 'package',
+                {'name': 'stream-bkp-{0:05d}'.format(index)})
+        self.model_builder.apply()
+
+    def _get_db_size(self):
+        """ Return the size in bytes of the LITP DB """
+        cmd = "{0} - postgres -c \"{1} -h ms1 -At -c " \
+              "\\\"SELECT pg_database_size('litp')\\\"\"" \
+              .format(const.SU_PATH, const.PSQL_PATH)
+        return int(self.run_command(self.ms1, cmd, su_root=True,
+                                    default_asserts=True)[0][-1])
+
+    def _get_file_size(self, path):
+        """ Return the size in bytes of a file on the MS """
+        cmd = '/usr/bin/stat -c %s {0}'.format(path)
+        return int(self.run_command(self.ms1, cmd, su_root=True,
+                                    default_asserts=True)[0][-1])
+
+    def _measure_backup_script(self):
+        """
+        Description:
+            Back up with litp_state_backup.sh and check the archive with
+            "gzip -t", from a cold page cache
+        Return:
+            dict, The measurements of the backup and of the check
+        """
+        lines, backup, rcode = self.stream_backup.measure(
+            '{0} {1}'.format(const.LITP_BACKUP_SCRIPT, self.backup_dir),
+            drop_caches=True)
+        self.assertEqual(0, rcode, 'litp_state_backup.sh failed')
+        archive = lines[-1].split()[-1]
+        _, verify, rcode = self.stream_backup.measure(
+            '{0} -t {1}'.format(const.GZIP_PATH, archive),
+            drop_caches=True)
+        self.assertEqual(0, rcode, 'The file {0} is corrupted!'
+                         .format(archive))
+        return self._result('litp_state_backup.sh, gzip -t',
+                            self._get_file_size(archive), backup, verify)
+
+    def _measure_stream_backup(self, name, threads, quick):
+        """
+        Description:
+            Take a streaming backup and verify it, from a cold page cache
+        Args:
+            name (str): The name of the measurement
+            threads (int): The pigz compression threads, 1 for zlib
+            quick (bool): Only check the digest of the compressed archive
+        Return:
+            dict, The measurements of the backup and of the verification
+        """
+        backup = self.stream_backup.backup(self.backup_dir, threads,
+                                           drop_caches=True)
+        verify = self.stream_backup.verify(backup['archive'], quick=quick,
+                                           drop_caches=True)
+        self.assertTrue(verify['valid'], 'The file {0} is corrupted: {1}'
+                        .format(backup['archive'], verify['errors']))
+        # The verification reads every byte of the archive exactly once
+        self.assertEqual(backup['bytes_written'], verify['bytes_read'])
+        result = self._result(name, backup['bytes_written'], backup, verify)
+        result['compressor'] = backup['compressor']
+        return result
+
+    @staticmethod
+    def _result(name, archive_bytes, backup, verify):
+        """ Return the row of the results table of a backup """
+        return {'name': name,
+                'archive_bytes': archive_bytes,
+                'backup_seconds': backup['seconds'],
+                'backup_rchar': backup['rchar'],
+                'backup_read_bytes': backup['read_bytes'],
+                'verify_seconds': verify['seconds'],
+                'verify_rchar': verify['rchar'],
+                'verify_read_bytes': verify['read_bytes']}
+
+    @attr('manual-test', 'revert', 'story315425',
+          'story315425_stream_backup_tc01')
+    def test_01_p_stream_backup_benchmark(self):
+        """
+        @tms_id: torf_315425_stream_backup_tc01
+        @tms_requirements_id: TORF-107258
+        @tms_title: Benchmark the LITP state backups and their verification
+        @tms_description: Grows the LITP DB by 20000 package items, then
+         measures the time taken and the bytes read by
+         litp_state_backup.sh followed by "gzip -t", and by the streaming
+         backup followed by a full and a quick checksum verification, with
+         zlib and with pigz compression
+        @tms_test_steps:
+         @step: create 20000 package items
+         @result: the items are created
+         @step: back up with litp_state_backup.sh and check the archive
+                with gzip -t
+         @result: the archive is valid
+         @step: take streaming backups and verify them against their
+                checksum manifest and digest file
+         @result: the archives are valid and the verification reads each
+                  archive once
+         @result: the measurements are logged and saved to
+                  stream_backup_benchmark_results.json in the temporary
+                  directory
+        @tms_test_precondition: NA
+        @tms_execution_type: Automated
+        """
+        self._populate()
+        db_size = self._get_db_size()
+        self.log('info', 'LITP DB size: {0} bytes'.format(db_size))
+
+        results = [
+            self._measure_backup_script(),
+            self._measure_stream_backup('stream zlib, full verify', 1,
+                                        False),
+            self._measure_stream_backup('stream zlib, quick verify', 1,
+                                        True),
+            self._measure_stream_backup(
+                'stream pigz -p {0}, full verify'.format(PIGZ_THREADS),
+                PIGZ_THREADS, False),
+        ]
+
+        self.log('info', 'archive_bytes backup_seconds backup_rchar '
+                 'backup_read_bytes verify_seconds verify_rchar '
+                 'verify_read_bytes name')
+        for result in results:
+            self.log('info', '{archive_bytes:>13} {backup_seconds:>14.2f} '
+                     '{backup_rchar:>12} {backup_read_bytes:>17} '
+                     '{verify_seconds:>14.2f} {verify_rchar:>12} '
+                     '{verify_read_bytes:>17} {name}'.format(**result))
+        results_path = os.path.join(self.results_dir,
+                                    'stream_backup_benchmark_results.json')
+        with open(results_path, 'w') as results_file:
+            json.dump({'db_size': db_size, 'results': results},
+                      results_file, indent=4, sort_keys=True)
+        self.log('info', 'results saved to {0}'.format(results_path))
+
+    @attr('manual-test', 'revert', 'story315425',
+          'story315425_stream_backup_tc02')
+    def test_02_p_incremental_backup_benchmark(self):
+        """
+        @tms_id: torf_315425_stream_backup_tc02
+        @tms_requirements_id: TORF-107258
+        @tms_title: Benchmark frequent incremental LITP state backups
+        @tms_description: Grows the LITP DB by 20000 package items, takes
+         a base incremental backup and then a delta after each of 5 small
+         model changes, and restores the chain of the last delta
+        @tms_test_steps:
+         @step: create 20000 package items and take an incremental backup
+         @result: a base backup is created
+         @step: 5 times, update 10 package items and take an incremental
+                backup
+         @result: every backup is a delta of the previous one and is
+                  smaller than 5 MB
+         @step: restore the last delta
+         @result: the chain of the 6 backups is restored
+         @result: the measurements are logged and saved to
+                  stream_backup_incremental_results.json in the temporary
+                  directory
+        @tms_test_precondition: NA
+        @tms_execution_type: Automated
+        """
+        self._populate()
+        base = self.stream_backup.backup(self.backup_dir, incremental=True)
+        self.assertEqual('base', base['type'])
+        backups = [base]
+
+        for delta in range(NUM_DELTAS):
+            for index in range(PACKAGES_PER_DELTA):
+                self.execute_cli_update_cmd(
+                    self.ms1,
+                    PACKAGE_URL.format(delta * PACKAGES_PER_DELTA + index),
+                    'version=1.{0}'.format(delta))
+            result = self.stream_backup.backup(self.backup_dir,
+                                               incremental=True)
+            self.assertEqual('delta', result['type'],
+                             'No delta: {0}'.format(result['reason']))
+            self.assertEqual(backups[-1]['archive'].split('/')[-1],
+                             result['parent'])
+            self.assertTrue(result['bytes_written'] < DELTA_BUDGET_BYTES,
+                            'Delta of {0} bytes'.format(
+                                result['bytes_written']))
+            backups.append(result)
+
+        restore = self.stream_backup.restore(backups[-1]['archive'],
+                                             self.restore_dir)
+        self.assertTrue(restore['valid'], 'The restore of {0} failed: {1}'
+                        .format(backups[-1]['archive'], restore['errors']))
+        self.assertEqual(len(backups), len(restore['chain']))
+
+        self.log('info', 'type length bytes_written seconds rchar')
+        for result in backups:
+            self.log('info', '{type:>5} {length:>6} {bytes_written:>13} '
+                     '{seconds:>7.2f} {rchar:>12}'.format(**result))
+        self.log('info', 'restore of {0} archives: {1:.2f}s, {2} bytes '
+                 'read'.format(len(restore['chain']), restore['seconds'],
+                               restore['rchar']))
+        results_path = os.path.join(self.results_dir,
+                                    'stream_backup_incremental_results.json')
+        with open(results_path, 'w') as results_file:
+            json.dump({'backups': backups, 'restore': restore},
+                      results_file, indent=4, sort_keys=True)
+        self.log('info', 'results saved to {0}'.format(results_path))
@@ -0,0 +1,49 @@
+##############################################################################
+# COPYRIGHT Ericsson AB 2026
+#
+# The copyright to the computer program(s) herein is the property of
+# Ericsson AB. The programs may be used and/or copied only with written
+# permission from Ericsson AB. or in accordance with the terms and
+# conditions stipulated in the agreement/contract under which the
+# program(s) have been supplied.
+##############################################################################
+'''Unique property values for plugin updatable property tests'''
+import itertools
+import os
+import time
+
+
+class UniqueValueSource(object):
+    """
+    Issues property values that are never issued twice, in constant time
+    and memory.
+
+    A value is a prefix made of a time in microseconds and the process id,
+    followed by a counter. The prefix is taken again whenever the process
+    id changes, as the Celery workers are forked after the plugin is
+    imported, so that every worker process starts its own sequence. The
+    counter keeps the values unique within a process.
+    """
+
+    def __init__(self, prefix=''):
+        """
+        Args:
+            prefix (str): Text the values start with
+        """
+        self._base = prefix
+        self._pid = None
+        self._prefix = None
+        self._counter = None
+
+    def next_value(self):
+        """
+        Return:
+            str, A value different from every value issued before
+        """
+        pid = os.getpid()
+        if pid != self._pid:
+            self._pid = pid
+            self._prefix = '{0}{1:x}.{2}.'.format(
+                self._base, int(time.time() * 1000000), pid)
+            self._counter = itertools.count(1)
+        return '{0}{1}'.format(self._prefix, next(self._counter))